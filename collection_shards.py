@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collection Parçalama
+Büyük bir Postman collection'ını domain'e (ya da domain + ilk path
+segmentine) göre ayrı collection dosyalarına böler. Request'ler
+üretildikçe parça başına bir StreamingCollectionWriter'a yönlendirilir;
+collection'ın tamamı hiçbir zaman bellekte tutulmaz. Çevirme worker
+process'lerde yapılıyorsa request'ler orada serialize edilip
+(SerializedRequest) yazıcılara hazır metin olarak gelir. Parçalar bir index
+manifest'inde listelenir; her parça Postman'e ayrı ayrı import edilebilir.
+"""
+
+import json
+import os
+import re
+import uuid
+
+from collection_writer import DEFAULT_BUFFER_LIMIT, SerializedRequest, StreamingCollectionWriter
+
+SHARD_MODES = ('domain', 'path')
+
+SHARD_MANIFEST_NAME = 'index.json'
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def _first_segment(postman_request):
+    """Request URL'sinin ilk path segmenti; path yoksa boş string"""
+    if isinstance(postman_request, SerializedRequest):
+        segments = postman_request.path
+    else:
+        segments = postman_request.get("request", {}).get("url", {}).get("path") or []
+    return segments[0] if segments else ''
+
+
+def shard_key(domain: str, postman_request: dict, by: str = 'domain'):
+    """Request'in parça anahtarını (key, segment) olarak döndürür"""
+    segment = _first_segment(postman_request) if by == 'path' else None
+    return (f"{domain}/{segment}" if segment else domain), segment
+
+
+def split_collection(collection: dict, by: str = 'domain'):
+    """Collection'ı parçalara ayırır
+
+    by='domain' her domain klasörünü ayrı parça yapar; by='path' her domain'i
+    ilk path segmentine göre de böler. Parçalar ilk görülme sırasıyla
+    (key, domain, segment, requests) olarak döner.
+    """
+    if by not in SHARD_MODES:
+        raise ValueError(f"Bilinmeyen parçalama modu: {by}")
+
+    shards = {}
+    for folder in collection.get("item", []):
+        domain = folder.get("name", "")
+        for postman_request in folder.get("item", []):
+            key, segment = shard_key(domain, postman_request, by)
+            if key not in shards:
+                shards[key] = (key, domain, segment, [])
+            shards[key][3].append(postman_request)
+    return list(shards.values())
+
+
+def shard_filename(key: str, used: set):
+    """Parça anahtarından dosya sistemi için güvenli, benzersiz bir dosya adı üretir"""
+    base = _UNSAFE_FILENAME_CHARS.sub('_', key).strip('._') or 'root'
+    name = f"{base}.postman_collection.json"
+    counter = 2
+    while name.lower() in used:
+        name = f"{base}_{counter}.postman_collection.json"
+        counter += 1
+    used.add(name.lower())
+    return name
+
+
+class ShardWriter:
+    """(domain, request) çiftlerini parça dosyalarına akış halinde yazan yazıcı
+
+    Her parça anahtarı için bir StreamingCollectionWriter açılır. Yazıcılar
+    buffer_limit'i ortak bir bütçe olarak paylaşır: tamponların toplamı
+    sınırı aşınca hepsi spill dosyalarına boşaltılır, böylece parça sayısı
+    bellek kullanımını artırmaz. close() parçaları ve manifest'i yazar;
+    manifest'te parçalar domain'lerin, domain içinde de segmentlerin ilk
+    görülme sırasıyla listelenir (split_collection ile aynı sıra).
+    """
+
+    def __init__(self, output_dir: str, info: dict, by: str = 'domain',
+                 buffer_limit: int = DEFAULT_BUFFER_LIMIT, compact: bool = False):
+        if by not in SHARD_MODES:
+            raise ValueError(f"Bilinmeyen parçalama modu: {by}")
+        self.output_dir = output_dir
+        self.info = info
+        self.by = by
+        self.buffer_limit = buffer_limit
+        self.compact = compact
+        self.request_count = 0
+        self.manifest = None
+        self._shards = {}
+        self._domain_order = {}
+        self._used_names = {SHARD_MANIFEST_NAME}
+        self._buffered_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            for shard in self._shards.values():
+                shard["writer"].__exit__(exc_type, exc, tb)
+            self._shards = {}
+        return False
+
+    def add(self, domain: str, postman_request: dict):
+        """Request'i parçasının yazıcısına ekler"""
+        key, segment = shard_key(domain, postman_request, self.by)
+        shard = self._shards.get(key)
+        if shard is None:
+            shard = self._open(key, domain, segment)
+
+        writer = shard["writer"]
+        before = writer.buffered_bytes
+        writer.add(domain, postman_request)
+        self._buffered_bytes += writer.buffered_bytes - before
+        self.request_count += 1
+
+        if self._buffered_bytes > self.buffer_limit:
+            for other in self._shards.values():
+                other["writer"].spill()
+            self._buffered_bytes = 0
+
+    def _open(self, key: str, domain: str, segment):
+        os.makedirs(self.output_dir, exist_ok=True)
+        filename = shard_filename(key, self._used_names)
+        # Her parça Postman'de ayrı bir collection olarak görünmeli
+        base_name = self.info.get("name", "HAR Import")
+        shard_info = dict(self.info, name=f"{base_name} - {key}", _postman_id=str(uuid.uuid4()))
+        self._domain_order.setdefault(domain, len(self._domain_order))
+        shard = {
+            "key": key,
+            "domain": domain,
+            "segment": segment,
+            "file": filename,
+            # Yazıcının kendi sınırı hiç dolmaz; spill kararını ortak bütçe verir
+            "writer": StreamingCollectionWriter(os.path.join(self.output_dir, filename), shard_info,
+                                                buffer_limit=self.buffer_limit + 1, compact=self.compact)
+        }
+        self._shards[key] = shard
+        return shard
+
+    def close(self):
+        """Parçaları ve manifest'i yazar
+
+        Returns:
+            Manifest sözlüğü (output_dir/index.json'a da yazılır)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        shards = sorted(self._shards.values(), key=lambda shard: self._domain_order[shard["domain"]])
+        records = []
+        for shard in shards:
+            writer = shard.pop("writer")
+            requests = writer.close()
+            records.append(dict(shard, requests=requests,
+                                bytes=os.path.getsize(os.path.join(self.output_dir, shard["file"]))))
+        self._shards = {}
+
+        self.manifest = {
+            "info": self.info,
+            "split_by": self.by,
+            "request_count": self.request_count,
+            "shards": records
+        }
+        with open(os.path.join(self.output_dir, SHARD_MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        return self.manifest
+
+
+def write_shards(collection: dict, output_dir: str, by: str = 'domain', compact: bool = False):
+    """Bellekteki bir collection'ı parçalara bölüp output_dir'e yazar ve manifest'i oluşturur
+
+    Returns:
+        Manifest sözlüğü (output_dir/index.json'a da yazılır)
+    """
+    with ShardWriter(output_dir, collection.get("info", {}), by, compact=compact) as writer:
+        for folder in collection.get("item", []):
+            for postman_request in folder.get("item", []):
+                writer.add(folder.get("name", ""), postman_request)
+    return writer.manifest
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collection Gezinme
+Postman collection ağacını recursion kullanmadan, açık bir stack ile gezen
+generator'lar. Çok derin iç içe folder'lar Python'un recursion limitine
+takılmaz; çağıran taraf istediği anda durabilir ve sonuçları liste
+kurmadan akış halinde işleyebilir.
+
+Her adımda (path, parent, index, item) döner:
+    path    item'ı içeren folder isimleri (tuple, kökte boş)
+    parent  item'ın bulunduğu liste (parent[index] is item)
+    index   item'ın parent içindeki sırası
+    item    folder ya da request item'ı
+
+Gezinti ağaç sırasıyla (pre-order) yapılır. Gezinti sürerken item
+eklemek / silmek index'leri kaydırır; silinecek item'lar önce toplanıp
+gezinti bittikten sonra silinmelidir. Dönen item'ı yerinde değiştirmek
+(header eklemek, URL'yi değiştirmek...) güvenlidir.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+WalkStep = Tuple[Tuple[str, ...], List[Dict], int, Dict]
+
+
+def iter_items(items: List[Dict]) -> Iterator[WalkStep]:
+    """Folder'lar dahil tüm item'ları gezer; folder içeriğinden önce folder'ın kendisi döner"""
+    stack = [((), items, 0)]
+    while stack:
+        path, parent, start = stack.pop()
+        for index in range(start, len(parent)):
+            item = parent[index]
+            yield path, parent, index, item
+            if 'request' not in item and 'item' in item:
+                # Kalan kardeşlere folder'ın içeriğinden sonra devam et
+                stack.append((path, parent, index + 1))
+                stack.append((path + (item.get('name', ''),), item['item'], 0))
+                break
+
+
+def iter_requests(items: List[Dict]) -> Iterator[WalkStep]:
+    """Sadece request item'larını gezer"""
+    stack = [((), items, 0)]
+    while stack:
+        path, parent, start = stack.pop()
+        for index in range(start, len(parent)):
+            item = parent[index]
+            if 'request' in item:
+                yield path, parent, index, item
+            elif 'item' in item:
+                stack.append((path, parent, index + 1))
+                stack.append((path + (item.get('name', ''),), item['item'], 0))
+                break
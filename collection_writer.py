@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming Collection Yazıcı
+Postman collection'ını tamamını bellekte tutmadan diske yazar. Çıktı
+json_codec.dumps(collection) (compact=True verilirse
+json_codec.dumps(collection, compact=True)) ile byte byte aynıdır.
+Düzen bilindiği için yazılmış bir collection'a parse etmeden request
+eklenebilir (bkz. append_to_collection).
+"""
+
+import os
+import shutil
+import tempfile
+
+import json_codec
+from compressed_io import compression_from_suffix, open_text
+from profiling import profiled, stage
+
+DEFAULT_BUFFER_LIMIT = 32 * 1024 * 1024
+
+# Dosya içinde byte kaydırırken tek seferde kopyalanan miktar
+_COPY_BLOCK_SIZE = 1024 * 1024
+
+# Domain klasörü içindeki request'lerin girinti seviyesi (collection > item > folder > item)
+_ITEM_INDENT = ' ' * 8
+
+# Collection iskeletinin girintili ve compact yazımı
+_PRETTY_LAYOUT = {
+    "head": '{\n  "info": ', "items": ',\n  "item": ', "empty": '[]\n}', "open": '[\n', "separator": ',\n',
+    "folder": '    {\n      "name": ', "folder_items": ',\n      "item": [\n', "folder_end": '\n      ]\n    }',
+    "end": '\n  ]\n}'
+}
+_COMPACT_LAYOUT = {
+    "head": '{"info":', "items": ',"item":', "empty": '[]}', "open": '[', "separator": ',',
+    "folder": '{"name":', "folder_items": ',"item":[', "folder_end": ']}', "end": ']}'
+}
+
+
+def _dumps(obj, indent_prefix: str = '', compact: bool = False):
+    """Objeyi serialize eder, girintili yazımda alt satırları verilen girinti kadar kaydırır"""
+    text = json_codec.dumps(obj, compact)
+    if indent_prefix and not compact:
+        text = text.replace('\n', '\n' + indent_prefix)
+    return text
+
+
+def _item_text(postman_request: dict, compact: bool = False):
+    """Request'i domain klasörü içindeki girintisiyle serialize eder"""
+    if compact:
+        return _dumps(postman_request, compact=True)
+    return _ITEM_INDENT + _dumps(postman_request, _ITEM_INDENT)
+
+
+class SerializedRequest:
+    """Yazıcının item biçiminde önceden serialize edilmiş request
+
+    Worker process'lerde üretilir; yazıcı metni olduğu gibi yazar. path,
+    parçalama için request URL'sinin path segmentleridir.
+    """
+
+    __slots__ = ('text', 'compact', 'path')
+
+    def __init__(self, text: str, compact: bool, path: list):
+        self.text = text
+        self.compact = compact
+        self.path = path
+
+
+def serialize_request(postman_request: dict, compact: bool = False):
+    """Request'i StreamingCollectionWriter.add'in yazacağı metne çevirir"""
+    url = postman_request.get("request", {}).get("url")
+    path = (url.get("path") or []) if isinstance(url, dict) else []
+    return SerializedRequest(_item_text(postman_request, compact), compact, path)
+
+
+class StreamingCollectionWriter:
+    """Domain klasörlerini ve request'leri üretildikçe diske aktaran yazıcı
+
+    Request'ler domain bazında serialize edilip bellekte tamponlanır; toplam
+    tampon buffer_limit'i aşınca domain başına geçici spill dosyalarına
+    boşaltılır. close() çağrıldığında domain'ler ilk görülme sırasıyla çıktı
+    dosyasına birleştirilir. Çıktı sıkıştırılmıyorsa close() her domain
+    klasörünün kapanışının byte offset'ini folder_tails'e kaydeder.
+    """
+
+    def __init__(self, output_path: str, info: dict, buffer_limit: int = DEFAULT_BUFFER_LIMIT,
+                 compact: bool = False):
+        self.output_path = output_path
+        self.info = info
+        self.buffer_limit = buffer_limit
+        self.compact = compact
+        self._layout = _COMPACT_LAYOUT if compact else _PRETTY_LAYOUT
+        self.request_count = 0
+        self.domain_count = 0
+        self.folder_tails = None
+        self._domains = {}
+        self._buffered_bytes = 0
+        self._spill_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._cleanup()
+        return False
+
+    def add(self, domain: str, postman_request: dict):
+        """Request'i domain klasörüne ekler; SerializedRequest ise metni aynen yazılır"""
+        if domain not in self._domains:
+            self._domains[domain] = {"chunks": [], "spill": None}
+            self.domain_count += 1
+        state = self._domains[domain]
+
+        if isinstance(postman_request, SerializedRequest):
+            if postman_request.compact != self.compact:
+                raise ValueError("Request yazıcıdan farklı bir düzende serialize edilmiş")
+            text = postman_request.text
+        else:
+            text = _item_text(postman_request, self.compact)
+        state["chunks"].append(text)
+        self.request_count += 1
+        self._buffered_bytes += len(text)
+
+        if self._buffered_bytes > self.buffer_limit:
+            self._spill()
+
+    @property
+    def buffered_bytes(self):
+        """Bellekte tamponlanmış, henüz spill dosyasına yazılmamış byte sayısı"""
+        return self._buffered_bytes
+
+    def spill(self):
+        """Tamponları buffer_limit'i beklemeden spill dosyalarına boşaltır
+
+        Birden fazla yazıcı ortak bir bellek bütçesini paylaşırken kullanılır
+        (bkz. collection_shards.ShardWriter).
+        """
+        if self._buffered_bytes:
+            self._spill()
+
+    @profiled('spill')
+    def _spill(self):
+        """Bellekteki tüm domain tamponlarını spill dosyalarına yazar"""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='har_collection_')
+
+        for index, state in enumerate(self._domains.values()):
+            if not state["chunks"]:
+                continue
+            if state["spill"] is None:
+                state["spill"] = os.path.join(self._spill_dir, f"domain_{index}.part")
+                separator = ''
+            else:
+                separator = self._layout["separator"]
+            with open(state["spill"], 'a', encoding='utf-8') as f:
+                f.write(separator + self._layout["separator"].join(state["chunks"]))
+            state["chunks"] = []
+
+        self._buffered_bytes = 0
+
+    def close(self):
+        """Collection'ı çıktı dosyasına yazar ve geçici dosyaları temizler"""
+        try:
+            layout = self._layout
+            separator = layout["separator"]
+            tails = {} if compression_from_suffix(self.output_path) is None else None
+            with stage('write'), open_text(self.output_path, 'w') as out:
+                out.write(layout["head"] + _dumps(self.info, '  ', self.compact) + layout["items"])
+                if not self._domains:
+                    out.write(layout["empty"])
+                    self.folder_tails = tails
+                    return self.request_count
+
+                out.write(layout["open"])
+                for position, (domain, state) in enumerate(self._domains.items()):
+                    if position:
+                        out.write(separator)
+                    out.write(layout["folder"] + _dumps(domain, compact=self.compact) + layout["folder_items"])
+                    if state["spill"] is not None:
+                        with open(state["spill"], 'r', encoding='utf-8') as spill:
+                            shutil.copyfileobj(spill, out)
+                        if state["chunks"]:
+                            out.write(separator)
+                    out.write(separator.join(state["chunks"]))
+                    if tails is not None:
+                        tails[domain] = out.tell()
+                    out.write(layout["folder_end"])
+                out.write(layout["end"])
+            self.folder_tails = tails
+            return self.request_count
+        finally:
+            self._cleanup()
+
+    def _cleanup(self):
+        self._domains = {}
+        self._buffered_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+
+def _copy_bytes(source, target, size: int):
+    """source'tan target'a tam olarak size byte kopyalar"""
+    while size > 0:
+        block = source.read(min(_COPY_BLOCK_SIZE, size))
+        if not block:
+            raise ValueError("Collection dosyası beklenenden kısa")
+        target.write(block)
+        size -= len(block)
+
+
+def has_collection_layout(output_path: str, folder_tails: dict, compact: bool = False, size: int = None):
+    """Dosyanın folder_tails'i kaydeden yazımdan bu yana değişmediğini hızlıca doğrular
+
+    Boyut (verildiyse), her klasör kapanışı ve collection sonu beklenen
+    byte'larla eşleşmelidir; dosya parse edilmez.
+    """
+    layout = _COMPACT_LAYOUT if compact else _PRETTY_LAYOUT
+    if compression_from_suffix(output_path) is not None or not os.path.exists(output_path):
+        return False
+    actual_size = os.path.getsize(output_path)
+    if size is not None and actual_size != size:
+        return False
+    end = (layout["end"] if folder_tails else layout["empty"]).encode('utf-8')
+    folder_end = layout["folder_end"].encode('utf-8')
+    with open(output_path, 'rb') as f:
+        f.seek(max(actual_size - len(end), 0))
+        if f.read() != end:
+            return False
+        for offset in folder_tails.values():
+            f.seek(offset)
+            if f.read(len(folder_end)) != folder_end:
+                return False
+    return True
+
+
+@profiled('append')
+def append_to_collection(output_path: str, folder_tails: dict, requests, compact: bool = False):
+    """(domain, request) çiftlerini StreamingCollectionWriter'ın yazdığı collection'a ekler
+
+    Dosya parse edilip yeniden yazılmaz: request'ler domain klasörlerinin
+    kapanış offset'lerine (folder_tails), yeni domain'ler collection'ın
+    sonuna eklenir. Sadece ilk ekleme noktasından sonraki byte'lar kaydırılır;
+    kaydırılan kısım bellek yerine geçici dosya üzerinden kopyalanır. Yeni
+    request'ler yazılana kadar serialize edilmiş halde bellekte tutulur.
+    Dosyanın düzeni önceden has_collection_layout ile doğrulanmalıdır.
+
+    Returns:
+        (eklenen request sayısı, güncellenmiş folder_tails)
+    """
+    layout = _COMPACT_LAYOUT if compact else _PRETTY_LAYOUT
+    separator = layout["separator"]
+
+    additions = {}
+    added = 0
+    for domain, postman_request in requests:
+        additions.setdefault(domain, []).append(_item_text(postman_request, compact))
+        added += 1
+    if not added:
+        return 0, dict(folder_tails)
+
+    inserts = sorted((folder_tails[domain], (separator + separator.join(texts)).encode('utf-8'))
+                     for domain, texts in additions.items() if domain in folder_tails)
+    new_folders = [(domain, texts) for domain, texts in additions.items() if domain not in folder_tails]
+
+    # Yeni klasörler kapanıştan (ya da boş item listesinden) önce yazılır
+    closing = (layout["end"] if folder_tails else layout["empty"]).encode('utf-8')
+    end_offset = os.path.getsize(output_path) - len(closing)
+    start = inserts[0][0] if inserts else end_offset
+
+    tails = {}
+    with stage('write'), open(output_path, 'r+b') as f, \
+            tempfile.SpooledTemporaryFile(max_size=DEFAULT_BUFFER_LIMIT) as rest:
+        f.seek(start)
+        shutil.copyfileobj(f, rest, _COPY_BLOCK_SIZE)
+        rest.seek(0)
+        f.seek(start)
+
+        position = start
+        shift = 0
+        shifts = []
+        for offset, data in inserts:
+            _copy_bytes(rest, f, offset - position)
+            position = offset
+            f.write(data)
+            shift += len(data)
+            shifts.append((offset, shift))
+        _copy_bytes(rest, f, end_offset - position)
+
+        for index, (domain, texts) in enumerate(new_folders):
+            lead = separator if folder_tails or index else layout["open"]
+            f.write((lead + layout["folder"] + _dumps(domain, compact=compact) + layout["folder_items"] +
+                     separator.join(texts)).encode('utf-8'))
+            tails[domain] = f.tell()
+            f.write(layout["folder_end"].encode('utf-8'))
+        f.write(layout["end"].encode('utf-8'))
+        f.truncate()
+
+    updated = {}
+    for domain, offset in folder_tails.items():
+        # Klasör, kendi eklemesi dahil offset'ine kadar yapılan eklemeler kadar kayar
+        updated[domain] = offset + max((cumulative for insert_offset, cumulative in shifts
+                                        if insert_offset <= offset), default=0)
+    updated.update(tails)
+    return added, updated
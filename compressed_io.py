@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sıkıştırılmış Dosya Okuma / Yazma
+HAR ve collection dosyalarını gzip ya da zstd ile sıkıştırılmış olsalar da
+diske açmadan akış halinde okur ve yazar. Okurken sıkıştırma dosyanın ilk
+byte'larından (magic bytes), yazarken dosya uzantısından (.gz, .zst)
+belirlenir. zstd desteği isteğe bağlı 'zstandard' paketini gerektirir.
+"""
+
+import gzip
+import io
+import os
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+DEFAULT_GZIP_LEVEL = 6
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def _zstandard():
+    """zstandard modülünü yükler; yoksa ne yapılacağını söyleyen bir hata verir"""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd sıkıştırılmış dosyalar için 'zstandard' paketi gerekli: "
+                          "pip install zstandard") from None
+    return zstandard
+
+
+def detect_compression(path: str):
+    """Dosyanın sıkıştırma türünü ilk byte'larından bulur: 'gzip', 'zstd' ya da None"""
+    with open(path, 'rb') as f:
+        magic = f.read(len(ZSTD_MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if magic == ZSTD_MAGIC:
+        return 'zstd'
+    return None
+
+
+def compression_from_suffix(path: str):
+    """Çıktı dosyasının uzantısına göre sıkıştırma türü: 'gzip', 'zstd' ya da None"""
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1].lower())
+
+
+def strip_compression_suffix(path: str):
+    """'capture.har.gz' -> 'capture.har'; sıkıştırma uzantısı yoksa yolu aynen döndürür"""
+    root, suffix = os.path.splitext(path)
+    return root if suffix.lower() in COMPRESSION_SUFFIXES else path
+
+
+def open_binary(path: str, mode: str = 'rb'):
+    """Dosyayı binary açar; gerekirse akış halinde açar / sıkıştırır
+
+    Okumada sıkıştırma içerikten, yazmada uzantıdan belirlenir. Dönen
+    nesne seek ile ileri atlamayı destekler (sıkıştırılmış dosyalarda bu
+    aradaki verinin açılmasıyla yapılır).
+    """
+    if mode not in ('rb', 'wb'):
+        raise ValueError(f"Desteklenmeyen mod: {mode}")
+
+    compression = detect_compression(path) if mode == 'rb' else compression_from_suffix(path)
+    if compression == 'gzip':
+        return gzip.open(path, mode, compresslevel=DEFAULT_GZIP_LEVEL)
+    if compression == 'zstd':
+        zstandard = _zstandard()
+        if mode == 'rb':
+            return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True)
+        return zstandard.ZstdCompressor(level=DEFAULT_ZSTD_LEVEL).stream_writer(open(path, 'wb'))
+    return open(path, mode)
+
+
+def open_text(path: str, mode: str = 'r', encoding: str = 'utf-8', newline: str = None):
+    """open() gibi metin modunda açar; sıkıştırılmış dosyaları şeffaf şekilde işler"""
+    if mode not in ('r', 'w'):
+        raise ValueError(f"Desteklenmeyen mod: {mode}")
+    binary = open_binary(path, mode + 'b')
+    try:
+        return io.TextIOWrapper(binary, encoding=encoding, newline=newline)
+    except Exception:
+        binary.close()
+        raise
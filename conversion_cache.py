@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çevirme Cache'i
+Çevrilmiş collection'ları HAR içeriğinin hash'i ve çevirme seçeneklerinin
+hash'i ile adreslenen dosyalarda saklar. Aynı HAR aynı seçeneklerle tekrar
+çevrildiğinde sonuç diskten okunur.
+
+Her cache dosyası payload'un boyutunu ve hash'ini içeren bir başlık satırıyla
+başlar; yarım yazılmış ya da bozulmuş dosyalar okunurken tespit edilip
+silinir. Toplam boyut sınırı aşılınca en uzun süredir kullanılmayan
+dosyalar silinir (son kullanım zamanı dosyanın mtime'ıdır).
+"""
+
+import hashlib
+import os
+import tempfile
+
+import json_codec
+from har_checkpoint import new_prefix_hasher, options_fingerprint, update_prefix_hash
+
+DEFAULT_CACHE_DIR = os.environ.get('HAR_TO_POSTMAN_CACHE_DIR') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'har_to_postman')
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024
+
+CACHE_MAGIC = b'HARCACHE1'
+CACHE_SUFFIX = '.collection'
+
+
+def har_content_hash(har_file_path: str):
+    """HAR dosyasının içerik hash'i"""
+    hasher = new_prefix_hasher()
+    update_prefix_hash(hasher, har_file_path, 0, os.path.getsize(har_file_path))
+    return hasher.hexdigest()
+
+
+def _payload_hash(payload: bytes):
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class ConversionCache:
+    """Boyut sınırlı, içerik adresli collection cache'i"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, har_file_path: str, options: dict):
+        """HAR içeriği ve çevirme seçeneklerinden cache anahtarı üretir"""
+        return f"{har_content_hash(har_file_path)}-{options_fingerprint(options)}"
+
+    def _path(self, key: str):
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def get(self, key: str):
+        """Cache'teki collection'ı döndürür; yoksa ya da bozuksa None"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                header = f.readline().split()
+                payload = f.read()
+        except OSError:
+            return None
+
+        if (len(header) != 3 or header[0] != CACHE_MAGIC or not header[1].isdigit()
+                or int(header[1]) != len(payload) or header[2] != _payload_hash(payload).encode('ascii')):
+            self._remove(path)
+            return None
+
+        try:
+            collection = json_codec.loads(payload)
+        except ValueError:
+            self._remove(path)
+            return None
+        # LRU için son kullanım zamanını güncelle
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return collection
+
+    def put(self, key: str, collection: dict):
+        """Collection'ı cache'e atomik olarak yazar ve boyut sınırını uygular"""
+        payload = json_codec.dumps_bytes(collection, compact=True)
+        if len(payload) > self.max_bytes:
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b'%s %d %s\n' % (CACHE_MAGIC, len(payload), _payload_hash(payload).encode('ascii')))
+                f.write(payload)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            self._remove(temp_path)
+            return False
+        self.evict()
+        return True
+
+    def entries(self):
+        """Cache dosyalarını (son kullanım, boyut, yol) olarak, eskiden yeniye döndürür"""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """Toplam boyut sınırın altına inene kadar en eski dosyaları siler"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Tüm cache dosyalarını siler"""
+        for _, _, path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
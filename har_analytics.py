@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Analizi
+HAR entry'lerini tek geçişte sütunlara (pandas DataFrame) aktarır; dağılım,
+top-N ve gruplama analizlerinin hepsi bu tablo üzerinde vektörel çalışır.
+Python döngüsü sadece entry'lerin sütunlara aktarılmasında kullanılır.
+Tablo sıkıştırılmış .npz ya da pickle sidecar dosyasına yazılabilir;
+sonraki analizler JSON'u hiç parse etmez.
+
+Kullanım:
+    python har_analytics.py capture.har
+    python har_analytics.py capture.har --json latency.json --top 30
+    python har_analytics.py capture.har --sidecar capture.har.frame.npz
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from har_stream import iter_har_entries
+from path_template import PathTemplateTrie
+from url_cache import canonical_url
+
+# HAR 1.2 timings alanları (-1: bu istek için geçerli değil)
+TIMING_PHASES = ('blocked', 'dns', 'connect', 'ssl', 'send', 'wait', 'receive')
+LATENCY_METRICS = ('time',) + TIMING_PHASES
+PERCENTILES = (0.5, 0.9, 0.99)
+
+CATEGORY_COLUMNS = ('method', 'host', 'path', 'endpoint', 'mime', 'request_content_type')
+SIZE_COLUMNS = ('request_body_size', 'response_body_size', 'transfer')
+
+# Sidecar formatının sürümü; sütunlar değişirse artırılmalı
+FRAME_VERSION = 1
+
+
+def _positive(value):
+    """HAR'daki -1 / eksik değerleri NaN'a çevirir"""
+    if value is None or value < 0:
+        return np.nan
+    return value
+
+
+def transfer_size(response: dict):
+    """Response'un ağdan aktarılan boyutu (Chrome _transferSize ya da header + body)"""
+    size = response.get('_transferSize')
+    if size is not None and size >= 0:
+        return size
+    total = 0
+    for key in ('headersSize', 'bodySize'):
+        value = response.get(key)
+        if value is not None and value > 0:
+            total += value
+    return total
+
+
+def _request_content_type(headers):
+    for header in headers:
+        if header.get('name', '').lower() == 'content-type':
+            return header.get('value', '').split(';')[0].strip()
+    return ''
+
+
+def entries_frame(entries, template_paths: bool = True, **trie_options):
+    """Entry'leri sütunlu bir DataFrame'e aktarır
+
+    Her satır request'i olan bir entry'dir. Sütunlar: method, host, path,
+    endpoint (host + şablonlanmış path), status, mime (response),
+    request_content_type, request/response body boyutu, transfer (ağdan
+    aktarılan byte), started (UTC başlangıç zamanı), time ve timings
+    fazları. URL'si olmayan request'lerde host, path ve endpoint boştur.
+    Tüm entry sayısı frame.attrs['entry_count'] içinde tutulur.
+    """
+    names = ('method', 'host', 'segments', 'status', 'mime', 'request_content_type', 'started') \
+        + SIZE_COLUMNS + LATENCY_METRICS
+    columns = {name: [] for name in names}
+    trie = PathTemplateTrie(**trie_options) if template_paths else None
+    entry_count = 0
+
+    for entry in entries:
+        entry_count += 1
+        request = entry.get('request')
+        if not request:
+            continue
+        url = request.get('url')
+        if url:
+            parsed_url = canonical_url(url)
+            host = parsed_url.netloc or 'unknown'
+            segments = parsed_url.path_segments
+            if trie is not None:
+                trie.insert(host, segments)
+        else:
+            host, segments = '', None
+        response = entry.get('response') or {}
+        timings = entry.get('timings') or {}
+
+        columns['method'].append(request.get('method', 'UNKNOWN').upper())
+        columns['host'].append(host)
+        columns['segments'].append(segments)
+        columns['status'].append(response.get('status', 0))
+        columns['mime'].append((response.get('content') or {}).get('mimeType', '').split(';')[0].strip())
+        columns['request_content_type'].append(_request_content_type(request.get('headers', [])))
+        columns['started'].append(entry.get('startedDateTime'))
+        columns['request_body_size'].append(max(request.get('bodySize') or 0, 0))
+        columns['response_body_size'].append(max(response.get('bodySize') or 0, 0))
+        columns['transfer'].append(transfer_size(response))
+        columns['time'].append(_positive(entry.get('time')))
+        for phase in TIMING_PHASES:
+            columns[phase].append(_positive(timings.get(phase)))
+
+    # Şablonlama her farklı path için bir kez yapılır
+    paths = {}
+    for key in set(zip(columns['host'], columns['segments'])):
+        host, segments = key
+        if segments is None:
+            paths[key] = ('', '')
+            continue
+        templated = trie.template(host, segments)[0] if trie is not None else segments
+        paths[key] = ('/' + '/'.join(segments), host + '/' + '/'.join(templated))
+
+    keys = list(zip(columns['host'], columns.pop('segments')))
+    frame = pd.DataFrame(columns)
+    frame['path'] = [paths[key][0] for key in keys]
+    frame['endpoint'] = [paths[key][1] for key in keys]
+    # İptal edilen isteklerde status null, bazı exporter'larda string olabilir
+    frame['status'] = pd.to_numeric(frame['status'], errors='coerce').fillna(0).astype('int32')
+    frame['started'] = pd.to_datetime(frame['started'], utc=True, errors='coerce',
+                                      format='ISO8601').astype('datetime64[ns, UTC]')
+    for name in SIZE_COLUMNS:
+        frame[name] = frame[name].astype('int64')
+    for metric in LATENCY_METRICS:
+        frame[metric] = frame[metric].astype('float64')
+    for name in CATEGORY_COLUMNS:
+        frame[name] = frame[name].astype('category')
+    frame.attrs['entry_count'] = entry_count
+    return frame
+
+
+def save_frame(frame, path: str, source: dict = None):
+    """Frame'i .npz (sıkıştırılmış numpy) ya da pickle sidecar olarak yazar
+
+    .npz dışındaki uzantılar pickle olarak yazılır; .gz, .bz2, .xz gibi
+    uzantılarda pandas sıkıştırmayı otomatik seçer. source, sidecar'ın
+    hangi HAR'dan üretildiğini belirten bilgidir (bkz. load_har_frame).
+    """
+    meta = {"version": FRAME_VERSION, "source": source, "attrs": frame.attrs,
+            "columns": list(frame.columns)}
+    if not path.endswith('.npz'):
+        frame = frame.copy()
+        frame.attrs = {"sidecar": meta}
+        frame.to_pickle(path)
+        return
+
+    arrays = {"__meta__": np.array(json.dumps(meta))}
+    for name in frame.columns:
+        column = frame[name]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            arrays[f"{name}__codes"] = column.cat.codes.to_numpy()
+            arrays[f"{name}__categories"] = np.array(column.cat.categories, dtype=str)
+        elif name == 'started':
+            arrays[name] = column.to_numpy(dtype='datetime64[ns]').view('int64')
+        else:
+            arrays[name] = column.to_numpy()
+    # np.savez_compressed dosya adına .npz ekler; yolu birebir kullanmak için dosya objesi verilir
+    with open(path, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+
+
+def load_frame(path: str):
+    """save_frame ile yazılmış sidecar'ı okur
+
+    Returns:
+        (frame, meta) — meta'da version ve source bilgisi bulunur
+    """
+    if not path.endswith('.npz'):
+        frame = pd.read_pickle(path)
+        meta = frame.attrs.get("sidecar", {})
+        frame.attrs = dict(meta.get("attrs") or {})
+        return frame, meta
+
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["__meta__"]))
+        columns = {}
+        for name in meta["columns"]:
+            if f"{name}__codes" in data:
+                columns[name] = pd.Categorical.from_codes(data[f"{name}__codes"], data[f"{name}__categories"])
+            elif name == 'started':
+                columns[name] = pd.to_datetime(data[name].view('datetime64[ns]'), utc=True)
+            else:
+                columns[name] = data[name]
+    frame = pd.DataFrame(columns)
+    frame.attrs = dict(meta.get("attrs") or {})
+    return frame, meta
+
+
+def _har_source(har_file_path: str, template_paths: bool):
+    stat = os.stat(har_file_path)
+    return {"har_file": os.path.abspath(har_file_path), "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns, "template_paths": template_paths}
+
+
+def load_har_frame(har_file_path: str, sidecar: str = None, template_paths: bool = True):
+    """HAR dosyasının frame'ini döndürür
+
+    sidecar verilirse ve HAR (boyut + mtime) sidecar yazıldığından beri
+    değişmediyse frame sidecar'dan okunur; aksi halde HAR akış modunda
+    okunup frame oluşturulur ve sidecar'a yazılır.
+    """
+    source = _har_source(har_file_path, template_paths)
+    if sidecar and os.path.exists(sidecar):
+        try:
+            frame, meta = load_frame(sidecar)
+            if meta.get("version") == FRAME_VERSION and meta.get("source") == source:
+                return frame
+        except (OSError, ValueError, KeyError):
+            pass
+
+    frame = entries_frame(iter_har_entries(har_file_path), template_paths)
+    if sidecar:
+        save_frame(frame, sidecar, source)
+    return frame
+
+
+def latency_report(frame):
+    """method + endpoint grupları için gecikme yüzdeliklerini hesaplar
+
+    Dönen DataFrame'de her grup bir satırdır; sütunlar count,
+    transfer_bytes ve her metrik için <metrik>_p50/_p90/_p99/_max'tır.
+    Satırlar toplam sürenin p90 değerine göre azalan sıradadır.
+    """
+    metrics = list(LATENCY_METRICS)
+    ordered = ['count', 'transfer_bytes'] + [
+        f"{metric}_{stat}" for metric in metrics for stat in ('p50', 'p90', 'p99', 'max')]
+    requests = frame[frame['endpoint'] != '']
+    if requests.empty:
+        # Boş HAR ya da URL'li request yok: yüzdelik sütunları oluşmaz, boş rapor döndür
+        index = pd.MultiIndex.from_arrays([[], []], names=['method', 'endpoint'])
+        return pd.DataFrame(columns=ordered, index=index)
+
+    groups = requests.groupby(['method', 'endpoint'], observed=True, sort=False)
+
+    quantiles = groups[metrics].quantile(list(PERCENTILES)).unstack()
+    quantiles.columns = [f"{metric}_p{round(q * 100)}" for metric, q in quantiles.columns]
+    maxima = groups[metrics].max().add_suffix('_max')
+
+    report = pd.concat([
+        groups.size().rename('count'),
+        groups['transfer'].sum().rename('transfer_bytes'),
+        quantiles,
+        maxima
+    ], axis=1)
+    return report[ordered].sort_values('time_p90', ascending=False, na_position='last')
+
+
+def _number(value):
+    return None if pd.isna(value) else round(float(value), 3)
+
+
+def latency_report_json(report):
+    """Raporu JSON'a yazılabilir liste olarak döndürür"""
+    groups = []
+    for (method, endpoint), row in report.iterrows():
+        group = {
+            "method": method,
+            "endpoint": endpoint,
+            "count": int(row['count']),
+            "transfer_bytes": int(row['transfer_bytes'])
+        }
+        for metric in LATENCY_METRICS:
+            group[metric] = {stat: _number(row[f"{metric}_{stat}"]) for stat in ('p50', 'p90', 'p99', 'max')}
+        groups.append(group)
+    return groups
+
+
+def format_latency_table(report, top: int = 20):
+    """En yavaş `top` endpoint'i tablo olarak döndürür
+
+    Her satırda toplam sürenin yüzdelikleri ve p50'si en büyük olan
+    (darboğaz) timings fazı gösterilir.
+    """
+    rows = report.head(top)
+    name_width = max([len(f"{method} {endpoint}") for method, endpoint in rows.index] + [8])
+    name_width = min(name_width, 70)
+    header = (f"{'Endpoint':<{name_width}}  {'Adet':>7}  {'p50 ms':>9}  {'p90 ms':>9}  {'p99 ms':>9}  "
+              f"{'max ms':>9}  {'Darboğaz':<14}  {'Aktarım KB':>11}")
+    lines = [header, "-" * len(header)]
+
+    phase_p50 = rows[[f"{phase}_p50" for phase in TIMING_PHASES]]
+    bottlenecks = phase_p50.fillna(-1).to_numpy().argmax(axis=1)
+    for position, ((method, endpoint), row) in enumerate(rows.iterrows()):
+        name = f"{method} {endpoint}"
+        if len(name) > name_width:
+            name = name[:name_width - 3] + "..."
+        phase = TIMING_PHASES[bottlenecks[position]]
+        phase_value = row[f"{phase}_p50"]
+        bottleneck = f"{phase} {phase_value:.0f}" if not pd.isna(phase_value) else "-"
+        cells = [row[f"time_{stat}"] for stat in ('p50', 'p90', 'p99', 'max')]
+        lines.append(
+            f"{name:<{name_width}}  {int(row['count']):>7}  "
+            + "  ".join(f"{value:>9.1f}" if not pd.isna(value) else f"{'-':>9}" for value in cells)
+            + f"  {bottleneck:<14}  {row['transfer_bytes'] / 1024:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def latency_report_from_har(har_file_path: str, template_paths: bool = True, sidecar: str = None):
+    """HAR dosyasının (ya da güncel sidecar'ının) gecikme raporunu döndürür"""
+    return latency_report(load_har_frame(har_file_path, sidecar, template_paths))
+
+
+def main():
+    """Komut satırından gecikme raporu"""
+    parser = argparse.ArgumentParser(description='HAR gecikme (latency) raporu')
+    parser.add_argument('har_file', help='HAR dosyası yolu')
+    parser.add_argument('--json', metavar='FILE', help='Raporun tamamını JSON olarak bu dosyaya yaz')
+    parser.add_argument('--top', type=int, default=20, metavar='N', help='Tabloda gösterilecek endpoint sayısı')
+    parser.add_argument('--no-templates', action='store_true',
+                        help='Path\'leri şablonlamadan, olduğu gibi grupla')
+    parser.add_argument('--sidecar', metavar='FILE',
+                        help='Sütunlu tabloyu bu .npz / .pkl(.gz) dosyasında sakla, sonraki çalıştırmalarda kullan')
+    args = parser.parse_args()
+
+    try:
+        report = latency_report_from_har(args.har_file, not args.no_templates, args.sidecar)
+    except (OSError, ValueError) as e:
+        print(f"❌ HAR dosyası analiz edilirken hata: {e}")
+        sys.exit(1)
+
+    print(f"⏱️  {len(report)} endpoint için gecikme raporu (toplam süreye göre p90 sıralı)\n")
+    print(format_latency_table(report, args.top))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(latency_report_json(report), f, indent=2, ensure_ascii=False)
+        print(f"\n✅ JSON rapor kaydedildi: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Converter Benchmark
+har_generator ile üretilen sentetik HAR'lar üzerinde
+har_to_postman_collection ve create_collection_from_har'ı ölçer. Her senaryo
+ayrı bir process'te çalışır; böylece tepe bellek (peak RSS) ölçümleri
+birbirini etkilemez. Sonuçlar (süre, entry/s, peak RSS, aşama süreleri)
+JSON olarak yazılır ve önceki bir çalışmayla karşılaştırılabilir.
+
+Aşama süreleri her senaryo için toplanır. 'stages' senaryosu bellekteki
+çevirmeyi load / convert / group / write adımlarına kendisi böler; diğer
+senaryolar profiling() açıkken çalışır ve converter'ın kendi aşamalarını
+(self time, bkz. profiling) raporlar. Bu senaryoların toplam süresine
+profillemenin küçük ek maliyeti de dahildir.
+
+Kullanım:
+    python har_benchmark.py --sizes 1000 100000 --json bench.json
+    python har_benchmark.py --sizes 1000 --compare bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+
+import json_codec
+from har_generator import (DEFAULT_BASE64_RATIO, DEFAULT_BODY_SIZE, DEFAULT_DOMAINS, DEFAULT_HEADERS,
+                           generate_har)
+from profiling import profiling
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+SCENARIOS = ('stages', 'collection', 'create', 'create_stream')
+
+# Rapor tablosunda senaryo başına gösterilen aşama sayısı
+MAX_REPORTED_STAGES = 5
+
+
+def peak_rss_bytes():
+    """Bu process'in şimdiye kadarki tepe bellek kullanımı (ölçülemiyorsa None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta byte döner
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _timed(stages: dict, name: str, func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    stages[name] = time.perf_counter() - started
+    return result
+
+
+def _run_scenario(scenario: str, har_path: str, output_path: str):
+    """Worker process'te tek bir senaryoyu çalıştırır ve ölçümleri döndürür"""
+    from har_to_postman import (collection_info, convert_entries, create_collection_from_har,
+                                har_to_postman_collection, merge_into_collection)
+
+    stages = {}
+    profiler = None
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.ExitStack() as stack:
+        if scenario != 'stages':
+            profiler = stack.enter_context(profiling())
+        if scenario == 'stages':
+            # Varsayılan (bellekte) çevirmenin aşamaları ayrı ayrı
+            har_data = _timed(stages, 'load', json_codec.read_json_file, har_path)
+            entries = har_data['log']['entries']
+            requests = _timed(stages, 'convert', lambda: list(convert_entries(entries)))
+            collection = {"info": collection_info(har_path), "item": []}
+            _timed(stages, 'group', merge_into_collection, collection, requests)
+            _timed(stages, 'write', json_codec.write_json_file, collection, output_path)
+            success = True
+        elif scenario == 'collection':
+            success = har_to_postman_collection(har_path) is not None
+        elif scenario == 'create':
+            success = create_collection_from_har(har_path, output_path)
+        elif scenario == 'create_stream':
+            success = create_collection_from_har(har_path, output_path, stream=True)
+        else:
+            raise ValueError(f"Bilinmeyen senaryo: {scenario}")
+    seconds = time.perf_counter() - started
+    if profiler is not None:
+        stages = {name: stage["seconds"] for name, stage in profiler.report()["stages"].items()}
+
+    if not success:
+        raise RuntimeError(f"{scenario} senaryosu başarısız oldu")
+    output_bytes = os.path.getsize(output_path) if os.path.exists(output_path) else None
+    return {"seconds": seconds, "peak_rss_bytes": peak_rss_bytes(), "stages": stages, "output_bytes": output_bytes}
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, scenarios=SCENARIOS, work_dir: str = None, domains: int = DEFAULT_DOMAINS,
+                  body_size: int = DEFAULT_BODY_SIZE, base64_ratio: float = DEFAULT_BASE64_RATIO,
+                  headers: int = DEFAULT_HEADERS, seed: int = 0):
+    """Her boyut için HAR üretir ve senaryoları ayrı process'lerde ölçer
+
+    work_dir verilirse üretilen HAR'lar orada tutulur ve sonraki
+    çalışmalarda yeniden kullanılır; verilmezse geçici dizin kullanılır.
+
+    Returns:
+        JSON'a yazılabilir sonuç sözlüğü
+    """
+    generator = {"domains": domains, "body_size": body_size, "base64_ratio": base64_ratio,
+                 "headers": headers, "seed": seed}
+    report = {
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "json_backend": json_codec.BACKEND,
+        "generator": generator,
+        "results": []
+    }
+
+    with contextlib.ExitStack() as stack:
+        if work_dir is None:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='har_benchmark_'))
+        os.makedirs(work_dir, exist_ok=True)
+
+        for size in sizes:
+            har_path = os.path.join(work_dir, f"synthetic_{size}_{seed}_{domains}_{body_size}_{headers}_"
+                                              f"{base64_ratio}.har")
+            if not os.path.exists(har_path):
+                generate_har(har_path, size, **generator)
+            har_bytes = os.path.getsize(har_path)
+            output_path = os.path.join(work_dir, f"synthetic_{size}_collection.json")
+
+            for scenario in scenarios:
+                # Her senaryo temiz bir process'te: peak RSS sadece o senaryoya ait olsun
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+                    measurement = executor.submit(_run_scenario, scenario, har_path, output_path).result()
+                if os.path.exists(output_path):
+                    os.unlink(output_path)
+                report["results"].append(dict(
+                    scenario=scenario,
+                    entries=size,
+                    har_bytes=har_bytes,
+                    entries_per_second=size / measurement["seconds"] if measurement["seconds"] else None,
+                    **measurement
+                ))
+    return report
+
+
+def format_report(report: dict, baseline: dict = None):
+    """Sonuçları tablo olarak biçimlendirir; baseline verilirse hız oranını da gösterir"""
+    previous = {}
+    if baseline:
+        previous = {(result["scenario"], result["entries"]): result for result in baseline.get("results", [])}
+
+    lines = [f"{'Senaryo':<14} {'Entry':>9} {'Süre (s)':>9} {'Entry/s':>11} {'Peak RSS (MB)':>14}  Aşamalar"]
+    lines.append("-" * 90)
+    for result in report["results"]:
+        rss = result["peak_rss_bytes"]
+        # Tabloda en uzun süren aşamalar; tamamı JSON çıktısında
+        stages = ", ".join(f"{name} {seconds:.2f}s"
+                           for name, seconds in list(result["stages"].items())[:MAX_REPORTED_STAGES])
+        line = (f"{result['scenario']:<14} {result['entries']:>9} {result['seconds']:>9.2f} "
+                f"{result['entries_per_second'] or 0:>11.0f} {rss / 1024 / 1024 if rss else 0:>14.1f}  {stages}")
+        old = previous.get((result["scenario"], result["entries"]))
+        if old and result["seconds"]:
+            line += f"  ({old['seconds'] / result['seconds']:.2f}x önceki çalışmaya göre)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    """Komut satırından benchmark çalıştırma"""
+    parser = argparse.ArgumentParser(description='HAR to Postman converter benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Entry sayıları (varsayılan: %(default)s)')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+                        help='Çalıştırılacak senaryolar')
+    parser.add_argument('--json', metavar='FILE', help='Sonuçları JSON olarak kaydet')
+    parser.add_argument('--compare', metavar='FILE', help='Önceki bir --json çıktısıyla karşılaştır')
+    parser.add_argument('--work-dir', metavar='DIR', help='Üretilen HAR\'ları bu dizinde tut ve yeniden kullan')
+    parser.add_argument('--domains', type=int, default=DEFAULT_DOMAINS)
+    parser.add_argument('--body-size', type=int, default=DEFAULT_BODY_SIZE, metavar='BYTES')
+    parser.add_argument('--base64-ratio', type=float, default=DEFAULT_BASE64_RATIO)
+    parser.add_argument('--headers', type=int, default=DEFAULT_HEADERS)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    baseline = json_codec.read_json_file(args.compare) if args.compare else None
+
+    print(f"🚀 Benchmark: {', '.join(map(str, args.sizes))} entry, JSON backend: {json_codec.BACKEND}")
+    report = run_benchmark(args.sizes, args.scenarios, args.work_dir, args.domains, args.body_size,
+                           args.base64_ratio, args.headers, args.seed)
+    print(format_report(report, baseline))
+
+    if args.json:
+        json_codec.write_json_file(report, args.json)
+        print(f"✅ Sonuçlar kaydedildi: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
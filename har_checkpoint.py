@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Artımlı Çevirme Checkpoint'i
+Büyüyen HAR dosyalarında son çevirmenin nerede bittiğini çıktı dosyasının
+yanındaki bir sidecar dosyada tutar: çevrilen entry sayısı, son entry'nin
+bittiği byte ve o byte'a kadarki içeriğin hash'i. Hash tutuyorsa sonraki
+çevirme sadece yeni eklenen entry'leri okur.
+"""
+
+import hashlib
+import json
+import os
+
+CHECKPOINT_SUFFIX = '.checkpoint.json'
+CHECKPOINT_VERSION = 1
+
+# Prefix hash'i hesaplanırken tek seferde okunan byte sayısı
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def checkpoint_path(output_path: str):
+    """Çıktı dosyasının checkpoint sidecar yolu"""
+    return output_path + CHECKPOINT_SUFFIX
+
+
+def _option_value(value):
+    # HeaderPolicy, EntryFilter gibi derlenmiş seçenekler kendi imzalarını verir
+    if hasattr(value, 'signature'):
+        return value.signature()
+    raise TypeError(f"Seçenek değeri JSON'a çevrilemiyor: {value!r}")
+
+
+def options_fingerprint(options: dict):
+    """Çıktıyı etkileyen çevirme seçeneklerinin hash'i
+
+    None değerli seçenekler varsayılanla aynı kabul edilip atlanır.
+    """
+    relevant = {key: value for key, value in options.items() if value is not None}
+    text = json.dumps(relevant, sort_keys=True, default=_option_value)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def new_prefix_hasher():
+    return hashlib.blake2b(digest_size=16)
+
+
+def update_prefix_hash(hasher, har_file_path: str, start: int, end: int):
+    """Dosyanın [start, end) byte aralığını hasher'a ekler; dosya kısaysa False döner"""
+    with open(har_file_path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(HASH_BLOCK_SIZE, remaining))
+            if not block:
+                return False
+            hasher.update(block)
+            remaining -= len(block)
+    return True
+
+
+def load_checkpoint(output_path: str):
+    """Checkpoint'i okur; yoksa ya da bozuksa None döner"""
+    try:
+        with open(checkpoint_path(output_path), 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(checkpoint, dict) or checkpoint.get('version') != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+def verify_checkpoint(checkpoint: dict, har_file_path: str, output_path: str, fingerprint: str):
+    """Checkpoint hâlâ geçerliyse prefix'i işlemiş hasher'ı, değilse None döndürür
+
+    Geçerli olması için çıktı dosyası mevcut, seçenekler aynı ve HAR'ın
+    checkpoint offset'ine kadarki içeriği değişmemiş olmalıdır.
+    """
+    if not checkpoint or not os.path.exists(output_path):
+        return None
+    if checkpoint.get('options') != fingerprint:
+        return None
+    byte_offset = checkpoint.get('byte_offset', 0)
+    if os.path.getsize(har_file_path) < byte_offset:
+        return None
+    hasher = new_prefix_hasher()
+    if not update_prefix_hash(hasher, har_file_path, 0, byte_offset):
+        return None
+    if hasher.hexdigest() != checkpoint.get('prefix_hash'):
+        return None
+    return hasher
+
+
+def save_checkpoint(output_path: str, har_file_path: str, entry_count: int, byte_offset: int,
+                    prefix_hash: str, fingerprint: str, **extra):
+    """Checkpoint'i geçici dosyaya yazıp atomik olarak yerine koyar"""
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "har_file": os.path.abspath(har_file_path),
+        "entry_count": entry_count,
+        "byte_offset": byte_offset,
+        "prefix_hash": prefix_hash,
+        "options": fingerprint
+    }
+    checkpoint.update(extra)
+    path = checkpoint_path(output_path)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
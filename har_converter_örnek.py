@@ -73,71 +73,77 @@ def example_usage():
         
         print("✅ Collection manuel olarak kaydedildi: manual_collection.json")
 
-def analyze_har_file(har_file_path: str):
-    """HAR dosyasını analiz eder"""
+def analyze_har_file(har_file_path: str, sidecar: str = None):
+    """HAR dosyasını analiz eder
+
+    Entry'ler bir kez sütunlu bir tabloya aktarılır ve tüm dağılımlar bu
+    tablo üzerinden hesaplanır. sidecar verilirse (.npz ya da .pkl.gz)
+    tablo orada saklanır ve HAR değişmedikçe tekrar parse edilmez.
+    """
     print(f"\n🔍 HAR Dosyası Analizi: {har_file_path}")
     print("-" * 50)
     
     try:
-        with open(har_file_path, 'r', encoding='utf-8') as f:
-            har_data = json.load(f)
-        
-        if 'log' not in har_data or 'entries' not in har_data['log']:
-            print("❌ Geçersiz HAR dosyası formatı")
-            return
+        from har_analytics import load_har_frame
         
-        entries = har_data['log']['entries']
+        frame = load_har_frame(har_file_path, sidecar)
         
         # İstatistikler
-        print(f"📊 Toplam HTTP İsteği: {len(entries)}")
-        
-        # Method'ları say
-        methods = {}
-        domains = {}
-        content_types = {}
-        
-        for entry in entries:
-            if 'request' not in entry:
-                continue
-            
-            request = entry['request']
-            
-            # Method istatistiği
-            method = request.get('method', 'UNKNOWN')
-            methods[method] = methods.get(method, 0) + 1
-            
-            # Domain istatistiği
-            url = request.get('url', '')
-            if url:
-                from urllib.parse import urlparse
-                domain = urlparse(url).netloc
-                domains[domain] = domains.get(domain, 0) + 1
-            
-            # Content-Type istatistiği
-            headers = request.get('headers', [])
-            for header in headers:
-                if header.get('name', '').lower() == 'content-type':
-                    ct = header.get('value', '').split(';')[0]
-                    content_types[ct] = content_types.get(ct, 0) + 1
+        print(f"📊 Toplam HTTP İsteği: {frame.attrs.get('entry_count', len(frame))}")
         
         # Sonuçları göster
         print("\n🌐 HTTP Method Dağılımı:")
-        for method, count in sorted(methods.items()):
-            print(f"   {method}: {count}")
+        for method, count in frame['method'].value_counts(sort=False).sort_index().items():
+            if count:
+                print(f"   {method}: {count}")
         
         print("\n🏠 Domain Dağılımı:")
-        for domain, count in sorted(domains.items(), key=lambda x: x[1], reverse=True)[:10]:
+        domains = frame.loc[frame['host'] != '', 'host'].value_counts()
+        for domain, count in domains[domains > 0].head(10).items():
             print(f"   {domain}: {count}")
         
-        if content_types:
+        content_types = frame.loc[frame['request_content_type'] != '', 'request_content_type'].value_counts()
+        content_types = content_types[content_types > 0]
+        if len(content_types):
             print("\n📄 Content-Type Dağılımı:")
-            for ct, count in sorted(content_types.items(), key=lambda x: x[1], reverse=True):
-                if ct:  # Boş olmayan content-type'ları göster
-                    print(f"   {ct}: {count}")
+            for ct, count in content_types.items():
+                print(f"   {ct}: {count}")
+        
+        statuses = frame.loc[frame['status'] > 0, 'status'].value_counts().sort_index()
+        if len(statuses):
+            print("\n📶 Status Kodu Dağılımı:")
+            for status, count in statuses.items():
+                print(f"   {status}: {count}")
+        
+        if len(frame):
+            print("\n📦 En Çok Veri Aktaran Domain'ler:")
+            transfer = frame[frame['host'] != ''].groupby('host', observed=True)['transfer'].sum()
+            for domain, size in transfer.nlargest(5).items():
+                print(f"   {domain}: {size / 1024:.1f} KB")
         
     except Exception as e:
         print(f"❌ HAR dosyası analiz edilirken hata: {e}")
 
+def latency_report_har_file(har_file_path: str, json_output: str = None, top: int = 20):
+    """HAR dosyası için method + şablonlanmış path bazında gecikme raporu yazdırır"""
+    print(f"\n⏱️  Gecikme Raporu: {har_file_path}")
+    print("-" * 50)
+    
+    try:
+        from har_analytics import format_latency_table, latency_report_from_har, latency_report_json
+        
+        report = latency_report_from_har(har_file_path)
+        print(f"📊 {len(report)} endpoint, {int(report['count'].sum())} istek\n")
+        print(format_latency_table(report, top))
+        
+        if json_output:
+            with open(json_output, 'w', encoding='utf-8') as f:
+                json.dump(latency_report_json(report), f, indent=2, ensure_ascii=False)
+            print(f"\n✅ JSON rapor kaydedildi: {json_output}")
+        
+    except Exception as e:
+        print(f"❌ Gecikme raporu oluşturulurken hata: {e}")
+
 def interactive_converter():
     """İnteraktif HAR converter"""
     print("\n🎯 İnteraktif HAR Converter")
@@ -187,8 +193,9 @@ if __name__ == "__main__":
     print("1. Örnek kullanımları göster")
     print("2. HAR dosyası analizi yap")
     print("3. İnteraktif converter")
+    print("4. Gecikme (latency) raporu")
     
-    choice = input("\nSeçiminiz (1-3): ").strip()
+    choice = input("\nSeçiminiz (1-4): ").strip()
     
     if choice == "1":
         example_usage()
@@ -200,5 +207,12 @@ if __name__ == "__main__":
             print("❌ HAR dosya yolu boş olamaz!")
     elif choice == "3":
         interactive_converter()
+    elif choice == "4":
+        har_file = input("HAR dosyasının yolu: ").strip()
+        if har_file:
+            json_output = input("JSON rapor dosyası (boş bırakırsanız yazılmaz): ").strip()
+            latency_report_har_file(har_file, json_output or None)
+        else:
+            print("❌ HAR dosya yolu boş olamaz!")
     else:
         print("❌ Geçersiz seçim!") 
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request Tekilleştirme
+Yapısal olarak aynı olan request'leri (method, şablonlanmış path, query
+key'leri ve JSON body şekli) tek bir temsilci request'e indirger.
+"""
+
+import hashlib
+import json
+
+from path_template import template_path
+
+
+def json_shape(value):
+    """JSON değerinin şeklini (key'ler ve tipler) değerlerden bağımsız olarak döndürür"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, json_shape(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        # Dizilerde ilk elemanın şekli yeterli, tüm elemanları gezmeye gerek yok
+        return ('list', json_shape(value[0]) if value else None)
+    return type(value).__name__
+
+
+def body_shape(body: dict):
+    """Postman body objesinin şeklini döndürür"""
+    if not body:
+        return None
+    mode = body.get('mode')
+    if mode == 'urlencoded':
+        return (mode, tuple(sorted(param.get('key', '') for param in body.get('urlencoded', []))))
+    if mode == 'raw':
+        try:
+            return (mode, json_shape(json.loads(body.get('raw', ''))))
+        except ValueError:
+            return (mode, 'text')
+    return (mode,)
+
+
+class RequestDeduplicator:
+    """Yapısal parmak izine göre tekrar eden request'leri ayıklar
+
+    Her request için parmak izi tek bir kez hesaplanıp 16 byte'lık bir
+    hash'e indirgenir; böylece milyonlarca entry'de de işlem O(n) kalır.
+    İlk görülen request temsilci olarak tutulur, sonrakiler sayılır ve
+    max_examples kadarının URL'i örnek olarak saklanır.
+    """
+
+    def __init__(self, max_examples: int = 0, path_templater=template_path):
+        self.max_examples = max_examples
+        self.path_templater = path_templater
+        self.groups = {}
+        self.duplicate_count = 0
+
+    def fingerprint(self, domain: str, postman_request: dict):
+        """Request'in yapısal parmak izini hash olarak döndürür"""
+        request = postman_request['request']
+        url = request.get('url', {})
+        key = (
+            domain,
+            request.get('method', ''),
+            self.path_templater(url.get('path', [])),
+            tuple(sorted({param.get('key', '') for param in url.get('query', [])})),
+            body_shape(request.get('body'))
+        )
+        return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).digest()
+
+    def filter(self, requests):
+        """(domain, postman_request) akışından sadece temsilci request'leri geçirir"""
+        for domain, postman_request in requests:
+            key = self.fingerprint(domain, postman_request)
+            group = self.groups.get(key)
+            if group is None:
+                self.groups[key] = {"item": postman_request, "count": 1, "examples": []}
+                yield domain, postman_request
+                continue
+
+            group["count"] += 1
+            self.duplicate_count += 1
+            if len(group["examples"]) < self.max_examples:
+                group["examples"].append(postman_request['request']['url'].get('raw', ''))
+
+    def annotate(self):
+        """Temsilci request'lerin açıklamasına tekrar sayısını ve örnekleri ekler"""
+        for group in self.groups.values():
+            if group["count"] < 2:
+                continue
+            description = f"🔁 Bu istek HAR içinde {group['count']} kez görüldü."
+            if group["examples"]:
+                description += "\n\nÖrnekler:\n" + "\n".join(f"- {url}" for url in group["examples"])
+            group["item"]["request"]["description"] = description
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Entry Filtreleri
+Domain, method, MIME tipi, status kodu, URL regex'i ve _resourceType'a göre
+include / exclude filtreleri. Filtreler çevirmeden önce uygulanır; akış
+modunda entry'nin ham JSON metninden gerekli alanlar regex ile çekilir ve
+reddedilen entry'ler hiç parse edilmez.
+
+Her alan için: include listesi boşsa kısıt yoktur, doluysa en az biri
+eşleşmelidir; exclude listesinden herhangi biri eşleşirse entry atılır.
+Alanlar arasında VE bağlantısı vardır.
+"""
+
+import json
+import re
+from urllib.parse import urlsplit
+
+import json_codec
+
+# Ham entry metninde alan araması. Anahtarın önünde { ya da , olması
+# gerekir; string içindeki tırnaklar kaçışlı (\") olduğundan body
+# içeriği yanlışlıkla eşleşmez.
+_STRING_VALUE = r'\s*:\s*"((?:[^"\\]|\\.)*)"'
+_REQUEST_START = re.compile(r'[{,]\s*"request"\s*:\s*\{')
+_RESPONSE_START = re.compile(r'[{,]\s*"response"\s*:\s*\{')
+_METHOD = re.compile(r'[{,]\s*"method"' + _STRING_VALUE, re.DOTALL)
+_URL = re.compile(r'[{,]\s*"url"' + _STRING_VALUE, re.DOTALL)
+_STATUS = re.compile(r'[{,]\s*"status"\s*:\s*(-?\d+)')
+_MIME_TYPE = re.compile(r'[{,]\s*"mimeType"' + _STRING_VALUE, re.DOTALL)
+_RESOURCE_TYPE = re.compile(r'[{,]\s*"_resourceType"' + _STRING_VALUE, re.DOTALL)
+
+_STATUS_CLASS = re.compile(r'^([1-5])xx$', re.IGNORECASE)
+
+
+def _json_string(value: str):
+    return json.loads(f'"{value}"') if '\\' in value else value
+
+
+def _search_after(pattern, text: str, start):
+    if start is None:
+        return None
+    # Objenin açılış süslü parantezi ilk anahtarın ön eki olarak da eşleşmeli
+    match = pattern.search(text, start.end() - 1)
+    return match.group(1) if match else None
+
+
+def raw_entry_fields(raw: str):
+    """Filtrelenen alanları ham entry metninden parse etmeden çıkarır
+
+    Bulunamayan alanlar sonuçta yer almaz. request objesindeki ilk url ve
+    method, response objesindeki ilk status ve mimeType (content.mimeType)
+    kullanılır; HAR şemasında bu objelerde aynı adlı başka anahtar yoktur.
+    Gerçek bir anahtar her zaman eşleştiğinden bulunamayan alan entry'de
+    de yoktur.
+    """
+    fields = {}
+    request = _REQUEST_START.search(raw)
+    response = _RESPONSE_START.search(raw)
+
+    url = _search_after(_URL, raw, request)
+    if url is not None:
+        fields['url'] = _json_string(url)
+    method = _search_after(_METHOD, raw, request)
+    if method is not None:
+        fields['method'] = _json_string(method)
+    status = _search_after(_STATUS, raw, response)
+    if status is not None:
+        fields['status'] = int(status)
+    mime_type = _search_after(_MIME_TYPE, raw, response)
+    if mime_type is not None:
+        fields['mime_type'] = _json_string(mime_type)
+    resource_type = _RESOURCE_TYPE.search(raw)
+    if resource_type is not None:
+        fields['resource_type'] = _json_string(resource_type.group(1))
+    return fields
+
+
+def entry_fields(entry: dict):
+    """raw_entry_fields ile aynı alanları parse edilmiş entry'den çıkarır"""
+    fields = {}
+    request = entry.get('request') or {}
+    response = entry.get('response') or {}
+    if 'url' in request:
+        fields['url'] = request['url']
+    if 'method' in request:
+        fields['method'] = request['method']
+    if 'status' in response:
+        fields['status'] = response['status']
+    mime_type = (response.get('content') or {}).get('mimeType')
+    if mime_type is not None:
+        fields['mime_type'] = mime_type
+    if '_resourceType' in entry:
+        fields['resource_type'] = entry['_resourceType']
+    return fields
+
+
+def _status_rules(values):
+    """Status değerlerini (kodlar, sınıflar) çiftine çevirir; boşsa None"""
+    codes = set()
+    classes = set()
+    for value in values:
+        value = str(value).strip()
+        match = _STATUS_CLASS.match(value)
+        if match:
+            classes.add(int(match.group(1)))
+        else:
+            codes.add(int(value))
+    if not codes and not classes:
+        return None
+    return frozenset(codes), frozenset(classes)
+
+
+def _status_matches(status: int, rules):
+    codes, classes = rules
+    return status in codes or status // 100 in classes
+
+
+def _compile_patterns(patterns):
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+def _mime_base(mime_type: str):
+    return mime_type.split(';', 1)[0].strip().lower()
+
+
+class EntryFilter:
+    """Derlenmiş include / exclude filtreleri
+
+    Domain filtreleri alt domain'leri de kapsar (example.com,
+    api.example.com'u da eşler). MIME filtreleri önek olarak eşleşir
+    (image/ tüm resimleri eşler). Status filtrelerinde 404 gibi kodlar ya da
+    4xx gibi sınıflar kullanılabilir.
+    """
+
+    def __init__(self, include_domains=(), exclude_domains=(), include_methods=(), exclude_methods=(),
+                 include_mime=(), exclude_mime=(), include_status=(), exclude_status=(),
+                 include_url=(), exclude_url=(), include_resource_types=(), exclude_resource_types=()):
+        self.include_domains = tuple(domain.lower().lstrip('.') for domain in include_domains)
+        self.exclude_domains = tuple(domain.lower().lstrip('.') for domain in exclude_domains)
+        self.include_methods = frozenset(method.upper() for method in include_methods)
+        self.exclude_methods = frozenset(method.upper() for method in exclude_methods)
+        self.include_mime = tuple(_mime_base(mime) for mime in include_mime)
+        self.exclude_mime = tuple(_mime_base(mime) for mime in exclude_mime)
+        self.include_status = _status_rules(include_status)
+        self.exclude_status = _status_rules(exclude_status)
+        self.include_url = _compile_patterns(include_url)
+        self.exclude_url = _compile_patterns(exclude_url)
+        self.include_resource_types = frozenset(kind.lower() for kind in include_resource_types)
+        self.exclude_resource_types = frozenset(kind.lower() for kind in exclude_resource_types)
+        self._spec = {
+            "include_domains": list(include_domains), "exclude_domains": list(exclude_domains),
+            "include_methods": list(include_methods), "exclude_methods": list(exclude_methods),
+            "include_mime": list(include_mime), "exclude_mime": list(exclude_mime),
+            "include_status": [str(value) for value in include_status],
+            "exclude_status": [str(value) for value in exclude_status],
+            "include_url": list(include_url), "exclude_url": list(exclude_url),
+            "include_resource_types": list(include_resource_types),
+            "exclude_resource_types": list(exclude_resource_types)
+        }
+        # Kararı etkileyen alanlar (boşsa filtre hiçbir şeyi elemez)
+        self._needed = set()
+        if self.include_domains or self.exclude_domains or self.include_url or self.exclude_url:
+            self._needed.add('url')
+        if self.include_methods or self.exclude_methods:
+            self._needed.add('method')
+        if self.include_mime or self.exclude_mime:
+            self._needed.add('mime_type')
+        if self.include_status or self.exclude_status:
+            self._needed.add('status')
+        if self.include_resource_types or self.exclude_resource_types:
+            self._needed.add('resource_type')
+        # Son apply() çağrısında atlanan entry sayısı
+        self.rejected_count = 0
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Filtre dict'inden (EntryFilter.signature() formatı) EntryFilter oluşturur"""
+        return cls(**{key: value for key, value in data.items() if value})
+
+    def __bool__(self):
+        return bool(self._needed)
+
+    def signature(self):
+        """Filtreyi JSON'a yazılabilir bir dict olarak döndürür"""
+        return {key: value for key, value in self._spec.items() if value}
+
+    def _domain_matches(self, host: str, domains):
+        return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+    def _mime_matches(self, mime_type: str, prefixes):
+        return any(mime_type.startswith(prefix) for prefix in prefixes)
+
+    def _accepts(self, fields: dict):
+        """Alanlara göre kararı verir; eksik alanlar include kısıtlarını karşılamaz"""
+        url = fields.get('url', '')
+        if self.include_domains or self.exclude_domains:
+            host = (urlsplit(url).hostname or '') if url else ''
+            if self.include_domains and not self._domain_matches(host, self.include_domains):
+                return False
+            if self.exclude_domains and self._domain_matches(host, self.exclude_domains):
+                return False
+        if self.include_url and not self.include_url.search(url):
+            return False
+        if self.exclude_url and self.exclude_url.search(url):
+            return False
+
+        method = fields.get('method', '').upper()
+        if self.include_methods and method not in self.include_methods:
+            return False
+        if method in self.exclude_methods:
+            return False
+
+        if self.include_mime or self.exclude_mime:
+            mime_type = _mime_base(fields.get('mime_type', ''))
+            if self.include_mime and not self._mime_matches(mime_type, self.include_mime):
+                return False
+            if self.exclude_mime and self._mime_matches(mime_type, self.exclude_mime):
+                return False
+
+        status = fields.get('status')
+        if self.include_status and (status is None or not _status_matches(status, self.include_status)):
+            return False
+        if self.exclude_status and status is not None and _status_matches(status, self.exclude_status):
+            return False
+
+        resource_type = fields.get('resource_type', '').lower()
+        if self.include_resource_types and resource_type not in self.include_resource_types:
+            return False
+        if resource_type in self.exclude_resource_types:
+            return False
+        return True
+
+    def matches(self, entry: dict):
+        """Parse edilmiş entry filtrelerden geçiyorsa True"""
+        return self._accepts(entry_fields(entry))
+
+    def apply(self, entries, parse: bool = True):
+        """Entry akışını filtreler
+
+        Entry'ler dict ya da ham JSON metni olabilir. Ham metinlerde karar
+        parse etmeden, raw_entry_fields ile çıkarılan alanlara göre verilir;
+        geçen entry'ler parse=True ise dict, değilse ham metin olarak
+        üretilir.
+        """
+        self.rejected_count = 0
+        for entry in entries:
+            if isinstance(entry, str):
+                if not self._accepts(raw_entry_fields(entry)):
+                    self.rejected_count += 1
+                    continue
+                yield json_codec.loads(entry) if parse else entry
+            elif self.matches(entry):
+                yield entry
+            else:
+                self.rejected_count += 1
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentetik HAR Üretici
+Benchmark ve testler için deterministik (aynı seed -> byte byte aynı dosya)
+HAR dosyaları üretir. Entry sayısı, domain sayısı, body boyutu, base64
+response oranı ve header sayısı ayarlanabilir. Entry'ler üretildikçe diske
+yazılır; milyonlarca entry'lik dosyalar da sabit bellekle oluşturulur.
+
+Kullanım:
+    python har_generator.py synthetic.har --entries 100000 --domains 20 --body-size 2048
+"""
+
+import argparse
+import base64
+import random
+from datetime import datetime, timedelta, timezone
+
+import json_codec
+from compressed_io import open_text
+
+DEFAULT_ENTRIES = 1000
+DEFAULT_DOMAINS = 5
+DEFAULT_BODY_SIZE = 512
+DEFAULT_BASE64_RATIO = 0.1
+DEFAULT_HEADERS = 8
+
+_START_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_RESOURCES = ('users', 'orders', 'products', 'carts', 'sessions', 'reports', 'invoices', 'search')
+_METHODS = ('GET', 'GET', 'GET', 'POST', 'PUT', 'DELETE')
+_STATUSES = (200, 200, 200, 200, 201, 204, 304, 404, 500)
+_HEADER_NAMES = ('Accept', 'Accept-Language', 'Authorization', 'Cache-Control', 'Cookie', 'Origin',
+                 'Referer', 'User-Agent', 'X-Request-Id', 'X-Client-Version', 'X-Trace-Id', 'Sec-Fetch-Mode')
+_WORDS = ('alpha', 'beta', 'gamma', 'delta', 'çağrı', 'şehir', 'öğe', 'ürün', 'kalem', 'değer')
+
+
+def _text_body(rng: random.Random, size: int):
+    """Yaklaşık size byte'lık bir JSON body metni"""
+    items = []
+    length = 2
+    while length < size:
+        item = {"id": rng.randrange(1, 10 ** 6), "name": rng.choice(_WORDS), "active": rng.random() < 0.5}
+        items.append(item)
+        length += 50
+    return json_codec.dumps({"items": items}, compact=True)
+
+
+def synthetic_entry(rng: random.Random, index: int, domains: int = DEFAULT_DOMAINS,
+                    body_size: int = DEFAULT_BODY_SIZE, base64_ratio: float = DEFAULT_BASE64_RATIO,
+                    headers: int = DEFAULT_HEADERS):
+    """index numaralı sentetik HAR entry'sini üretir"""
+    host = f"api{rng.randrange(domains)}.example.com"
+    resource = rng.choice(_RESOURCES)
+    method = rng.choice(_METHODS)
+    url = f"https://{host}/v1/{resource}/{rng.randrange(1, 10 ** 5)}?page={rng.randrange(1, 50)}&lang=tr"
+
+    request = {
+        "method": method,
+        "url": url,
+        "httpVersion": "HTTP/1.1",
+        "headers": [{"name": _HEADER_NAMES[position % len(_HEADER_NAMES)], "value": f"value-{rng.randrange(10 ** 6)}"}
+                    for position in range(headers)],
+        "queryString": [],
+        "cookies": [],
+        "headersSize": -1,
+        "bodySize": 0
+    }
+    if method in ('POST', 'PUT'):
+        text = _text_body(rng, body_size)
+        request["postData"] = {"mimeType": "application/json", "text": text}
+        request["bodySize"] = len(text.encode('utf-8'))
+
+    if rng.random() < base64_ratio:
+        content = {
+            "size": body_size,
+            "mimeType": "image/png",
+            "encoding": "base64",
+            "text": base64.b64encode(rng.randbytes(body_size)).decode('ascii')
+        }
+    else:
+        text = _text_body(rng, body_size)
+        content = {"size": len(text.encode('utf-8')), "mimeType": "application/json; charset=utf-8", "text": text}
+
+    wait = round(rng.lognormvariate(4, 0.8), 3)
+    timings = {"blocked": round(rng.uniform(0, 5), 3), "dns": -1, "connect": -1, "ssl": -1,
+               "send": round(rng.uniform(0, 2), 3), "wait": wait, "receive": round(rng.uniform(0, 20), 3)}
+    return {
+        "startedDateTime": (_START_TIME + timedelta(milliseconds=index * 37)).isoformat(timespec='milliseconds')
+        .replace('+00:00', 'Z'),
+        "time": round(sum(value for value in timings.values() if value > 0), 3),
+        "request": request,
+        "response": {
+            "status": rng.choice(_STATUSES),
+            "statusText": "",
+            "httpVersion": "HTTP/1.1",
+            "headers": [{"name": "Content-Type", "value": content["mimeType"]},
+                        {"name": "Content-Length", "value": str(content["size"])}],
+            "cookies": [],
+            "content": content,
+            "redirectURL": "",
+            "headersSize": -1,
+            "bodySize": content["size"],
+            "_transferSize": content["size"] + 200
+        },
+        "cache": {},
+        "timings": timings,
+        "_resourceType": "fetch" if method != 'GET' else "xhr"
+    }
+
+
+def iter_synthetic_entries(entries: int = DEFAULT_ENTRIES, seed: int = 0, **options):
+    """Aynı seed ile her zaman aynı sırada aynı entry'leri üretir"""
+    rng = random.Random(seed)
+    for index in range(entries):
+        yield synthetic_entry(rng, index, **options)
+
+
+def generate_har(path: str, entries: int = DEFAULT_ENTRIES, domains: int = DEFAULT_DOMAINS,
+                 body_size: int = DEFAULT_BODY_SIZE, base64_ratio: float = DEFAULT_BASE64_RATIO,
+                 headers: int = DEFAULT_HEADERS, seed: int = 0):
+    """Sentetik HAR dosyasını entry entry diske yazar (.gz / .zst uzantısında sıkıştırır)
+
+    Returns:
+        Yazılan entry sayısı
+    """
+    with open_text(path, 'w') as f:
+        f.write('{"log": {"version": "1.2", "creator": {"name": "har_generator", "version": "1.0"}, '
+                '"entries": [\n')
+        for index, entry in enumerate(iter_synthetic_entries(entries, seed, domains=domains, body_size=body_size,
+                                                             base64_ratio=base64_ratio, headers=headers)):
+            if index:
+                f.write(',\n')
+            f.write(json_codec.dumps(entry, compact=True))
+        f.write('\n]}}\n')
+    return entries
+
+
+def main():
+    """Komut satırından sentetik HAR üretimi"""
+    parser = argparse.ArgumentParser(description='Sentetik HAR üretici')
+    parser.add_argument('output', help='Çıktı HAR dosyası (.gz / .zst uzantısı sıkıştırır)')
+    parser.add_argument('--entries', type=int, default=DEFAULT_ENTRIES, help='Entry sayısı (varsayılan: %(default)s)')
+    parser.add_argument('--domains', type=int, default=DEFAULT_DOMAINS, help='Domain sayısı (varsayılan: %(default)s)')
+    parser.add_argument('--body-size', type=int, default=DEFAULT_BODY_SIZE, metavar='BYTES',
+                        help='Request / response body boyutu (varsayılan: %(default)s)')
+    parser.add_argument('--base64-ratio', type=float, default=DEFAULT_BASE64_RATIO,
+                        help='base64 kodlanmış (binary) response oranı (varsayılan: %(default)s)')
+    parser.add_argument('--headers', type=int, default=DEFAULT_HEADERS,
+                        help='Request başına header sayısı (varsayılan: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='Rastgelelik tohumu (varsayılan: %(default)s)')
+    args = parser.parse_args()
+
+    print(f"🔄 {args.entries} entry üretiliyor: {args.output}")
+    generate_har(args.output, args.entries, args.domains, args.body_size, args.base64_ratio, args.headers, args.seed)
+    print(f"✅ Sentetik HAR oluşturuldu: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR SQLite İndeksi
+Büyük HAR dosyalarını akış modunda okuyup her entry için bir satır içeren
+bir SQLite veritabanı oluşturur. Satırlarda entry'nin HAR içindeki byte
+aralığı da tutulur; sorgu sonucundaki entry'ler HAR'ın tamamı okunmadan,
+doğrudan o aralıktan okunup Postman collection'ına çevrilebilir.
+
+Kullanım:
+    python har_index.py build capture.har capture.db
+    python har_index.py query capture.db --host api.example.com --status 5xx
+    python har_index.py query capture.db --where "time > 2000" --export slow.json
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+
+import json_codec
+from compressed_io import open_binary
+from har_analytics import TIMING_PHASES, transfer_size
+from har_stream import iter_har_entries_with_offsets
+from url_cache import canonical_url
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Tek sorguda döndürülen satırların varsayılan üst sınırı
+DEFAULT_QUERY_LIMIT = 1000
+
+_COLUMNS = (
+    ('entry_index', 'INTEGER'), ('method', 'TEXT'), ('url', 'TEXT'), ('host', 'TEXT'), ('path', 'TEXT'),
+    ('status', 'INTEGER'), ('mime', 'TEXT'), ('started', 'TEXT'), ('time', 'REAL'),
+) + tuple((phase, 'REAL') for phase in TIMING_PHASES) + (
+    ('request_body_size', 'INTEGER'), ('response_body_size', 'INTEGER'), ('transfer_size', 'INTEGER'),
+    ('byte_offset', 'INTEGER'), ('byte_length', 'INTEGER'),
+)
+COLUMN_NAMES = tuple(name for name, _ in _COLUMNS)
+INDEXED_COLUMNS = ('host', 'path', 'status', 'started')
+
+
+def _positive(value):
+    """HAR'daki -1 / eksik değerleri NULL'a çevirir"""
+    return None if value is None or value < 0 else value
+
+
+def entry_row(entry_index: int, entry: dict, byte_offset: int, byte_length: int):
+    """Entry'yi entries tablosunun satırına çevirir; request'i yoksa None"""
+    request = entry.get('request')
+    if not request:
+        return None
+    url = request.get('url', '')
+    parsed_url = canonical_url(url) if url else None
+    response = entry.get('response') or {}
+    timings = entry.get('timings') or {}
+    return (
+        entry_index,
+        request.get('method', 'GET').upper(),
+        url,
+        parsed_url.netloc if parsed_url else '',
+        (parsed_url.path or '/') if parsed_url else '',
+        response.get('status'),
+        (response.get('content') or {}).get('mimeType', '').split(';')[0].strip(),
+        entry.get('startedDateTime'),
+        _positive(entry.get('time')),
+        *(_positive(timings.get(phase)) for phase in TIMING_PHASES),
+        _positive(request.get('bodySize')),
+        _positive(response.get('bodySize')),
+        transfer_size(response),
+        byte_offset,
+        byte_length
+    )
+
+
+def build_index(har_file_path: str, db_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+    """HAR dosyasını akış modunda okuyup SQLite indeksini (yeniden) oluşturur
+
+    Satırlar batch_size'lık gruplar halinde executemany ile eklenir;
+    index'ler tüm satırlar eklendikten sonra bir kez oluşturulur.
+
+    Returns:
+        İndekslenen entry sayısı
+    """
+    temp_path = db_path + '.tmp'
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+    stat = os.stat(har_file_path)
+    connection = sqlite3.connect(temp_path)
+    try:
+        # Veritabanı sonda yerine konduğundan yarıda kalan yazma sorun olmaz
+        connection.execute('PRAGMA journal_mode = OFF')
+        connection.execute('PRAGMA synchronous = OFF')
+        connection.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)')
+        connection.execute(
+            'CREATE TABLE entries (id INTEGER PRIMARY KEY, '
+            + ', '.join(f'{name} {kind}' for name, kind in _COLUMNS) + ')')
+
+        insert = (f'INSERT INTO entries ({", ".join(COLUMN_NAMES)}) '
+                  f'VALUES ({", ".join("?" for _ in COLUMN_NAMES)})')
+        batch = []
+        entry_count = 0
+        for entry_index, (start, end, raw) in enumerate(iter_har_entries_with_offsets(har_file_path, raw=True)):
+            entry_count += 1
+            row = entry_row(entry_index, json_codec.loads(raw), start, end - start)
+            if row is None:
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                connection.executemany(insert, batch)
+                batch = []
+        if batch:
+            connection.executemany(insert, batch)
+
+        for name in INDEXED_COLUMNS:
+            connection.execute(f'CREATE INDEX idx_entries_{name} ON entries ({name})')
+        connection.executemany('INSERT INTO meta (key, value) VALUES (?, ?)', [
+            ('har_file', os.path.abspath(har_file_path)),
+            ('size', str(stat.st_size)),
+            ('mtime_ns', str(stat.st_mtime_ns)),
+            ('entry_count', str(entry_count)),
+        ])
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(temp_path, db_path)
+    return entry_count
+
+
+def _status_condition(status: str):
+    """'500' ya da '5xx' biçimindeki status filtresini SQL koşuluna çevirir"""
+    status = str(status).strip().lower()
+    if len(status) == 3 and status.endswith('xx') and status[0].isdigit():
+        low = int(status[0]) * 100
+        return 'status BETWEEN ? AND ?', (low, low + 99)
+    return 'status = ?', (int(status),)
+
+
+class HarIndex:
+    """build_index ile oluşturulmuş indeks üzerinde sorgu ve entry okuma"""
+
+    def __init__(self, db_path: str):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"İndeks bulunamadı: {db_path}")
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.meta = dict(self.connection.execute('SELECT key, value FROM meta'))
+        self.har_file_path = self.meta['har_file']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def is_stale(self):
+        """HAR dosyası indekslendikten sonra değiştiyse True"""
+        try:
+            stat = os.stat(self.har_file_path)
+        except OSError:
+            return True
+        return (str(stat.st_size) != self.meta['size']
+                or str(stat.st_mtime_ns) != self.meta['mtime_ns'])
+
+    def query(self, where: str = None, params=(), host: str = None, method: str = None, status=None,
+              path: str = None, since: str = None, until: str = None, order_by: str = 'entry_index',
+              limit: int = DEFAULT_QUERY_LIMIT):
+        """Filtrelere uyan satırları döndürür
+
+        host ve method tam eşleşir; path SQL LIKE desenidir (örn.
+        '/api/users/%'); status '404' ya da '4xx' olabilir; since / until
+        startedDateTime ile (ISO 8601 metin) karşılaştırılır. where ile ek
+        bir SQL koşulu verilebilir (ör. 'time > ?' ve params=(2000,)).
+        """
+        if order_by not in COLUMN_NAMES:
+            raise ValueError(f"Bilinmeyen sıralama sütunu: {order_by}")
+        conditions = []
+        values = []
+        for column, value in (('host', host), ('method', method.upper() if method else None)):
+            if value:
+                conditions.append(f'{column} = ?')
+                values.append(value)
+        if status is not None:
+            condition, status_values = _status_condition(status)
+            conditions.append(condition)
+            values.extend(status_values)
+        if path:
+            conditions.append('path LIKE ?')
+            values.append(path)
+        if since:
+            conditions.append('started >= ?')
+            values.append(since)
+        if until:
+            conditions.append('started < ?')
+            values.append(until)
+        if where:
+            conditions.append(f'({where})')
+            values.extend(params)
+
+        sql = 'SELECT * FROM entries'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += f' ORDER BY {order_by}'
+        if limit:
+            sql += ' LIMIT ?'
+            values.append(limit)
+        return self.connection.execute(sql, values).fetchall()
+
+    def read_entries(self, rows):
+        """Satırların işaret ettiği entry'leri HAR'dan byte aralıklarıyla okur
+
+        Okumalar dosyada ileri doğru yapılır; entry'ler satırların sırasıyla döner.
+        """
+        if self.is_stale():
+            raise ValueError(f"HAR dosyası indekslendikten sonra değişmiş: {self.har_file_path}")
+        entries = {}
+        with open_binary(self.har_file_path) as f:
+            for row in sorted(rows, key=lambda row: row['byte_offset']):
+                f.seek(row['byte_offset'])
+                entries[row['id']] = json_codec.loads(f.read(row['byte_length']))
+        return [entries[row['id']] for row in rows]
+
+    def to_collection(self, rows, collection_name: str = None, **options):
+        """Satırlardaki entry'leri Postman collection'ına çevirir
+
+        options (header_policy, responses, ...) har_to_postman ile aynıdır.
+        """
+        from har_to_postman import collection_from_entries
+
+        if not collection_name:
+            collection_name = f"HAR Index - {os.path.basename(self.har_file_path)}"
+        return collection_from_entries(self.read_entries(rows), self.har_file_path, collection_name, **options)
+
+
+def print_rows(rows):
+    """Sorgu sonucunu tablo olarak yazdırır"""
+    print(f"{'#':>7}  {'Method':<7}  {'Status':>6}  {'Süre ms':>9}  {'Başlangıç':<24}  URL")
+    print("-" * 100)
+    for row in rows:
+        time = f"{row['time']:.1f}" if row['time'] is not None else '-'
+        url = row['url'] if len(row['url']) <= 80 else row['url'][:77] + '...'
+        print(f"{row['entry_index']:>7}  {row['method']:<7}  {row['status'] if row['status'] is not None else '-':>6}  "
+              f"{time:>9}  {row['started'] or '-':<24}  {url}")
+
+
+def main():
+    """Komut satırından indeks oluşturma ve sorgulama"""
+    parser = argparse.ArgumentParser(description='HAR SQLite indeksi')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='HAR dosyasını indeksle')
+    build.add_argument('har_file', help='HAR dosyası yolu')
+    build.add_argument('db_file', nargs='?', help='Veritabanı yolu (varsayılan: <har>.db)')
+
+    query = commands.add_parser('query', help='İndeksi sorgula')
+    query.add_argument('db_file', help='Veritabanı yolu')
+    query.add_argument('--host', help='Host (tam eşleşme)')
+    query.add_argument('--method', help='HTTP method')
+    query.add_argument('--status', help='Status kodu ya da sınıfı (404, 5xx)')
+    query.add_argument('--path', help='Path LIKE deseni (örn. /api/users/%%)')
+    query.add_argument('--since', help='Bu zamandan sonra başlayanlar (ISO 8601)')
+    query.add_argument('--until', help='Bu zamandan önce başlayanlar (ISO 8601)')
+    query.add_argument('--where', help='Ek SQL koşulu (örn. "time > 2000")')
+    query.add_argument('--limit', type=int, default=DEFAULT_QUERY_LIMIT, help='En fazla satır (0: sınırsız)')
+    query.add_argument('--export', metavar='FILE', help='Sonuçları Postman collection olarak kaydet')
+    query.add_argument('--name', help='Export edilen collection adı')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        db_file = args.db_file or args.har_file + '.db'
+        print(f"🔄 İndeksleniyor: {args.har_file}")
+        try:
+            count = build_index(args.har_file, db_file)
+        except (OSError, ValueError) as e:
+            print(f"❌ HAR indekslenirken hata: {e}")
+            sys.exit(1)
+        print(f"✅ {count} entry indekslendi: {db_file}")
+        return
+
+    try:
+        with HarIndex(args.db_file) as index:
+            rows = index.query(args.where, (), args.host, args.method, args.status, args.path,
+                               args.since, args.until, limit=args.limit)
+            print_rows(rows)
+            print(f"\n📊 {len(rows)} entry bulundu")
+            if args.export:
+                collection = index.to_collection(rows, args.name)
+                json_codec.write_json_file(collection, args.export)
+                print(f"✅ Postman collection oluşturuldu: {args.export}")
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"❌ İndeks sorgulanırken hata: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
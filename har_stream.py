@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Streaming Okuyucu
+Büyük HAR dosyalarını tamamını belleğe almadan okur. log.entries dizisi
+entry entry parse edilir; bellek kullanımı dosya boyutuna değil en büyük
+tek entry'nin boyutuna bağlıdır.
+
+Entry'lerin dosyadaki byte aralıkları da üretilebilir; okuma daha sonra
+bir entry'nin bittiği byte'tan devam ettirilebilir.
+"""
+
+import io
+import json
+import re
+
+import json_codec
+from compressed_io import open_binary, open_text
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(r'[^,\]}\s]*')
+
+
+class HarEntryReader:
+    """log.entries dizisini tek tek okuyan artımlı HAR parser'ı
+
+    start_offset verilirse dosya log.entries içinde bir entry'nin bittiği
+    byte'a konumlanmış kabul edilir ve okuma doğrudan sonraki entry'den
+    başlar. Byte offset'leri dosya newline='' ile açıldığında doğrudur.
+    """
+
+    def __init__(self, fileobj, chunk_size: int = DEFAULT_CHUNK_SIZE, raw: bool = False,
+                 start_offset: int = None):
+        self._file = fileobj
+        self._chunk_size = chunk_size
+        # raw=True ise entry'ler parse edilmeden ham JSON metni olarak üretilir
+        self._raw = raw
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._resume = start_offset is not None
+        # Byte offset takibi: buffer'daki _cursor karakterinin dosyadaki byte konumu
+        self._track_offsets = False
+        self._cursor = 0
+        self._cursor_bytes = start_offset or 0
+
+    def __iter__(self):
+        return self._entries(with_offsets=False)
+
+    def iter_with_offsets(self):
+        """(başlangıç byte'ı, bitiş byte'ı, entry) üçlüleri üretir"""
+        return self._entries(with_offsets=True)
+
+    def _entries(self, with_offsets: bool):
+        self._track_offsets = with_offsets
+        if self._resume:
+            yield from self._iter_array(with_offsets)
+            return
+        self._expect('{')
+        if self._find_key('log'):
+            self._expect('{')
+            if self._find_key('entries'):
+                self._expect('[')
+                yield from self._iter_array(with_offsets)
+                return
+        raise ValueError("Geçersiz HAR dosyası formatı")
+
+    def _byte_offset(self, index: int):
+        """Buffer index'inin dosyadaki byte konumu (index'ler artan sırada sorulmalı)"""
+        self._cursor_bytes += len(self._buf[self._cursor:index].encode('utf-8'))
+        self._cursor = index
+        return self._cursor_bytes
+
+    def _fill(self):
+        """Buffer'a yeni veri okur ve tüketilmiş kısmı atar"""
+        if self._eof:
+            return False
+        # Bekleyen veri kadar oku ki büyük entry'lerde tarama lineer kalsın
+        pending = len(self._buf) - self._pos
+        chunk = self._file.read(max(self._chunk_size, pending))
+        if not chunk:
+            self._eof = True
+            return False
+        if self._track_offsets:
+            self._byte_offset(self._pos)
+            self._cursor = 0
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        """Boşlukları atlayıp sıradaki karakteri döndürür"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError("Geçersiz HAR dosyası formatı")
+        self._pos += 1
+
+    def _need_more(self):
+        if not self._fill():
+            raise ValueError("HAR dosyası beklenmedik şekilde sona erdi")
+
+    def _value_end(self):
+        """Sıradaki JSON değerinin bittiği index'i bulur (parse etmeden)"""
+        if self._peek() not in '{["':
+            return self._scalar_end()
+        depth = 0
+        scan = self._pos
+        while True:
+            match = _STRUCTURAL.search(self._buf, scan)
+            if match is None:
+                relative = len(self._buf) - self._pos
+                self._need_more()
+                scan = self._pos + relative
+                continue
+            char = match.group()
+            index = match.start()
+            if char == '"':
+                string_end = _STRING_END.match(self._buf, index + 1)
+                if string_end is None:
+                    # String buffer sonunda yarım kaldı, başından tekrar dene
+                    relative = index - self._pos
+                    self._need_more()
+                    scan = self._pos + relative
+                    continue
+                scan = string_end.end()
+                if depth == 0:
+                    return scan
+            elif char in '{[':
+                depth += 1
+                scan = index + 1
+            else:
+                depth -= 1
+                scan = index + 1
+                if depth == 0:
+                    return scan
+
+    def _scalar_end(self):
+        """Sayı, true/false/null gibi basit değerlerin sonunu bulur"""
+        while True:
+            end = _SCALAR.match(self._buf, self._pos).end()
+            if end < len(self._buf) or self._eof:
+                return end
+            self._need_more()
+
+    def _read_raw(self):
+        """Sıradaki değerin ham JSON metnini döndürür ve okuma noktasını ilerletir"""
+        end = self._value_end()
+        raw = self._buf[self._pos:end]
+        self._pos = end
+        return raw
+
+    def _find_key(self, name: str):
+        """Bulunulan objede verilen key'e kadar ilerler, diğer değerleri atlar"""
+        while True:
+            char = self._peek()
+            if char == ',':
+                self._pos += 1
+                continue
+            if char != '"':
+                return False
+            key = json.loads(self._read_raw())
+            self._expect(':')
+            if key == name:
+                return True
+            self._pos = self._value_end()
+
+    def _iter_array(self, with_offsets: bool = False):
+        """Bulunulan dizinin elemanlarını tek tek parse ederek üretir"""
+        while True:
+            char = self._peek()
+            if char == ']':
+                self._pos += 1
+                return
+            if char == ',':
+                self._pos += 1
+                continue
+            if not char:
+                raise ValueError("HAR dosyası beklenmedik şekilde sona erdi")
+            start = self._byte_offset(self._pos) if with_offsets else None
+            raw = self._read_raw()
+            entry = raw if self._raw else json_codec.loads(raw)
+            if with_offsets:
+                yield start, self._byte_offset(self._pos), entry
+            else:
+                yield entry
+
+
+def iter_har_entries(har_file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, raw: bool = False):
+    """HAR dosyasındaki entry'leri dosyayı tamamen yüklemeden tek tek üretir
+
+    raw=True verilirse entry'ler parse edilmeden JSON metni olarak döner;
+    parse işi örneğin worker process'lere bırakılabilir. gzip / zstd ile
+    sıkıştırılmış dosyalar diske açılmadan okunur.
+    """
+    with open_text(har_file_path) as f:
+        yield from HarEntryReader(f, chunk_size, raw)
+
+
+def iter_har_entries_with_offsets(har_file_path: str, start_offset: int = None,
+                                  chunk_size: int = DEFAULT_CHUNK_SIZE, raw: bool = False):
+    """Entry'leri dosyadaki byte aralıklarıyla birlikte (başlangıç, bitiş, entry) olarak üretir
+
+    start_offset verilirse okuma o byte'tan, yani daha önce okunmuş son
+    entry'nin bitişinden devam eder. Sıkıştırılmış dosyalarda offset'ler
+    açılmış içeriğe göredir.
+    """
+    with open_binary(har_file_path) as binary:
+        if start_offset:
+            binary.seek(start_offset)
+        with io.TextIOWrapper(binary, encoding='utf-8', newline='') as f:
+            yield from HarEntryReader(f, chunk_size, raw, start_offset).iter_with_offsets()
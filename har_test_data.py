@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Test Verisi
+Test modüllerinin paylaştığı örnek HAR'lar ve geçici HAR dosyası yazan
+yardımcı. SAMPLE_HAR okuyucu / çevirici testleri için uç durumlar
+(request olmayan entry, kaçış karakterleri) içerir; HAR ise filtre
+alanlarının (domain, method, status, MIME, resource type) farklı
+değerlerini kapsar.
+"""
+
+import json
+import os
+import tempfile
+
+SAMPLE_HAR = {
+    "log": {
+        "version": "1.2",
+        "creator": {"name": "test", "version": "1.0"},
+        "pages": [{"id": "page_1", "title": "a \"quoted\" [title] {x}"}],
+        "entries": [
+            {
+                "request": {
+                    "method": "GET",
+                    "url": "https://api.example.com/users/42?page=1&q=%7B%7D",
+                    "headers": [{"name": "Host", "value": "api.example.com"},
+                                {"name": "Accept", "value": "application/json"}],
+                    "queryString": []
+                },
+                "time": 12.5
+            },
+            {"comment": "request olmayan entry"},
+            {
+                "request": {
+                    "method": "post",
+                    "url": "https://cdn.example.org/upload",
+                    "headers": [{"name": "Content-Type", "value": "application/json"}],
+                    "postData": {"mimeType": "application/json",
+                                 "text": "{\"ad\": \"Çağrı\", \"yol\": \"C:\\\\temp\\\\\", \"liste\": [1, 2]}"}
+                }
+            }
+        ]
+    }
+}
+
+
+def write_sample_har(data=SAMPLE_HAR):
+    """HAR verisini geçici bir .har dosyasına yazar; dosyayı silmek çağırana aittir"""
+    fd, path = tempfile.mkstemp(suffix='.har')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def har_entry(url, method="GET", status=200, mime_type="application/json", resource_type=None, body=""):
+    """Filtre alanlarının hepsini içeren bir HAR entry'si"""
+    entry = {
+        "_initiator": {"type": "script", "stack": {"callFrames": [{"url": "https://cdn.example.org/app.js"}]}},
+        "request": {"method": method, "url": url, "headers": [], "queryString": []},
+        "response": {
+            "status": status,
+            "headers": [],
+            "content": {"size": len(body), "mimeType": mime_type, "text": body}
+        }
+    }
+    if resource_type:
+        entry["_resourceType"] = resource_type
+    return entry
+
+
+ENTRIES = [
+    har_entry("https://api.example.com/users", resource_type="xhr",
+           body='{"status": 500, "url": "https://evil.test/", "mimeType": "image/png"}'),
+    har_entry("https://static.example.com/logo.png", mime_type="image/png", resource_type="image"),
+    har_entry("https://www.google-analytics.com/collect?v=1", method="POST", status=204, mime_type="text/plain",
+           resource_type="ping"),
+    har_entry("https://api.example.com/orders", method="POST", status=404, resource_type="fetch"),
+    har_entry("https://api.example.com/login", status=302, mime_type="text/html; charset=utf-8"),
+]
+
+HAR = {"log": {"version": "1.2", "entries": ENTRIES}}
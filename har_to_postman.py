@@ -5,77 +5,95 @@ HAR to Postman Collection Converter
 Bu script HAR (HTTP Archive) dosyalarını Postman collection formatına çevirir.
 """
 
+import argparse
+import contextlib
+import glob
+import io
 import json
 import os
 import sys
+import time
 import uuid
-from urllib.parse import urlparse, parse_qs
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 
-def har_to_postman_collection(har_file_path: str, collection_name: str = None):
-    """HAR dosyasını Postman collection'ına çevirir"""
+from collection_shards import SHARD_MANIFEST_NAME, SHARD_MODES, ShardWriter
+from collection_writer import (StreamingCollectionWriter, append_to_collection, has_collection_layout,
+                               serialize_request)
+from compressed_io import COMPRESSION_SUFFIXES, detect_compression, strip_compression_suffix
+from conversion_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, ConversionCache
+import json_codec
+from har_checkpoint import (load_checkpoint, new_prefix_hasher, options_fingerprint, save_checkpoint,
+                            update_prefix_hash, verify_checkpoint)
+from har_dedup import RequestDeduplicator
+from har_filter import EntryFilter
+from header_policy import DEFAULT_HEADER_POLICY, HeaderPolicy, load_header_policy
+from profiling import count, profile_iter, profiling, stage
+from path_template import PathTemplateTrie, apply_path_templates, build_path_trie
+from response_examples import (DEFAULT_MAX_BODY_SIZE, DEFAULT_RESPONSE_BUDGET, HAR_RESPONSE_KEY,
+                               ResponseExampleBuilder)
+from url_cache import canonical_url, merge_query_params
+from har_stream import iter_har_entries, iter_har_entries_with_offsets
+
+# Paralel çevirmede worker'a tek seferde gönderilen entry sayısı
+PARALLEL_CHUNK_SIZE = 2000
+
+# Batch modunda çıktı dizininde tutulan güncellik manifest'i
+BATCH_MANIFEST_NAME = '.har_batch_manifest.json'
+
+def har_to_postman_collection(har_file_path: str, collection_name: str = None, stream: bool = False,
+                              workers: int = 1, dedupe: bool = False, dedupe_examples: int = 0,
+                              template_paths: bool = False, header_policy: HeaderPolicy = None,
+                              responses: bool = False, max_response_body: int = DEFAULT_MAX_BODY_SIZE,
+                              response_budget: int = DEFAULT_RESPONSE_BUDGET, entry_filter: EntryFilter = None,
+                              cache: ConversionCache = None):
+    """HAR dosyasını Postman collection'ına çevirir
+
+    Seçenekler ilgili aşamaların sınıflarında açıklanır: EntryFilter,
+    HeaderPolicy, PathTemplateTrie, RequestDeduplicator,
+    ResponseExampleBuilder ve ConversionCache.
+    """
     try:
-        # HAR dosyasını yükle
-        with open(har_file_path, 'r', encoding='utf-8') as f:
-            har_data = json.load(f)
-        
-        if 'log' not in har_data or 'entries' not in har_data['log']:
-            raise ValueError("Geçersiz HAR dosyası formatı")
-        
-        entries = har_data['log']['entries']
-        
-        # Collection adını belirle
-        if not collection_name:
-            collection_name = f"HAR Import - {os.path.basename(har_file_path)}"
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key(har_file_path, {
+                "dedupe": dedupe,
+                "dedupe_examples": dedupe_examples if dedupe else None,
+                "template_paths": template_paths,
+                "header_policy": header_policy,
+                "responses": responses,
+                "max_response_body": max_response_body if responses else None,
+                "response_budget": response_budget if responses else None,
+                "entry_filter": entry_filter or None
+            })
+            collection = cache.get(cache_key)
+            if collection is not None:
+                # Ad, açıklama ve _postman_id bu çevirmeye ait olmalı
+                collection["info"] = collection_info(har_file_path, collection_name)
+                count('cache_hits')
+                total_requests = sum(len(folder.get("item", [])) for folder in collection["item"])
+                print(f"⚡ Cache'ten alındı: {total_requests} istek {len(collection['item'])} domain'de")
+                return collection
         
-        # Postman collection template
+        requests, response_builder = _request_stream(har_file_path, stream, workers, dedupe, dedupe_examples,
+                                                     template_paths, header_policy, responses, max_response_body,
+                                                     response_budget, entry_filter)
         collection = {
-            "info": {
-                "name": collection_name,
-                "description": f"HAR dosyasından çevrildi: {har_file_path}",
-                "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
-                "_postman_id": str(uuid.uuid4())
-            },
+            "info": collection_info(har_file_path, collection_name),
             "item": []
         }
+        with stage('grouping'):
+            total_requests = merge_into_collection(collection, requests)
         
-        # Domain'lere göre grupla
-        domain_items = {}
+        if response_builder is not None:
+            print_response_summary(response_builder)
         
-        print(f"🔄 {len(entries)} HTTP isteği işleniyor...")
+        count('requests', total_requests)
+        print(f"✅ {total_requests} istek {len(collection['item'])} domain'de gruplandı")
         
-        for i, entry in enumerate(entries):
-            if 'request' not in entry:
-                continue
-            
-            har_request = entry['request']
-            
-            # URL'yi parse et
-            url = har_request.get('url', '')
-            if not url:
-                continue
-            
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc or 'unknown'
-            
-            # Postman request formatına çevir
-            postman_request = convert_har_request_to_postman(har_request, i + 1)
-            
-            # Domain grubuna ekle
-            if domain not in domain_items:
-                domain_items[domain] = {
-                    "name": domain,
-                    "item": []
-                }
-            
-            domain_items[domain]["item"].append(postman_request)
-        
-        # Domain'leri collection'a ekle
-        for domain_item in domain_items.values():
-            collection["item"].append(domain_item)
-        
-        total_requests = sum(len(domain["item"]) for domain in domain_items.values())
-        print(f"✅ {total_requests} istek {len(domain_items)} domain'de gruplandı")
+        if cache is not None:
+            cache.put(cache_key, collection)
         
         return collection
         
@@ -83,47 +101,159 @@ def har_to_postman_collection(har_file_path: str, collection_name: str = None):
         print(f"❌ HAR çevirilirken hata: {e}")
         return None
 
-def convert_har_request_to_postman(har_request: dict, request_index: int):
+def collection_info(har_file_path: str, collection_name: str = None):
+    """HAR dosyası için collection info bölümünü oluşturur"""
+    # Collection adını belirle
+    if not collection_name:
+        collection_name = f"HAR Import - {os.path.basename(har_file_path)}"
+    
+    return {
+        "name": collection_name,
+        "description": f"HAR dosyasından çevrildi: {har_file_path}",
+        "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
+        "_postman_id": str(uuid.uuid4())
+    }
+
+def collection_from_entries(entries: list, har_file_path: str, collection_name: str = None, **options):
+    """Bellekteki bir entry listesini (ör. bir indeks sorgusunun sonucu) collection'a çevirir
+
+    Seçenekler har_to_postman_collection ile aynıdır (stream, entry_filter ve cache hariç).
+    """
+    collection = {"info": collection_info(har_file_path, collection_name), "item": []}
+    requests, _ = _request_stream(har_file_path, entries=entries, **options)
+    merge_into_collection(collection, requests)
+    return collection
+
+def read_entries(har_file_path: str, entry_filter: EntryFilter = None, raw: bool = False):
+    """HAR entry'lerini akış modunda okur
+
+    Filtre verilirse entry'ler ham metin olarak okunur ve filtreye
+    takılanlar parse edilmeden atlanır. raw=True ise geçenler de ham metin
+    olarak döner.
+    """
+    if not entry_filter:
+        return profile_iter('read', iter_har_entries(har_file_path, raw=raw))
+    entries = profile_iter('read', iter_har_entries(har_file_path, raw=True))
+    return profile_iter('filter', entry_filter.apply(entries, parse=not raw))
+
+def postman_request_pipeline(entries, workers: int = 1, path_trie: PathTemplateTrie = None,
+                             deduplicator: RequestDeduplicator = None, header_policy: HeaderPolicy = None,
+                             response_builder: ResponseExampleBuilder = None, start: int = 0,
+                             serialize: str = None):
+    """Entry'leri çevirir, varsa path şablonlama, tekilleştirme ve response örneği aşamalarını ekler
+
+    serialize ('pretty' ya da 'compact') verilirse ve request'ler çevirmeden
+    sonra değiştirilmeyecekse worker'lar request'leri StreamingCollectionWriter
+    için serialize edip SerializedRequest olarak döndürür.
+    """
+    if path_trie is not None or deduplicator is not None or response_builder is not None:
+        serialize = None
+    requests = profile_iter('convert', convert_entries(entries, workers, header_policy,
+                                                       response_builder is not None, start, serialize))
+    if path_trie is not None:
+        requests = profile_iter('path_templates', apply_path_templates(requests, path_trie))
+    if deduplicator is not None:
+        requests = profile_iter('dedupe', deduplicator.filter(requests))
+    if response_builder is not None:
+        # Tekilleştirmeden sonra: atılan request'lerin body'leri hiç decode edilmez
+        requests = profile_iter('response_examples', response_builder.attach(requests))
+    return requests
+
+def convert_entries(entries, workers: int = 1, header_policy: HeaderPolicy = None, responses: bool = False,
+                    start: int = 0, serialize: str = None):
+    """Entry'leri tek process'te ya da process havuzunda (domain, request) çiftlerine çevirir
+
+    serialize sadece process havuzunda kullanılır; tek process'te
+    serialize işini yazıcı zaten aynı process'te yapar.
+    """
+    if workers and workers > 1:
+        return iter_postman_requests_parallel(entries, workers, header_policy=header_policy,
+                                              responses=responses, start=start, serialize=serialize)
+    return iter_postman_requests(entries, start, header_policy, responses)
+
+def iter_postman_requests(entries, start: int = 0, header_policy: HeaderPolicy = None, responses: bool = False):
+    """HAR entry'lerini sırayla (domain, postman_request) çiftlerine çevirir
+
+    Entry'ler dict ya da ham JSON metni olabilir; start ilk entry'nin
+    sıra numarasını (0 tabanlı) belirtir. responses=True verilirse HAR
+    response'u işlenmeden request'e HAR_RESPONSE_KEY altında iliştirilir.
+    """
+    for i, entry in enumerate(entries, start):
+        if isinstance(entry, str):
+            entry = json_codec.loads(entry)
+        
+        if 'request' not in entry:
+            continue
+        
+        har_request = entry['request']
+        
+        # URL'yi parse et (sonuç cache'lenir, çevirmede tekrar kullanılır)
+        url = har_request.get('url', '')
+        if not url:
+            continue
+        
+        with stage('url_parse'):
+            domain = canonical_url(url).netloc or 'unknown'
+        
+        # Postman request formatına çevir
+        postman_request = convert_har_request_to_postman(har_request, i + 1, header_policy)
+        if responses and entry.get('response'):
+            postman_request[HAR_RESPONSE_KEY] = entry['response']
+        yield domain, postman_request
+
+def _convert_entry_chunk(start: int, chunk: list, header_policy: HeaderPolicy = None, responses: bool = False,
+                         serialize: str = None):
+    """Worker process'te bir entry parçasını çevirir, istenirse yazıcı için serialize eder"""
+    requests = iter_postman_requests(chunk, start, header_policy, responses)
+    if serialize is None:
+        return list(requests)
+    with stage('serialize'):
+        compact = serialize == 'compact'
+        return [(domain, serialize_request(postman_request, compact)) for domain, postman_request in requests]
+
+def iter_postman_requests_parallel(entries, workers: int, chunk_size: int = PARALLEL_CHUNK_SIZE,
+                                   header_policy: HeaderPolicy = None, responses: bool = False, start: int = 0,
+                                   serialize: str = None):
+    """iter_postman_requests ile aynı sonucu process havuzunda üretir
+
+    Entry'ler chunk_size'lık parçalar halinde worker'lara gönderilir ve
+    sonuçlar orijinal sırayla döndürülür. Aynı anda en fazla workers * 2
+    parça işlemde tutulur, böylece akış modunda bellek sınırlı kalır.
+    serialize verilirse request'ler dict yerine SerializedRequest döner.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        chunk = []
+        for entry in entries:
+            chunk.append(entry)
+            if len(chunk) >= chunk_size:
+                pending.append(executor.submit(_convert_entry_chunk, start, chunk, header_policy, responses,
+                                               serialize))
+                start += len(chunk)
+                chunk = []
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+        if chunk:
+            pending.append(executor.submit(_convert_entry_chunk, start, chunk, header_policy, responses,
+                                           serialize))
+        while pending:
+            yield from pending.popleft().result()
+
+def convert_har_request_to_postman(har_request: dict, request_index: int, header_policy: HeaderPolicy = None):
     """Tek bir HAR request'ini Postman formatına çevirir"""
     url = har_request.get('url', '')
     method = har_request.get('method', 'GET').upper()
     
-    # URL'yi parse et
-    parsed_url = urlparse(url)
-    
-    # Query parameters
-    query_params = []
-    if parsed_url.query:
-        for key, values in parse_qs(parsed_url.query, keep_blank_values=True).items():
-            for value in values:
-                query_params.append({
-                    "key": key,
-                    "value": value
-                })
-    
-    # HAR'dan gelen query params da ekle (fazladan kontrol)
-    if 'queryString' in har_request:
-        for param in har_request['queryString']:
-            query_params.append({
-                "key": param.get('name', ''),
-                "value": param.get('value', '')
-            })
+    with stage('url_parse'):
+        # URL'yi parse et
+        parsed_url = canonical_url(url)
+        
+        # Query parameters: URL'dekiler + HAR queryString'de olup URL'de olmayanlar
+        query_params = merge_query_params(parsed_url.query_params, har_request.get('queryString'))
     
-    # Headers
-    headers = []
-    if 'headers' in har_request:
-        for header in har_request['headers']:
-            header_name = header.get('name', '')
-            header_value = header.get('value', '')
-            
-            # Bazı headerları skip et (browser otomatik ekliyor)
-            skip_headers = ['host', 'content-length', 'connection', 'accept-encoding']
-            if header_name.lower() not in skip_headers:
-                headers.append({
-                    "key": header_name,
-                    "value": header_value,
-                    "type": "text"
-                })
+    # Headers (varsayılan politika browser'ın otomatik eklediği header'ları atar)
+    with stage('header_filter'):
+        headers = (header_policy or DEFAULT_HEADER_POLICY).apply(har_request.get('headers', []))
     
     # Request body
     body = {}
@@ -166,8 +296,8 @@ def convert_har_request_to_postman(har_request: dict, request_index: int):
     url_obj = {
         "raw": url,
         "protocol": parsed_url.scheme,
-        "host": parsed_url.netloc.split('.') if parsed_url.netloc else [],
-        "path": [p for p in parsed_url.path.split('/') if p]
+        "host": list(parsed_url.host_parts),
+        "path": list(parsed_url.path_segments)
     }
     
     if query_params:
@@ -194,43 +324,646 @@ def convert_har_request_to_postman(har_request: dict, request_index: int):
     
     return postman_request
 
-def create_collection_from_har(har_file_path: str, output_path: str = None, collection_name: str = None):
-    """HAR dosyasından Postman collection oluşturur ve kaydeder"""
-    collection = har_to_postman_collection(har_file_path, collection_name)
-    
-    if not collection:
-        return False
+def create_collection_from_har(har_file_path: str, output_path: str = None, collection_name: str = None,
+                               stream: bool = False, incremental: bool = False, split: str = None,
+                               compact: bool = False, **options):
+    """HAR dosyasından Postman collection oluşturur ve kaydeder
+
+    stream, incremental ve split çıktının nasıl yazılacağını seçer (bkz.
+    _stream_collection_to_file, _convert_incremental,
+    _create_split_collections); diğer seçenekler har_to_postman_collection
+    ile aynıdır.
+    """
+    if split:
+        if incremental:
+            raise ValueError("Artımlı mod parçalı çıktıda desteklenmiyor")
+        return _create_split_collections(har_file_path, output_path, collection_name, split,
+                                         stream=stream, compact=compact, **options)
     
     # Output dosya adını belirle
     if not output_path:
-        base_name = os.path.splitext(os.path.basename(har_file_path))[0]
+        base_name = _har_base_name(har_file_path)
         output_path = f"{base_name}_postman_collection.json"
     
+    if (stream or incremental) and options.pop('cache', None) is not None:
+        # Cache tüm collection'ı bellekte tutan çevirme içindir
+        print("⚠️  Çevirme cache'i akış ve artımlı modda kullanılmıyor")
+    
+    if incremental:
+        if options.get('dedupe') or options.get('template_paths'):
+            # Bu aşamalar tüm HAR'ı görmeden doğru sonuç veremez
+            print("⚠️  --dedupe ve --template-paths artımlı modda desteklenmiyor, tüm HAR çevriliyor")
+        elif detect_compression(har_file_path):
+            # Checkpoint, HAR'ın diskteki byte'larının önekini doğrular
+            print("⚠️  Sıkıştırılmış HAR artımlı modda desteklenmiyor, tüm HAR çevriliyor")
+        else:
+            return _convert_incremental(har_file_path, output_path, collection_name, compact=compact, **options)
+    
+    if stream:
+        return _stream_collection_to_file(har_file_path, output_path, collection_name, compact=compact,
+                                          **options)
+    
+    collection = har_to_postman_collection(har_file_path, collection_name, **options)
+    
+    if not collection:
+        return False
+    
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(collection, f, indent=2, ensure_ascii=False)
+        json_codec.write_json_file(collection, output_path, compact)
         print(f"✅ Postman collection oluşturuldu: {output_path}")
         return True
     except Exception as e:
         print(f"❌ Collection kaydedilirken hata: {e}")
         return False
 
+def _create_split_collections(har_file_path: str, output_dir: str = None, collection_name: str = None,
+                              split: str = 'domain', stream: bool = False, compact: bool = False, **options):
+    """HAR'ı çevirip request'leri üretildikçe parça dosyalarına yazar
+
+    Collection bellekte kurulmaz; her request doğrudan parçasının
+    StreamingCollectionWriter'ına gider (bkz. collection_shards.ShardWriter).
+    workers > 1 verilirse worker'lar entry'leri çevirip serialize eder;
+    yazıcılar sadece hazır metni diske yazar.
+    """
+    if not output_dir:
+        base_name = _har_base_name(har_file_path)
+        output_dir = f"{base_name}_postman_collections"
+    
+    if options.pop('cache', None) is not None:
+        # Cache tüm collection'ı bellekte tutan çevirme içindir
+        print("⚠️  Çevirme cache'i parçalı çıktıda kullanılmıyor")
+    
+    try:
+        writer = ShardWriter(output_dir, collection_info(har_file_path, collection_name), split,
+                             compact=compact)
+        with writer:
+            requests, response_builder = _request_stream(har_file_path, stream,
+                                                         serialize='compact' if compact else 'pretty', **options)
+            with stage('shards'):
+                for domain, postman_request in requests:
+                    writer.add(domain, postman_request)
+        manifest = writer.manifest
+    except Exception as e:
+        print(f"❌ Parçalar kaydedilirken hata: {e}")
+        return False
+    
+    count('requests', manifest['request_count'])
+    if response_builder is not None:
+        print_response_summary(response_builder)
+    print(f"✅ {manifest['request_count']} istek {len(manifest['shards'])} parçaya bölündü: {output_dir}")
+    print(f"📑 Parça listesi: {os.path.join(output_dir, SHARD_MANIFEST_NAME)}")
+    return True
+
+def _request_stream(har_file_path: str, stream: bool = True, workers: int = 1, dedupe: bool = False,
+                    dedupe_examples: int = 0, template_paths: bool = False, header_policy: HeaderPolicy = None,
+                    responses: bool = False, max_response_body: int = DEFAULT_MAX_BODY_SIZE,
+                    response_budget: int = DEFAULT_RESPONSE_BUDGET, entry_filter: EntryFilter = None,
+                    serialize: str = None, entries: list = None):
+    """HAR'dan (domain, postman_request) çiftleri üreten pipeline'ı kurar
+
+    stream=True ise entry'ler dosyadan akış halinde okunur, değilse HAR
+    tamamen yüklenir. entries verilirse HAR okunmaz, bu liste çevrilir.
+    Filtre ve tekilleştirme özetleri request'ler tüketildikten sonra
+    yazılır. serialize için bkz. postman_request_pipeline.
+
+    Returns:
+        (requests, response_builder)
+    """
+    if entries is not None:
+        stream = False
+    elif stream:
+        print("🔄 HTTP istekleri akış modunda işleniyor...")
+        entries = read_entries(har_file_path, entry_filter, raw=workers > 1)
+    else:
+        har_data = json_codec.read_json_file(har_file_path)
+        if 'log' not in har_data or 'entries' not in har_data['log']:
+            raise ValueError("Geçersiz HAR dosyası formatı")
+        entries = har_data['log']['entries']
+        if entry_filter:
+            entries = list(profile_iter('filter', entry_filter.apply(entries)))
+        print(f"🔄 {len(entries)} HTTP isteği işleniyor...")
+    
+    path_trie = None
+    if template_paths:
+        with stage('path_trie'):
+            path_trie = build_path_trie(read_entries(har_file_path, entry_filter) if stream else entries)
+    deduplicator = RequestDeduplicator(dedupe_examples) if dedupe else None
+    response_builder = ResponseExampleBuilder(max_response_body, response_budget) if responses else None
+    requests = postman_request_pipeline(entries, workers, path_trie, deduplicator, header_policy,
+                                        response_builder, serialize=serialize)
+    if deduplicator is not None:
+        # Tekrar sayıları ancak sonda belli olur; sadece temsilciler bellekte tutulur
+        requests = list(requests)
+        deduplicator.annotate()
+        print(f"🧹 {deduplicator.duplicate_count} tekrar eden istek birleştirildi")
+        count('duplicates', deduplicator.duplicate_count)
+    
+    def summarized():
+        yield from requests
+        if entry_filter:
+            print(f"🚫 {entry_filter.rejected_count} entry filtrelere takıldı")
+            count('filtered', entry_filter.rejected_count)
+    
+    return summarized(), response_builder
+
+def _stream_collection_to_file(har_file_path: str, output_path: str, collection_name: str = None,
+                               compact: bool = False, **options):
+    """HAR'ı akış modunda okuyup collection'ı parça parça diske yazar"""
+    try:
+        writer = StreamingCollectionWriter(output_path, collection_info(har_file_path, collection_name),
+                                           compact=compact)
+        with writer:
+            requests, response_builder = _request_stream(har_file_path,
+                                                         serialize='compact' if compact else 'pretty', **options)
+            with stage('grouping'):
+                for domain, postman_request in requests:
+                    writer.add(domain, postman_request)
+        count('requests', writer.request_count)
+        if response_builder is not None:
+            print_response_summary(response_builder)
+        print(f"✅ {writer.request_count} istek {writer.domain_count} domain'de gruplandı")
+        print(f"✅ Postman collection oluşturuldu: {output_path}")
+        return True
+    except Exception as e:
+        print(f"❌ HAR çevirilirken hata: {e}")
+        return False
+
+def merge_into_collection(collection: dict, requests):
+    """(domain, postman_request) çiftlerini collection'daki domain klasörlerine ekler"""
+    domain_items = {
+        item["name"]: item for item in collection["item"]
+        if isinstance(item.get("item"), list)
+    }
+    added = 0
+    for domain, postman_request in requests:
+        if domain not in domain_items:
+            domain_items[domain] = {"name": domain, "item": []}
+            collection["item"].append(domain_items[domain])
+        domain_items[domain]["item"].append(postman_request)
+        added += 1
+    return added
+
+def _convert_incremental(har_file_path: str, output_path: str, collection_name: str = None,
+                         workers: int = 1, header_policy: HeaderPolicy = None, responses: bool = False,
+                         max_response_body: int = DEFAULT_MAX_BODY_SIZE,
+                         response_budget: int = DEFAULT_RESPONSE_BUDGET, dedupe: bool = False,
+                         dedupe_examples: int = 0, template_paths: bool = False,
+                         entry_filter: EntryFilter = None, compact: bool = False):
+    """Checkpoint'ten sonra eklenen entry'leri çevirip mevcut collection'a ekler
+
+    Checkpoint yoksa, seçenekler değiştiyse ya da HAR'ın daha önce çevrilen
+    kısmı değiştiyse tüm dosya çevrilir. Her durumda sonda yeni bir
+    checkpoint yazılır. Checkpoint domain klasörlerinin çıktıdaki kapanış
+    offset'lerini de tutar; çıktı o zamandan beri değişmediyse yeni
+    request'ler mevcut collection okunmadan bu offset'lere eklenir (bkz.
+    collection_writer.append_to_collection). Çıktı sıkıştırılıyorsa,
+    --compact değiştiyse ya da dosya elle düzenlendiyse collection okunup
+    baştan yazılır. dedupe ve template_paths burada her zaman kapalıdır;
+    ortak seçenek sözlüğü olduğu gibi geçirilebilsin diye kabul edilirler.
+    """
+    try:
+        fingerprint = options_fingerprint({
+            "header_policy": header_policy,
+            "responses": responses,
+            "max_response_body": max_response_body if responses else None,
+            "response_budget": response_budget if responses else None,
+            "entry_filter": entry_filter or None
+        })
+        checkpoint = load_checkpoint(output_path)
+        hasher = verify_checkpoint(checkpoint, har_file_path, output_path, fingerprint)
+        
+        layout = checkpoint.get("layout") if hasher is not None else None
+        if layout is not None and not (layout.get("compact") == compact and has_collection_layout(
+                output_path, layout["folder_tails"], compact, layout["bytes"])):
+            layout = None
+        
+        collection = None
+        if hasher is not None:
+            if layout is None:
+                # Klasör offset'leri kullanılamıyor: collection okunup baştan yazılır
+                collection = json_codec.read_json_file(output_path)
+            entry_count = checkpoint["entry_count"]
+            accepted_count = checkpoint.get("accepted_count", entry_count)
+            start_offset = checkpoint["byte_offset"]
+            print(f"🔄 Checkpoint bulundu: {entry_count} entry atlanıyor, yeni entry'ler işleniyor...")
+        else:
+            hasher = new_prefix_hasher()
+            entry_count = 0
+            accepted_count = 0
+            start_offset = None
+            print("🔄 Geçerli checkpoint yok, tüm HTTP istekleri işleniyor...")
+        
+        response_builder = None
+        if responses:
+            response_builder = ResponseExampleBuilder(max_response_body, response_budget)
+            if checkpoint and start_offset is not None:
+                response_builder.used_bytes = checkpoint.get("response_bytes", 0)
+        
+        progress = {"count": entry_count, "offset": start_offset or 0}
+        
+        def tracked_entries():
+            raw = workers > 1 or bool(entry_filter)
+            for _, end, entry in iter_har_entries_with_offsets(har_file_path, start_offset, raw=raw):
+                progress["count"] += 1
+                progress["offset"] = end
+                yield entry
+        
+        entries = tracked_entries()
+        if entry_filter:
+            entries = entry_filter.apply(entries, parse=workers <= 1)
+        # Request numaraları tam çevirmeyle aynı olsun diye filtreden geçen entry'lerden devam eder
+        requests = postman_request_pipeline(entries, workers, header_policy=header_policy,
+                                            response_builder=response_builder, start=accepted_count)
+        if layout is not None:
+            added, folder_tails = append_to_collection(output_path, layout["folder_tails"], requests, compact)
+        elif collection is not None:
+            with stage('grouping'):
+                added = merge_into_collection(collection, requests)
+            folder_tails = _rewrite_collection(collection, output_path, compact)
+        else:
+            writer = StreamingCollectionWriter(output_path, collection_info(har_file_path, collection_name),
+                                               compact=compact)
+            with writer:
+                with stage('grouping'):
+                    for domain, postman_request in requests:
+                        writer.add(domain, postman_request)
+            added = writer.request_count
+            folder_tails = writer.folder_tails
+        count('requests', added)
+        accepted_count += progress["count"] - entry_count - (entry_filter.rejected_count if entry_filter else 0)
+        
+        update_prefix_hash(hasher, har_file_path, start_offset or 0, progress["offset"])
+        extra = {"accepted_count": accepted_count}
+        if folder_tails is not None:
+            extra["layout"] = {"compact": compact, "bytes": os.path.getsize(output_path),
+                               "folder_tails": folder_tails}
+        if response_builder is not None:
+            extra["response_bytes"] = response_builder.used_bytes
+        save_checkpoint(output_path, har_file_path, progress["count"], progress["offset"],
+                        hasher.hexdigest(), fingerprint, **extra)
+        
+        if response_builder is not None:
+            print_response_summary(response_builder)
+        print(f"✅ {added} yeni istek eklendi ({progress['count'] - entry_count} yeni entry)")
+        print(f"✅ Postman collection oluşturuldu: {output_path}")
+        return True
+    except Exception as e:
+        print(f"❌ HAR çevirilirken hata: {e}")
+        return False
+
+def _rewrite_collection(collection: dict, output_path: str, compact: bool = False):
+    """Collection'ı yazar; domain klasörü düzenindeyse klasör kapanış offset'lerini döndürür
+
+    Dışarıdan eklenmiş alanlar ya da boş / tekrar eden klasörler varsa
+    collection json_codec ile yazılır ve None döner.
+    """
+    folders = collection.get("item", [])
+    simple = list(collection) == ["info", "item"] and all(
+        list(folder) == ["name", "item"] and isinstance(folder["item"], list) and folder["item"]
+        for folder in folders) and len({folder["name"] for folder in folders}) == len(folders)
+    if not simple:
+        json_codec.write_json_file(collection, output_path, compact)
+        return None
+    
+    writer = StreamingCollectionWriter(output_path, collection["info"], compact=compact)
+    with writer:
+        for folder in folders:
+            for postman_request in folder["item"]:
+                writer.add(folder["name"], postman_request)
+    return writer.folder_tails
+
+def print_response_summary(response_builder: ResponseExampleBuilder):
+    """Eklenen response örneklerini ve bütçe kullanımını yazdırır"""
+    print(f"📨 {response_builder.example_count} response örneği eklendi "
+          f"({response_builder.used_bytes / 1024 / 1024:.2f} MB body)")
+    if response_builder.omitted_bodies:
+        print(f"⚠️  {response_builder.omitted_bodies} örneğin body'si boyut sınırı nedeniyle eklenmedi")
+    if response_builder.binary_bodies:
+        print(f"⚠️  {response_builder.binary_bodies} örneğin body'si metin olmadığı (binary) için eklenmedi")
+
+def find_har_files(source: str):
+    """Dizin ya da glob deseninden HAR dosyalarını (sıkıştırılmışlar dahil) bulur"""
+    if os.path.isdir(source):
+        patterns = [os.path.join(source, '*.har' + suffix) for suffix in ('',) + tuple(COMPRESSION_SUFFIXES)]
+    else:
+        patterns = [source]
+    return sorted({path for pattern in patterns for path in glob.glob(pattern) if os.path.isfile(path)})
+
+def _har_base_name(har_file_path: str):
+    """'captures/app.har.gz' -> 'app'"""
+    return os.path.splitext(os.path.basename(strip_compression_suffix(har_file_path)))[0]
+
+def _batch_output_path(har_file_path: str, output_dir: str, keep_suffix: bool = False):
+    """'app.har.gz' -> 'app_postman_collection.json' (keep_suffix=True ise 'app_gz_postman_collection.json')"""
+    base_name = _har_base_name(har_file_path)
+    suffix = os.path.splitext(har_file_path)[1].lower()
+    if keep_suffix and suffix in COMPRESSION_SUFFIXES:
+        base_name = f"{base_name}_{suffix[1:]}"
+    return os.path.join(output_dir, f"{base_name}_postman_collection.json")
+
+def _batch_output_paths(har_files: list, output_dir: str):
+    """HAR dosyalarına çakışmayan çıktı yolları atar
+
+    'capture.har' ile 'capture.har.gz' gibi aynı ada düşen dosyalarda
+    sıkıştırılmış olanların çıktı adına sıkıştırma uzantısı eklenir. Yine de
+    çakışan dosyalar (ör. glob ile farklı dizinlerden gelen aynı adlar) için
+    çıktı yolu None olur.
+
+    Returns:
+        ({har_file: output_path ya da None}, {har_file: çakıştığı har_file})
+    """
+    groups = {}
+    for har_file in har_files:
+        groups.setdefault(os.path.normcase(_batch_output_path(har_file, output_dir)), []).append(har_file)
+    
+    outputs = {}
+    conflicts = {}
+    owners = {}
+    for group in groups.values():
+        for har_file in group:
+            output_path = _batch_output_path(har_file, output_dir, keep_suffix=len(group) > 1)
+            key = os.path.normcase(output_path)
+            if key in owners:
+                outputs[har_file] = None
+                conflicts[har_file] = owners[key]
+            else:
+                outputs[har_file] = output_path
+                owners[key] = har_file
+    return outputs, conflicts
+
+def _file_signature(path: str):
+    """Güncellik kontrolü için dosyanın mtime ve boyut bilgisi"""
+    stat = os.stat(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+def _load_batch_manifest(manifest_path: str):
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _is_up_to_date(record: dict, har_file_path: str, output_path: str):
+    """Girdi ve çıktı son başarılı çevirmeden beri değişmediyse True döner"""
+    if not record or not os.path.exists(output_path):
+        return False
+    return (record.get("input") == _file_signature(har_file_path)
+            and record.get("output") == _file_signature(output_path))
+
+def _convert_batch_file(har_file_path: str, output_path: str, options: dict):
+    """Batch worker'ında tek bir HAR dosyasını çevirir, konsol çıktısını yutar"""
+    started = time.perf_counter()
+    log = io.StringIO()
+    # Cache bellekteki çevirmeye bağlı; cache verilmediyse akış modu kullanılır
+    stream = options.get('cache') is None
+    with contextlib.redirect_stdout(log):
+        success = create_collection_from_har(har_file_path, output_path, stream=stream, **options)
+    elapsed = time.perf_counter() - started
+    
+    message = ''
+    if not success:
+        errors = [line for line in log.getvalue().splitlines() if line.startswith('❌')]
+        message = errors[-1] if errors else ''
+    return success, elapsed, message
+
+def convert_batch(source: str, output_dir: str, workers: int = None, force: bool = False, **options):
+    """Bir dizindeki ya da glob'a uyan tüm HAR dosyalarını paralel çevirir
+
+    Her dosya ayrı bir worker process'te akış modunda çevrilir ve aynı anda
+    en fazla `workers` dosya işlemde tutulur. options'ta cache (bkz.
+    conversion_cache.ConversionCache) verilirse dosyalar cache'i kullanabilmek
+    için bellekte çevrilir; aynı içerikteki HAR'lar cache'ten gelir. Son başarılı çevirmeden beri
+    girdisi ve çıktısı (mtime + boyut) değişmeyen dosyalar atlanır; bu bilgi
+    çıktı dizinindeki manifest dosyasında saklanır; çevirme seçenekleri
+    (dedupe, template_paths, header_policy, ...) değiştiyse force=True
+    verilmelidir. Çıktı adı başka bir dosyanınkiyle çakışan dosyalar
+    çevrilmez, "failed" olarak raporlanır (bkz. _batch_output_paths).
+    """
+    har_files = find_har_files(source)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, BATCH_MANIFEST_NAME)
+    manifest = _load_batch_manifest(manifest_path)
+    workers = workers or os.cpu_count() or 1
+    
+    outputs, conflicts = _batch_output_paths(har_files, output_dir)
+    results = {}
+    todo = []
+    for har_file in har_files:
+        output_path = outputs[har_file]
+        result = {
+            "file": har_file,
+            "output": output_path,
+            "size": os.path.getsize(har_file),
+            "status": "skipped",
+            "seconds": 0.0,
+            "message": ""
+        }
+        results[har_file] = result
+        if har_file in conflicts:
+            result["status"] = "failed"
+            result["message"] = f"❌ Çıktı adı {conflicts[har_file]} ile çakışıyor, dosya çevrilmedi"
+        elif force or not _is_up_to_date(manifest.get(os.path.abspath(har_file)), har_file, output_path):
+            todo.append(har_file)
+    
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            queue = iter(todo)
+            pending = {}
+            
+            def submit_next():
+                har_file = next(queue, None)
+                if har_file is not None:
+                    signature = _file_signature(har_file)
+                    future = executor.submit(_convert_batch_file, har_file, results[har_file]["output"], options)
+                    pending[future] = (har_file, signature)
+            
+            for _ in range(workers):
+                submit_next()
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    har_file, signature = pending.pop(future)
+                    result = results[har_file]
+                    try:
+                        success, result["seconds"], result["message"] = future.result()
+                    except Exception as e:
+                        success, result["message"] = False, f"❌ {e}"
+                    
+                    result["status"] = "converted" if success else "failed"
+                    if success:
+                        manifest[os.path.abspath(har_file)] = {
+                            "input": signature,
+                            "output": _file_signature(result["output"])
+                        }
+                    submit_next()
+        
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+    
+    return [results[har_file] for har_file in har_files]
+
+def print_batch_summary(results: list):
+    """Batch sonuçlarını dosya bazında süreleriyle tablo olarak yazdırır"""
+    status_labels = {"converted": "✅ çevrildi", "skipped": "⏭️  güncel", "failed": "❌ hata"}
+    name_width = max([len(os.path.basename(r["file"])) for r in results] + [5])
+    
+    print(f"\n{'Dosya':<{name_width}}  {'Durum':<12}  {'Boyut (MB)':>10}  {'Süre (s)':>9}")
+    print("-" * (name_width + 39))
+    for result in results:
+        print(f"{os.path.basename(result['file']):<{name_width}}  "
+              f"{status_labels[result['status']]:<12}  "
+              f"{result['size'] / 1024 / 1024:>10.2f}  "
+              f"{result['seconds']:>9.2f}")
+        if result["message"]:
+            print(f"   {result['message']}")
+    
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in status_labels}
+    total_seconds = sum(r["seconds"] for r in results)
+    print("-" * (name_width + 39))
+    print(f"📊 {len(results)} dosya: {counts['converted']} çevrildi, {counts['skipped']} güncel, "
+          f"{counts['failed']} hata (toplam işlem süresi {total_seconds:.2f} s)")
+
 def main():
     """Ana fonksiyon - komut satırından çalıştırma"""
+    parser = argparse.ArgumentParser(
+        description='HAR to Postman Collection Converter',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Örnek:
+  python har_to_postman.py example.har
+  python har_to_postman.py example.har my_collection.json
+  python har_to_postman.py example.har my_collection.json 'API Collection'
+  python har_to_postman.py huge_capture.har --stream
+  python har_to_postman.py huge_capture.har --stream --workers 32
+  python har_to_postman.py live_capture.har live_collection.json --incremental
+  python har_to_postman.py spa_capture.har --template-paths --dedupe --dedupe-examples 3
+  python har_to_postman.py app.har --exclude-resource-type image --exclude-resource-type font --exclude-status 3xx
+  python har_to_postman.py app.har --include-domain api.example.com --include-method POST --stream
+  python har_to_postman.py api_capture.har --responses --max-response-body 512 --response-budget 100
+  python har_to_postman.py huge_capture.har shards/ --split domain --stream --workers 8
+  python har_to_postman.py huge_capture.har --stream --profile --profile-stats convert.pstats
+  python har_to_postman.py example.har --cache-dir ~/.cache/har_to_postman
+  python har_to_postman.py --batch captures/ --output-dir collections/
+  python har_to_postman.py --batch "captures/*.har" --output-dir collections/ --workers 8
+        '''
+    )
+    parser.add_argument('har_file', nargs='?', help='HAR dosyası yolu')
+    parser.add_argument('output_file', nargs='?', help='Çıktı dosyası yolu')
+    parser.add_argument('collection_name', nargs='?', help='Collection adı')
+    parser.add_argument('--stream', action='store_true',
+                        help='HAR dosyasını belleğe almadan entry entry oku (büyük dosyalar için)')
+    parser.add_argument('--workers', '-w', type=int, metavar='N',
+                        help='Paralel process sayısı (tek dosyada varsayılan 1, batch modunda CPU sayısı)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Sadece son çevirmeden sonra HAR\'a eklenen entry\'leri çevirip çıktıya ekle '
+                             '(çıktı okunmadan eklenir; sıkıştırılmış ya da elle düzenlenmiş çıktı baştan yazılır)')
+    parser.add_argument('--template-paths', action='store_true',
+                        help='ID/UUID gibi değişken path segmentlerini :param değişkenlerine çevir')
+    parser.add_argument('--header-policy', metavar='FILE',
+                        help='Header drop/keep/rename/redact kurallarını içeren JSON politika dosyası')
+    parser.add_argument('--dedupe', action='store_true',
+                        help='Yapısal olarak aynı request\'lerden sadece birini tut')
+    parser.add_argument('--dedupe-examples', type=int, default=0, metavar='N',
+                        help='Birleştirilen request\'lerden en fazla N örnek URL\'i açıklamaya ekle')
+    parser.add_argument('--responses', action='store_true',
+                        help='HAR response\'larını Postman örneği (saved example) olarak ekle')
+    parser.add_argument('--max-response-body', type=int, default=DEFAULT_MAX_BODY_SIZE // 1024, metavar='KB',
+                        help='Tek bir response body\'sinin üst sınırı (varsayılan: %(default)s KB)')
+    parser.add_argument('--response-budget', type=int, default=DEFAULT_RESPONSE_BUDGET // 1024 // 1024,
+                        metavar='MB', help='Tüm response body\'leri için toplam üst sınır (varsayılan: %(default)s MB)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Collection JSON\'ını girintisiz tek satır yaz (daha küçük ve hızlı)')
+    parser.add_argument('--split', choices=SHARD_MODES,
+                        help='Collection\'ı domain\'e ya da domain + ilk path segmentine göre ayrı dosyalara böl '
+                             '(çıktı yolu dizin olur; --workers ile request\'ler worker\'larda çevrilip '
+                             'serialize edilir, parçalara sadece hazır metin yazılır)')
+    
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help=f'Çevrilmiş collection\'ları bu dizinde cache\'le (örn. {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE // 1024 // 1024, metavar='MB',
+                        help='Cache dizininin toplam boyut sınırı (varsayılan: %(default)s MB)')
+    
+    filter_group = parser.add_argument_group(
+        'Filtreler', 'Her filtre birden fazla kez verilebilir; include verilen alanlarda en az biri eşleşmelidir')
+    for name, metavar, help_text in (
+        ('domain', 'DOMAIN', 'domain (alt domain\'ler dahil)'),
+        ('method', 'METHOD', 'HTTP method'),
+        ('mime', 'MIME', 'response MIME tipi öneki (örn. image/)'),
+        ('status', 'STATUS', 'response status kodu ya da sınıfı (örn. 404, 4xx)'),
+        ('url', 'REGEX', 'URL regex\'i'),
+        ('resource-type', 'TYPE', 'tarayıcının _resourceType değeri (xhr, fetch, script, image...)')
+    ):
+        filter_group.add_argument(f'--include-{name}', action='append', default=[], metavar=metavar,
+                                  help=f'Sadece bu {help_text} ile eşleşen entry\'leri çevir')
+        filter_group.add_argument(f'--exclude-{name}', action='append', default=[], metavar=metavar,
+                                  help=f'Bu {help_text} ile eşleşen entry\'leri atla')
+    
+    profile_group = parser.add_argument_group('Profilleme')
+    profile_group.add_argument('--profile', action='store_true',
+                               help='Çevirme sonunda aşama bazında süre ve sayaç dökümünü yazdır')
+    profile_group.add_argument('--profile-stats', metavar='FILE',
+                               help='cProfile istatistiklerini pstats dosyası olarak kaydet (--profile içerir)')
+    profile_group.add_argument('--profile-memory', action='store_true',
+                               help='tracemalloc ile tepe belleği ölç (--profile içerir, çevirmeyi yavaşlatır)')
+    
+    batch_group = parser.add_argument_group('Batch Modu')
+    batch_group.add_argument('--batch', metavar='SOURCE',
+                             help='Dizindeki ya da glob desenine uyan tüm HAR dosyalarını çevir')
+    batch_group.add_argument('--output-dir', default='.', metavar='DIR',
+                             help='Batch modunda collection\'ların yazılacağı dizin')
+    batch_group.add_argument('--force', action='store_true',
+                             help='Güncel olan çıktıları da yeniden oluştur')
+    
     print("🚀 HAR to Postman Collection Converter")
     print("=" * 50)
     
-    if len(sys.argv) < 2:
-        print("Kullanım: python har_to_postman.py <har_dosyasi> [çıktı_dosyası] [collection_adı]")
-        print("\nÖrnek:")
-        print("  python har_to_postman.py example.har")
-        print("  python har_to_postman.py example.har my_collection.json")
-        print("  python har_to_postman.py example.har my_collection.json 'API Collection'")
-        sys.exit(1)
+    args = parser.parse_args()
+    
+    options = {
+        "dedupe": args.dedupe,
+        "dedupe_examples": args.dedupe_examples,
+        "template_paths": args.template_paths,
+        "header_policy": load_header_policy(args.header_policy) if args.header_policy else None,
+        "responses": args.responses,
+        "max_response_body": args.max_response_body * 1024,
+        "response_budget": args.response_budget * 1024 * 1024,
+        "entry_filter": EntryFilter(
+            include_domains=args.include_domain, exclude_domains=args.exclude_domain,
+            include_methods=args.include_method, exclude_methods=args.exclude_method,
+            include_mime=args.include_mime, exclude_mime=args.exclude_mime,
+            include_status=args.include_status, exclude_status=args.exclude_status,
+            include_url=args.include_url, exclude_url=args.exclude_url,
+            include_resource_types=args.include_resource_type,
+            exclude_resource_types=args.exclude_resource_type
+        ) or None
+    }
+    
+    if args.split and (args.incremental or args.batch):
+        parser.error(f"--split ve {'--incremental' if args.incremental else '--batch'} birlikte kullanılamaz")
     
-    har_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    collection_name = sys.argv[3] if len(sys.argv) > 3 else None
+    if args.cache_dir:
+        options["cache"] = ConversionCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    
+    if args.batch:
+        print(f"📂 Kaynak: {args.batch}")
+        print(f"📝 Çıktı dizini: {args.output_dir}")
+        results = convert_batch(args.batch, args.output_dir, args.workers, args.force,
+                                incremental=args.incremental, compact=args.compact, **options)
+        if not results:
+            print(f"❌ HAR dosyası bulunamadı: {args.batch}")
+            sys.exit(1)
+        print_batch_summary(results)
+        if any(result["status"] == "failed" for result in results):
+            sys.exit(1)
+        return
+    
+    if not args.har_file:
+        parser.error("HAR dosyası ya da --batch belirtilmelidir")
+    
+    har_file = args.har_file
+    output_file = args.output_file
+    collection_name = args.collection_name
     
     if not os.path.exists(har_file):
         print(f"❌ HAR dosyası bulunamadı: {har_file}")
@@ -244,7 +977,14 @@ def main():
     
     print("\n🔄 Çevirme işlemi başlatılıyor...")
     
-    success = create_collection_from_har(har_file, output_file, collection_name)
+    profile = args.profile or args.profile_stats or args.profile_memory
+    with profiling(args.profile_stats, args.profile_memory) if profile else contextlib.nullcontext() as profiler:
+        success = create_collection_from_har(har_file, output_file, collection_name,
+                                             stream=args.stream, incremental=args.incremental, split=args.split,
+                                             compact=args.compact, workers=args.workers or 1, **options)
+    
+    if profiler is not None:
+        print(profiler.format_report())
     
     if success:
         print("\n🎉 HAR dosyası başarıyla Postman collection'ına çevrildi!")
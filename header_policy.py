@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Header Politikası
+HAR'dan Postman'e çevirirken header'lara uygulanacak drop / keep / rename /
+redact kurallarını bir kez derleyip her header'a sabit maliyetle uygular.
+
+Politika dosyası örneği (JSON):
+    {
+        "extends_default": true,
+        "drop": ["cookie"],
+        "drop_regex": ["^sec-", "^x-datadog-"],
+        "keep": ["x-request-id"],
+        "rename": {"x-api-key": "X-API-Key"},
+        "redact": ["authorization"],
+        "redact_regex": ["token"],
+        "redact_value": "{{token}}"
+    }
+
+Header adları büyük/küçük harf duyarsız eşleşir. keep kuralları drop
+kurallarından önceliklidir; rename ve redact birbirinden bağımsız uygulanır.
+"""
+
+import json
+import re
+
+# Tarayıcının otomatik eklediği, Postman'de anlamı olmayan header'lar
+DEFAULT_DROP_HEADERS = ('host', 'content-length', 'connection', 'accept-encoding')
+DEFAULT_REDACT_VALUE = '<redacted>'
+
+# Karar cache'inin üst sınırı (farklı header adı sayısı pratikte çok daha azdır)
+_DECISION_CACHE_LIMIT = 4096
+_DROP = None
+
+
+def _compile_patterns(patterns):
+    """Regex listesini tek bir birleşik, büyük/küçük harf duyarsız regex'e derler"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+def _matches(pattern, name: str):
+    return pattern is not None and pattern.search(name) is not None
+
+
+class HeaderPolicy:
+    """Derlenmiş header kuralları
+
+    Tam eşleşen kurallar frozenset'lere, regex kuralları aksiyon başına tek
+    bir birleşik regex'e derlenir. Her header adı için verilen karar cache'lenir,
+    böylece tekrar eden header'lar tek bir dict erişimine mal olur.
+    """
+
+    def __init__(self, drop=(), keep=(), rename=None, redact=(), drop_regex=(), keep_regex=(),
+                 redact_regex=(), redact_value: str = DEFAULT_REDACT_VALUE):
+        self.drop = frozenset(name.lower() for name in drop)
+        self.keep = frozenset(name.lower() for name in keep)
+        self.redact = frozenset(name.lower() for name in redact)
+        self.rename = {name.lower(): new_name for name, new_name in (rename or {}).items()}
+        self.drop_regex = _compile_patterns(drop_regex)
+        self.keep_regex = _compile_patterns(keep_regex)
+        self.redact_regex = _compile_patterns(redact_regex)
+        self.redact_value = redact_value
+        self._decisions = {}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Politika dict'inden HeaderPolicy oluşturur"""
+        drop = list(data.get('drop', []))
+        if data.get('extends_default', True):
+            drop.extend(DEFAULT_DROP_HEADERS)
+        return cls(
+            drop=drop,
+            keep=data.get('keep', []),
+            rename=data.get('rename', {}),
+            redact=data.get('redact', []),
+            drop_regex=data.get('drop_regex', []),
+            keep_regex=data.get('keep_regex', []),
+            redact_regex=data.get('redact_regex', []),
+            redact_value=data.get('redact_value', DEFAULT_REDACT_VALUE)
+        )
+
+    def __getstate__(self):
+        # Worker process'lere cache'siz gönder
+        state = self.__dict__.copy()
+        state['_decisions'] = {}
+        return state
+
+    def signature(self):
+        """Politikayı değerlerinden oluşan, JSON'a yazılabilir bir dict olarak döndürür"""
+        return {
+            "drop": sorted(self.drop),
+            "keep": sorted(self.keep),
+            "rename": dict(sorted(self.rename.items())),
+            "redact": sorted(self.redact),
+            "drop_regex": self.drop_regex.pattern if self.drop_regex else None,
+            "keep_regex": self.keep_regex.pattern if self.keep_regex else None,
+            "redact_regex": self.redact_regex.pattern if self.redact_regex else None,
+            "redact_value": self.redact_value
+        }
+
+    def _decide(self, name: str):
+        """Header adı için (yeni ad, redact edilsin mi) ya da _DROP kararını verir"""
+        lowered = name.lower()
+        kept = lowered in self.keep or _matches(self.keep_regex, lowered)
+        if not kept and (lowered in self.drop or _matches(self.drop_regex, lowered)):
+            return _DROP
+        redact = lowered in self.redact or _matches(self.redact_regex, lowered)
+        return self.rename.get(lowered, name), redact
+
+    def apply(self, har_headers):
+        """HAR header listesini Postman header listesine çevirir"""
+        decisions = self._decisions
+        headers = []
+        for header in har_headers:
+            name = header.get('name', '')
+            try:
+                decision = decisions[name]
+            except KeyError:
+                if len(decisions) >= _DECISION_CACHE_LIMIT:
+                    decisions.clear()
+                decision = decisions[name] = self._decide(name)
+            if decision is _DROP:
+                continue
+            key, redact = decision
+            headers.append({
+                "key": key,
+                "value": self.redact_value if redact else header.get('value', ''),
+                "type": "text"
+            })
+        return headers
+
+
+DEFAULT_HEADER_POLICY = HeaderPolicy(drop=DEFAULT_DROP_HEADERS)
+
+
+def load_header_policy(policy_path: str):
+    """JSON politika dosyasını yükleyip derler"""
+    with open(policy_path, 'r', encoding='utf-8') as f:
+        return HeaderPolicy.from_dict(json.load(f))
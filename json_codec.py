@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Codec
+Collection ve HAR dosyalarının parse / serialize işlemleri için ortak katman.
+Yüklüyse orjson, değilse ujson, o da yoksa standart json modülü kullanılır.
+Çıktı her backend'de indent=2 ve ensure_ascii=False ile aynı biçimdedir
+(sadece float'ların üslü yazımı farklı olabilir: 1e-07 / 1e-7); compact=True
+boşluksuz tek satır üretir. Backend HAR_TO_POSTMAN_JSON_BACKEND ortam
+değişkeni ya da set_backend() ile seçilebilir.
+
+Backend farkları:
+- orjson NaN / Infinity değerlerini null olarak yazar; standart json ve
+  ujson NaN / Infinity yazar (JSON standardı dışında ama geri okunabilir).
+  Bu değerlerin korunması gerekiyorsa set_backend('json') kullanılmalı.
+- Hızlı backend'lerin reddettiği girdiler (ör. captured body'lerde görülen
+  eşsiz surrogate kaçışları: "\\ud800") standart json ile yeniden denenir;
+  bu string'ler yazılırken \\uXXXX kaçışıyla korunur.
+"""
+
+import json
+import os
+
+from compressed_io import open_binary
+from profiling import stage
+
+BACKEND_ORDER = ('orjson', 'ujson', 'json')
+
+_PRETTY = {"indent": 2, "ensure_ascii": False}
+_COMPACT = {"separators": (',', ':'), "ensure_ascii": False}
+
+
+def _stdlib_codec():
+    def dumps(obj, compact):
+        options = _COMPACT if compact else _PRETTY
+        try:
+            return json.dumps(obj, **options).encode('utf-8')
+        except UnicodeEncodeError:
+            # Eşsiz surrogate içeren string'ler UTF-8'e çevrilemez; \\uXXXX olarak kaçışla
+            return json.dumps(obj, **dict(options, ensure_ascii=True)).encode('utf-8')
+    return json.loads, dumps
+
+
+def _orjson_codec():
+    import orjson
+
+    def dumps(obj, compact):
+        return orjson.dumps(obj, option=0 if compact else orjson.OPT_INDENT_2)
+    return orjson.loads, dumps
+
+
+def _ujson_codec():
+    import ujson
+
+    def dumps(obj, compact):
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                           indent=0 if compact else 2).encode('utf-8')
+    return ujson.loads, dumps
+
+
+_CODECS = {"orjson": _orjson_codec, "ujson": _ujson_codec, "json": _stdlib_codec}
+
+BACKEND = None
+_loads = None
+_dumps = None
+_fallback_loads, _fallback_dumps = _stdlib_codec()
+
+
+def set_backend(name: str = None):
+    """Kullanılacak backend'i seçer; name verilmezse yüklü olan en hızlısı seçilir
+
+    Returns:
+        Seçilen backend'in adı
+    """
+    global BACKEND, _loads, _dumps
+    if name is not None and name not in _CODECS:
+        raise ValueError(f"Bilinmeyen JSON backend'i: {name} (seçenekler: {', '.join(BACKEND_ORDER)})")
+    for candidate in ((name,) if name else BACKEND_ORDER):
+        try:
+            _loads, _dumps = _CODECS[candidate]()
+        except ImportError:
+            if name:
+                raise ImportError(f"'{name}' JSON backend'i yüklü değil: pip install {name}") from None
+            continue
+        BACKEND = candidate
+        return BACKEND
+
+
+def loads(data):
+    """str ya da bytes JSON'u parse eder
+
+    Hızlı backend'in reddettiği girdi standart json ile yeniden denenir
+    (dumps_bytes'taki geri düşüşün karşılığı). Hatalı JSON her backend'de
+    json.JSONDecodeError olarak bildirilir.
+    """
+    with stage('json_parse'):
+        if _loads is not _fallback_loads:
+            try:
+                return _loads(data)
+            except ValueError:
+                pass
+        try:
+            return _fallback_loads(data)
+        except json.JSONDecodeError:
+            raise
+        except ValueError as e:
+            doc = data if isinstance(data, str) else ''
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+
+
+def dumps_bytes(obj, compact: bool = False):
+    """Objeyi UTF-8 JSON byte'larına çevirir
+
+    Hızlı backend'in desteklemediği değerlerde (64 bit'i aşan tamsayı, str
+    olmayan anahtar, eşsiz surrogate...) standart json modülüne düşülür.
+    """
+    with stage('serialize'):
+        try:
+            return _dumps(obj, compact)
+        except (TypeError, OverflowError, UnicodeEncodeError):
+            return _fallback_dumps(obj, compact)
+
+
+def dumps(obj, compact: bool = False):
+    """Objeyi JSON metnine çevirir"""
+    return dumps_bytes(obj, compact).decode('utf-8')
+
+
+def load(fileobj):
+    """json.load gibi açık dosyadan okur"""
+    return loads(fileobj.read())
+
+
+def dump(obj, fileobj, compact: bool = False):
+    """json.dump gibi metin modunda açık dosyaya yazar"""
+    fileobj.write(dumps(obj, compact))
+
+
+def read_json_file(path: str):
+    """Dosyayı (gzip / zstd sıkıştırılmış olabilir) byte olarak okuyup parse eder"""
+    with stage('read'), open_binary(path) as f:
+        data = f.read()
+    return loads(data)
+
+
+def write_json_file(obj, path: str, compact: bool = False):
+    """Objeyi dosyaya yazar; .gz / .zst uzantısında sıkıştırır"""
+    data = dumps_bytes(obj, compact)
+    with stage('write'), open_binary(path, 'wb') as f:
+        f.write(data)
+
+
+set_backend(os.environ.get('HAR_TO_POSTMAN_JSON_BACKEND') or None)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Path Şablonlama
+HAR'daki tüm URL path'lerinden bir segment trie'si kurar ve değişken
+segmentleri (sayısal ID, UUID, hex hash, çok sayıda farklı değer alan
+ve kimlik gibi görünen kardeş segmentler) Postman :param path
+değişkenlerine çevirir. /users/123 -> /users/:userId
+"""
+
+import re
+from urllib.parse import urlparse
+
+import json_codec
+from url_cache import canonical_url
+
+DEFAULT_CARDINALITY_THRESHOLD = 20
+DEFAULT_UNIQUE_RATIO = 0.5
+DEFAULT_MIN_HITS = 30
+MIN_TOKEN_LENGTH = 8
+
+_NUMERIC = re.compile(r'^\d+$')
+_UUID = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+_HEX = re.compile(r'^(?=.*\d)[0-9a-fA-F]{16,}$')
+_NON_IDENTIFIER = re.compile(r'[^0-9A-Za-z]+')
+_HAS_DIGIT = re.compile(r'\d')
+_HAS_LETTER = re.compile(r'[A-Za-z]')
+
+
+def classify_segment(segment: str):
+    """Segment biçiminden açıkça değişken ise türünü döndürür, değilse None"""
+    if _NUMERIC.match(segment):
+        return 'id'
+    if _UUID.match(segment):
+        return 'uuid'
+    if _HEX.match(segment):
+        return 'hash'
+    return None
+
+
+def looks_like_identifier(segment: str):
+    """Segment kimlik değeri gibi mi: sayısal / UUID / hex ya da harf ve rakam karışık uzun token"""
+    if classify_segment(segment):
+        return True
+    return (len(segment) >= MIN_TOKEN_LENGTH and _HAS_DIGIT.search(segment) is not None
+            and _HAS_LETTER.search(segment) is not None)
+
+
+def template_path(path_segments):
+    """Trie kullanmadan, sadece segment biçimine bakarak :id şablonu uygular"""
+    return tuple(':id' if classify_segment(segment) else segment for segment in path_segments)
+
+
+def _variable_name(previous: str, used: set):
+    """Değişkene önceki segmentten isim verir (users -> userId), URL içinde tekil tutar"""
+    base = 'id'
+    if previous:
+        stem = _NON_IDENTIFIER.sub('_', previous).strip('_')
+        if len(stem) > 1 and stem.endswith('s'):
+            stem = stem[:-1]
+        if stem:
+            base = f"{stem}Id"
+    name = base
+    suffix = 2
+    while name in used:
+        name = f"{base}{suffix}"
+        suffix += 1
+    used.add(name)
+    return name
+
+
+class _TrieNode:
+    __slots__ = ('children', 'hits', 'variable')
+
+    def __init__(self):
+        self.children = {}
+        self.hits = 0
+        self.variable = None
+
+
+def _merge_into(target: _TrieNode, source: _TrieNode):
+    """source alt ağacını target'a katar"""
+    stack = [(target, source)]
+    while stack:
+        target, source = stack.pop()
+        target.hits += source.hits
+        for key, child in source.children.items():
+            existing = target.children.get(key)
+            if existing is None:
+                target.children[key] = child
+            else:
+                stack.append((existing, child))
+
+
+class PathTemplateTrie:
+    """Host başına path segment trie'si
+
+    insert() ile tüm path'ler eklendikten sonra finalize() her düğümde
+    değişken görünen çocukları tek bir değişken düğümünde birleştirir.
+    Kurulum ve şablonlama toplam segment sayısıyla lineerdir.
+    """
+
+    def __init__(self, cardinality_threshold: int = DEFAULT_CARDINALITY_THRESHOLD,
+                 unique_ratio: float = DEFAULT_UNIQUE_RATIO, min_hits: int = DEFAULT_MIN_HITS):
+        self.cardinality_threshold = cardinality_threshold
+        self.unique_ratio = unique_ratio
+        self.min_hits = min_hits
+        self._roots = {}
+        self._finalized = False
+
+    def insert(self, host: str, segments):
+        """Bir path'i trie'ye ekler"""
+        node = self._roots.get(host)
+        if node is None:
+            node = self._roots[host] = _TrieNode()
+        node.hits += 1
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            child.hits += 1
+            node = child
+        self._finalized = False
+
+    def finalize(self):
+        """Değişken segmentleri tespit edip birleştirir"""
+        stack = list(self._roots.values())
+        while stack:
+            node = stack.pop()
+            self._collapse(node)
+            stack.extend(node.children.values())
+            if node.variable is not None:
+                stack.append(node.variable)
+        self._finalized = True
+
+    def _collapse(self, node: _TrieNode):
+        variable_keys = []
+        literal_hits = 0
+        identifier_like = 0
+        for key, child in node.children.items():
+            if classify_segment(key):
+                variable_keys.append(key)
+            else:
+                literal_hits += child.hits
+                if looks_like_identifier(key):
+                    identifier_like += 1
+
+        # Çok sayıda, çoğu tek seferlik görülen kardeş segment de değişkendir (ör. kullanıcı token'ları).
+        # /api/users, /api/login gibi isimli endpoint'ler ne kadar çok olursa olsun literal kalır:
+        # kardeşlerin çoğunluğu kimlik gibi görünmeli ve yeterince çok istek görülmüş olmalı.
+        literal_count = len(node.children) - len(variable_keys)
+        if (literal_count > self.cardinality_threshold
+                and literal_hits >= self.min_hits
+                and literal_count / literal_hits >= self.unique_ratio
+                and identifier_like * 2 > literal_count):
+            variable_keys = list(node.children)
+
+        if not variable_keys:
+            return
+        merged = node.variable or _TrieNode()
+        for key in variable_keys:
+            _merge_into(merged, node.children.pop(key))
+        node.variable = merged
+
+    def template(self, host: str, segments):
+        """Path segmentlerini şablonlar
+
+        Returns:
+            (şablonlanmış segment listesi, [(değişken adı, orijinal değer), ...])
+        """
+        if not self._finalized:
+            self.finalize()
+
+        node = self._roots.get(host)
+        templated = []
+        variables = []
+        used_names = set()
+        previous = None
+        for segment in segments:
+            child = node.children.get(segment) if node is not None else None
+            if child is None and node is not None and node.variable is not None:
+                name = _variable_name(previous, used_names)
+                templated.append(f":{name}")
+                variables.append((name, segment))
+                node = node.variable
+            else:
+                templated.append(segment)
+                previous = segment
+                node = child
+        return templated, variables
+
+
+def build_path_trie(entries, **options):
+    """HAR entry'lerinden (dict ya da ham JSON metni) path trie'si kurar"""
+    trie = PathTemplateTrie(**options)
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = json_codec.loads(entry)
+        url = entry.get('request', {}).get('url', '')
+        if not url:
+            continue
+        parsed_url = canonical_url(url)
+        trie.insert(parsed_url.netloc or 'unknown', parsed_url.path_segments)
+    trie.finalize()
+    return trie
+
+
+def apply_path_templates(requests, trie: PathTemplateTrie):
+    """(domain, postman_request) akışındaki URL'leri Postman path değişkenlerine çevirir"""
+    for domain, postman_request in requests:
+        url_obj = postman_request['request']['url']
+        templated, variables = trie.template(domain, url_obj.get('path', []))
+        if variables:
+            parsed_url = urlparse(url_obj['raw'])
+            path = '/' + '/'.join(templated)
+            if parsed_url.path.endswith('/'):
+                path += '/'
+            url_obj['raw'] = parsed_url._replace(path=path).geturl()
+            url_obj['path'] = templated
+            url_obj['variable'] = [{"key": name, "value": value} for name, value in variables]
+        yield domain, postman_request
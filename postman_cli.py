@@ -6,8 +6,12 @@ Command line arayüzü ile collection düzenleme
 """
 
 import argparse
+import contextlib
 import sys
-from postman_collection_editor import PostmanCollectionEditor
+from postman_collection_editor import PostmanCollectionEditor, print_endpoints
+from profiling import profiling
+from progress import console_reporter
+from text_replacer import MultiReplacer, load_mapping
 
 def main():
     parser = argparse.ArgumentParser(
@@ -33,8 +37,17 @@ Kullanım Örnekleri:
   # Metin değiştir
   python postman_cli.py "collection (2).json" --replace-text "old-text" "new-text"
   
+  # Eşleme dosyasındaki tüm host / token'ları tek geçişte değiştir
+  python postman_cli.py "collection (2).json" --replace-map rotations.json
+  
   # Birden fazla işlemi birlikte yap
   python postman_cli.py "collection (2).json" --add-header "Content-Type" "application/json" --remove-scripts --backup --output "new_collection.json"
+  
+  # Değişen her request'i ayrı satırda göster
+  python postman_cli.py "collection (2).json" --remove-scripts --verbose
+  
+  # İşlemlerin süre dökümünü göster
+  python postman_cli.py "collection (2).json" --replace-text "old-text" "new-text" --profile
         '''
     )
     
@@ -69,17 +82,44 @@ Kullanım Örnekleri:
     text_group = parser.add_argument_group('Metin İşlemleri')
     text_group.add_argument('--replace-text', nargs=2, metavar=('OLD_TEXT', 'NEW_TEXT'), 
                            help='Tüm requestlerde metin değiştir')
+    text_group.add_argument('--replace-map', metavar='FILE',
+                           help='Eşleme dosyasındaki (JSON nesnesi ya da eski<TAB>yeni satırları) '
+                                'tüm metinleri tek geçişte değiştir')
     
     # Environment variable
     env_group = parser.add_argument_group('Environment Variable')
     env_group.add_argument('--add-variable', nargs=2, metavar=('NAME', 'VALUE'), 
                           help='Collection seviyesinde environment variable ekle')
     
+    output_group = parser.add_argument_group('Çıktı')
+    output_group.add_argument('--quiet', '-q', action='store_true',
+                              help='Sadece uyarı ve hataları yazdır')
+    output_group.add_argument('--verbose', '-v', action='store_true',
+                              help='Değişen her request için bir satır yazdır')
+    
+    profile_group = parser.add_argument_group('Profilleme')
+    profile_group.add_argument('--profile', action='store_true',
+                               help='İşlemlerin süre dökümünü yazdır')
+    profile_group.add_argument('--profile-stats', metavar='FILE',
+                               help='cProfile istatistiklerini pstats dosyası olarak kaydet (--profile içerir)')
+    profile_group.add_argument('--profile-memory', action='store_true',
+                               help='tracemalloc ile tepe belleği ölç (--profile içerir)')
+    
     args = parser.parse_args()
     
+    profile = args.profile or args.profile_stats or args.profile_memory
+    with profiling(args.profile_stats, args.profile_memory) if profile else contextlib.nullcontext() as profiler:
+        exit_code = run_operations(args)
+    if profiler is not None:
+        print(profiler.format_report())
+    return exit_code
+
+def run_operations(args):
+    """Komut satırında istenen işlemleri sırayla uygular, çıkış kodunu döndürür"""
     # Collection editor oluştur
     try:
-        editor = PostmanCollectionEditor(args.collection)
+        editor = PostmanCollectionEditor(args.collection,
+                                         progress=console_reporter(quiet=args.quiet, verbose=args.verbose))
     except Exception as e:
         print(f"❌ Hata: {e}")
         return 1
@@ -91,7 +131,7 @@ Kullanım Örnekleri:
     # Yedek oluştur
     if args.backup:
         if not editor.create_backup():
-            print("⚠️  Yedek oluşturulamadı, devam ediliyor...")
+            editor.progress.warning("⚠️  Yedek oluşturulamadı, devam ediliyor...")
     
     # Bilgi göster
     if args.info:
@@ -99,36 +139,44 @@ Kullanım Örnekleri:
     
     # Endpoint'leri listele
     if args.list_endpoints:
-        editor.list_all_endpoints()
+        print_endpoints(editor.list_all_endpoints())
     
     # İşlemleri gerçekleştir
     changes_made = False
     
     try:
+        # Request başına işlemler tek bir ağaç gezintisinde uygulanır
+        operations = []
+        messages = []
         if args.add_header:
-            count = editor.add_header_to_all_requests(args.add_header[0], args.add_header[1])
-            changes_made = True
-            print(f"✅ {count} request'e header eklendi")
+            operations.append(('add_header', args.add_header[0], args.add_header[1]))
+            messages.append("✅ {} request'e header eklendi")
         
         if args.remove_header:
-            count = editor.remove_header_from_all_requests(args.remove_header)
-            changes_made = True
-            print(f"✅ {count} request'ten header kaldırıldı")
+            operations.append(('remove_header', args.remove_header))
+            messages.append("✅ {} request'ten header kaldırıldı")
         
         if args.remove_scripts:
-            count = editor.remove_all_scripts()
-            changes_made = True
-            print(f"✅ {count} request'ten scriptler kaldırıldı")
+            operations.append(('remove_scripts',))
+            messages.append("✅ {} request'ten scriptler kaldırıldı")
         
         if args.update_url:
-            count = editor.update_base_url(args.update_url[0], args.update_url[1])
-            changes_made = True
-            print(f"✅ {count} request'te URL güncellendi")
+            operations.append(('update_url', args.update_url[0], args.update_url[1]))
+            messages.append("✅ {} request'te URL güncellendi")
         
         if args.replace_text:
-            count = editor.replace_text_in_requests(args.replace_text[0], args.replace_text[1])
+            operations.append(('replace_text', args.replace_text[0], args.replace_text[1]))
+            messages.append("✅ {} request'te metin değiştirildi")
+        
+        if args.replace_map:
+            operations.append(('replace_many', MultiReplacer(load_mapping(args.replace_map))))
+            messages.append("✅ {} request'te eşleme dosyasındaki metinler değiştirildi")
+        
+        if operations:
+            counts = editor.apply_operations(operations)
             changes_made = True
-            print(f"✅ {count} request'te metin değiştirildi")
+            for message, count in zip(messages, counts):
+                editor.progress.info(message.format(count))
         
         if args.add_variable:
             editor.add_environment_variable(args.add_variable[0], args.add_variable[1])
@@ -138,15 +186,15 @@ Kullanım Örnekleri:
         if changes_made:
             if editor.save_collection(args.output):
                 output_file = args.output or args.collection
-                print(f"\n🎉 İşlemler tamamlandı! Dosya kaydedildi: {output_file}")
+                editor.progress.info(f"\n🎉 İşlemler tamamlandı! Dosya kaydedildi: {output_file}")
             else:
-                print("❌ Dosya kaydedilemedi!")
+                editor.progress.error("❌ Dosya kaydedilemedi!")
                 return 1
         elif not (args.info or args.list_endpoints):
-            print("⚠️  Hiçbir işlem yapılmadı. --help parametresi ile kullanım bilgilerini görebilirsiniz.")
+            editor.progress.warning("⚠️  Hiçbir işlem yapılmadı. --help parametresi ile kullanım bilgilerini görebilirsiniz.")
     
     except Exception as e:
-        print(f"❌ İşlem sırasında hata: {e}")
+        editor.progress.error(f"❌ İşlem sırasında hata: {e}")
         return 1
     
     return 0
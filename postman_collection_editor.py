@@ -7,57 +7,93 @@ Bu script Postman collection JSON dosyalarında toplu düzenlemeler yapmanızı
 
 import json
 import os
+import shutil
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import uuid
-from urllib.parse import urlparse, parse_qs
+
+import har_to_postman
+import json_codec
+from profiling import profiled
+from progress import ProgressReporter, console_reporter
+from request_index import RequestIndex
+from collection_walk import iter_items, iter_requests
+from text_replacer import MultiReplacer
+from compressed_io import open_text
 
 class PostmanCollectionEditor:
-    def __init__(self, collection_path: str):
+    def __init__(self, collection_path: str, progress: Optional[ProgressReporter] = None):
         """
         Postman Collection düzenleyici sınıfı
+
+        İşlemler konsola yazmaz; mesajlar ve ilerleme progress raporlayıcısına
+        olay olarak gönderilir. Verilmezse konsola özet yazan raporlayıcı
+        kullanılır; ProgressReporter(quiet=True) tamamen sessiz çalışır.
         """
         self.collection_path = collection_path
         self.collection = None
         self.backup_created = False
+        self.progress = progress if progress is not None else console_reporter()
+        self._index = None
+        
+    @property
+    def index(self) -> RequestIndex:
+        """Request'lerin id / isim / method / host / path indeksi (ilk kullanımda kurulur)"""
+        if self._index is None:
+            self._index = RequestIndex(self.collection.get('item', []))
+        return self._index
+
+    def invalidate_index(self):
+        """Collection editör dışından değiştirildiyse indeksi bir sonraki kullanımda yeniden kurar"""
+        self._index = None
+
+    def _reindex(self, item: Dict):
+        """İsmi, method'u ya da URL'si değişen item'ı (indeks kuruluysa) günceller"""
+        if self._index is not None:
+            self._index.update(item)
         
+    @profiled('editor.load_collection')
     def load_collection(self):
-        """Collection dosyasını yükler"""
+        """Collection dosyasını yükler (gzip / zstd ile sıkıştırılmış olabilir)"""
         try:
             # Önce encoding'i tespit et
             encodings = ['utf-8', 'utf-8-sig', 'windows-1254', 'latin-1', 'cp1252']
             
             for encoding in encodings:
                 try:
-                    with open(self.collection_path, 'r', encoding=encoding) as f:
-                        self.collection = json.load(f)
-                    print(f"✅ Collection başarıyla yüklendi: {self.collection_path} (encoding: {encoding})")
+                    with open_text(self.collection_path, encoding=encoding) as f:
+                        self.collection = json_codec.load(f)
+                    self._index = None
+                    self.progress.info(f"✅ Collection başarıyla yüklendi: {self.collection_path} (encoding: {encoding})")
                     return True
                 except UnicodeDecodeError:
                     continue
                 except json.JSONDecodeError as e:
-                    print(f"❌ JSON parse hatası: {e}")
+                    self.progress.error(f"❌ JSON parse hatası: {e}")
                     return False
             
-            print(f"❌ Dosya encoding'i tespit edilemedi: {self.collection_path}")
+            self.progress.error(f"❌ Dosya encoding'i tespit edilemedi: {self.collection_path}")
             return False
             
         except Exception as e:
-            print(f"❌ Collection yüklenirken hata: {e}")
+            self.progress.error(f"❌ Collection yüklenirken hata: {e}")
             return False
     
-    def save_collection(self, output_path: Optional[str] = None):
-        """Collection'ı dosyaya kaydeder"""
+    @profiled('editor.save_collection')
+    def save_collection(self, output_path: Optional[str] = None, compact: bool = False):
+        """Collection'ı dosyaya kaydeder (.gz / .zst uzantısında sıkıştırarak)
+
+        compact=True verilirse JSON girintisiz tek satır olarak yazılır.
+        """
         save_path = output_path or self.collection_path
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(self.collection, f, indent=2, ensure_ascii=False)
-            print(f"✅ Collection kaydedildi: {save_path}")
+            json_codec.write_json_file(self.collection, save_path, compact)
+            self.progress.info(f"✅ Collection kaydedildi: {save_path}")
             return True
         except Exception as e:
-            print(f"❌ Collection kaydedilirken hata: {e}")
+            self.progress.error(f"❌ Collection kaydedilirken hata: {e}")
             return False
     
+    @profiled('editor.create_backup')
     def create_backup(self):
         """Orijinal dosyanın yedeğini oluşturur"""
         if self.backup_created:
@@ -67,35 +103,42 @@ class PostmanCollectionEditor:
         backup_path = f"{self.collection_path}.backup_{timestamp}"
         
         try:
-            with open(self.collection_path, 'r', encoding='utf-8') as source:
-                with open(backup_path, 'w', encoding='utf-8') as backup:
-                    backup.write(source.read())
-            print(f"✅ Yedek oluşturuldu: {backup_path}")
+            # Byte byte kopyala; sıkıştırılmış dosyalar da olduğu gibi yedeklenir
+            shutil.copyfile(self.collection_path, backup_path)
+            self.progress.info(f"✅ Yedek oluşturuldu: {backup_path}")
             self.backup_created = True
             return True
         except Exception as e:
-            print(f"❌ Yedek oluşturulurken hata: {e}")
+            self.progress.error(f"❌ Yedek oluşturulurken hata: {e}")
             return False
     
-    def _process_items_recursive(self, items: List[Dict], processor_func):
-        """Collection itemlerini recursive olarak işler"""
-        for item in items:
-            if 'request' in item:
-                # Bu bir request item'ı
-                processor_func(item)
-            elif 'item' in item:
-                # Bu bir folder, alt itemleri işle
-                self._process_items_recursive(item['item'], processor_func)
+    def iter_items(self):
+        """Folder'lar dahil tüm item'ları (path, parent, index, item) olarak gezer (bkz. collection_walk)"""
+        return iter_items(self.collection.get('item', []))
+
+    def iter_requests(self):
+        """Request item'larını (path, parent, index, item) olarak gezer; recursion kullanmaz"""
+        return iter_requests(self.collection.get('item', []))
+
+    def _count_requests(self) -> int:
+        """Folder'lar dahil tüm request item'larını sayar"""
+        return sum(1 for _ in self.iter_requests())
+
+    def _start(self, operation: str):
+        """İşlemi raporlayıcıda başlatır
+
+        Toplam request sayısı sadece indeks zaten kuruluysa verilir; sayı için
+        ağaç ayrıca gezilmez (renderer'lar o durumda ilerleyen sayıyı gösterir).
+        """
+        total = len(self._index) if self._index is not None else None
+        self.progress.start(operation, total)
     
-    def add_header_to_all_requests(self, header_name: str, header_value: str, overwrite: bool = True):
-        """Tüm requestlere header ekler"""
-        count = 0
+    def _header_adder(self, header_name: str, header_value: str, overwrite: bool = True):
+        """add_header işleminin request başına uygulanan ziyaretçisi"""
+        report = self.progress.item
+        wanted = header_name.lower()
         
         def add_header(item):
-            nonlocal count
-            if 'request' not in item:
-                return
-                
             request = item['request']
             if 'header' not in request:
                 request['header'] = []
@@ -103,88 +146,80 @@ class PostmanCollectionEditor:
             # Mevcut header'ı kontrol et
             existing_header = None
             for header in request['header']:
-                if isinstance(header, dict) and header.get('key', '').lower() == header_name.lower():
+                if isinstance(header, dict) and header.get('key', '').lower() == wanted:
                     existing_header = header
                     break
             
             if existing_header:
                 if overwrite:
                     existing_header['value'] = header_value
-                    print(f"🔄 Header güncellendi: {item.get('name', 'Unnamed')} - {header_name}")
-                    count += 1
-                else:
-                    print(f"⚠️  Header zaten mevcut: {item.get('name', 'Unnamed')} - {header_name}")
-            else:
-                new_header = {
-                    "key": header_name,
-                    "value": header_value,
-                    "type": "text"
-                }
-                request['header'].append(new_header)
-                print(f"✅ Header eklendi: {item.get('name', 'Unnamed')} - {header_name}")
-                count += 1
+                    report(f"🔄 Header güncellendi: {item.get('name', 'Unnamed')} - {header_name}")
+                    return True
+                report(f"⚠️  Header zaten mevcut: {item.get('name', 'Unnamed')} - {header_name}")
+                return False
+            
+            new_header = {
+                "key": header_name,
+                "value": header_value,
+                "type": "text"
+            }
+            request['header'].append(new_header)
+            report(f"✅ Header eklendi: {item.get('name', 'Unnamed')} - {header_name}")
+            return True
         
-        self._process_items_recursive(self.collection.get('item', []), add_header)
-        print(f"🎉 Toplam {count} request'e '{header_name}' header'ı işlendi!")
-        return count
+        return add_header, lambda count: f"🎉 Toplam {count} request'e '{header_name}' header'ı işlendi!"
     
-    def remove_header_from_all_requests(self, header_name: str):
-        """Tüm requestlerden belirtilen header'ı kaldırır"""
-        count = 0
+    def _header_remover(self, header_name: str):
+        """remove_header işleminin request başına uygulanan ziyaretçisi"""
+        report = self.progress.item
+        wanted = header_name.lower()
         
         def remove_header(item):
-            nonlocal count
-            if 'request' not in item:
-                return
-                
             request = item['request']
             if 'header' not in request:
-                return
+                return False
             
             original_count = len(request['header'])
             request['header'] = [
                 header for header in request['header']
-                if not (isinstance(header, dict) and header.get('key', '').lower() == header_name.lower())
+                if not (isinstance(header, dict) and header.get('key', '').lower() == wanted)
             ]
             
             if len(request['header']) < original_count:
-                print(f"✅ Header kaldırıldı: {item.get('name', 'Unnamed')} - {header_name}")
-                count += 1
+                report(f"✅ Header kaldırıldı: {item.get('name', 'Unnamed')} - {header_name}")
+                return True
+            return False
         
-        self._process_items_recursive(self.collection.get('item', []), remove_header)
-        print(f"🎉 Toplam {count} request'ten '{header_name}' header'ı kaldırıldı!")
-        return count
+        return remove_header, lambda count: f"🎉 Toplam {count} request'ten '{header_name}' header'ı kaldırıldı!"
     
-    def remove_all_scripts(self):
-        """Tüm pre-request ve test scriptlerini kaldırır"""
-        count = 0
+    def _script_remover(self):
+        """remove_scripts işleminin request başına uygulanan ziyaretçisi"""
+        report = self.progress.item
         
         def remove_scripts(item):
-            nonlocal count
             scripts_removed = []
             item_name = item.get('name', 'Unnamed')
             
             # Request seviyesindeki scriptleri kontrol et
-            if 'request' in item:
-                request = item['request']
-                
-                # Pre-request script kaldır
-                if 'prerequest' in request:
-                    if isinstance(request['prerequest'], dict) and request['prerequest'].get('exec'):
-                        request['prerequest'] = {'exec': [], 'type': 'text/javascript'}
-                        scripts_removed.append('pre-request')
-                    elif isinstance(request['prerequest'], str) and request['prerequest'].strip():
-                        request['prerequest'] = ''
-                        scripts_removed.append('pre-request')
-                
-                # Request seviyesindeki event'ları kontrol et
-                if 'event' in request and request['event']:
-                    original_events = len(request['event'])
-                    request['event'] = [e for e in request['event'] 
-                                      if not (e.get('listen') in ['test', 'prerequest'] and 
-                                             e.get('script', {}).get('exec'))]
-                    if len(request['event']) < original_events:
-                        scripts_removed.append('test')
+            request = item['request']
+            
+            # Pre-request script kaldır
+            if 'prerequest' in request:
+                if isinstance(request['prerequest'], dict) and request['prerequest'].get('exec'):
+                    request['prerequest'] = {'exec': [], 'type': 'text/javascript'}
+                    scripts_removed.append('pre-request')
+                elif isinstance(request['prerequest'], str) and request['prerequest'].strip():
+                    request['prerequest'] = ''
+                    scripts_removed.append('pre-request')
+            
+            # Request seviyesindeki event'ları kontrol et
+            if 'event' in request and request['event']:
+                original_events = len(request['event'])
+                request['event'] = [e for e in request['event'] 
+                                  if not (e.get('listen') in ['test', 'prerequest'] and 
+                                         e.get('script', {}).get('exec'))]
+                if len(request['event']) < original_events:
+                    scripts_removed.append('test')
             
             # Item seviyesindeki event'ları da kontrol et (bazı durumlarda burada olabilir)
             if 'event' in item and item['event']:
@@ -196,141 +231,308 @@ class PostmanCollectionEditor:
                     scripts_removed.append('item-level-test')
             
             if scripts_removed:
-                print(f"✅ Scriptler kaldırıldı: {item_name} - {', '.join(scripts_removed)}")
-                count += 1
+                report(f"✅ Scriptler kaldırıldı: {item_name} - {', '.join(scripts_removed)}")
+                return True
+            return False
         
-        self._process_items_recursive(self.collection.get('item', []), remove_scripts)
-        print(f"🎉 Toplam {count} request'ten scriptler kaldırıldı!")
-        return count
+        return remove_scripts, lambda count: f"🎉 Toplam {count} request'ten scriptler kaldırıldı!"
     
+    def _base_url_updater(self, old_url: str, new_url: str):
+        """update_url işleminin request başına uygulanan ziyaretçisi"""
+        report = self.progress.item
+        new_host = new_url.replace('https://', '').replace('http://', '').split('/')[0].split('.')
+        
+        def update_url(item):
+            request = item['request']
+            if 'url' not in request:
+                return False
+            
+            url = request['url']
+            if isinstance(url, str):
+                if not url.startswith(old_url):
+                    return False
+                request['url'] = url.replace(old_url, new_url, 1)
+            elif isinstance(url, dict) and 'raw' in url:
+                if not url['raw'].startswith(old_url):
+                    return False
+                url['raw'] = url['raw'].replace(old_url, new_url, 1)
+                # Host bilgisini de güncelle
+                if 'host' in url:
+                    url['host'] = list(new_host)
+            else:
+                return False
+            self._reindex(item)
+            report(f"✅ URL güncellendi: {item.get('name', 'Unnamed')}")
+            return True
+        
+        return update_url, lambda count: f"🎉 Toplam {count} request'te base URL güncellendi: {old_url} -> {new_url}"
     
-    def remove_endpoint_by_name(self, endpoint_name: str):
-        """Belirtilen isme sahip endpoint'i kaldırır"""
-        removed_count = 0
+    def _text_replacer(self, old_text: str, new_text: str):
+        """replace_text işleminin request başına uygulanan ziyaretçisi"""
+        report = self.progress.item
         
-        def remove_from_items(items):
-            nonlocal removed_count
-            items_to_remove = []
+        def replace_text(item):
+            request = item['request']
+            changed = False
             
-            for i, item in enumerate(items):
-                if 'request' in item and item.get('name', '').lower() == endpoint_name.lower():
-                    items_to_remove.append(i)
-                    print(f"✅ Endpoint kaldırıldı: {item.get('name', 'Unnamed')}")
-                    removed_count += 1
-                elif 'item' in item:
-                    # Folder içindeki itemleri kontrol et
-                    remove_from_items(item['item'])
+            # URL'de değiştir
+            if 'url' in request:
+                url = request['url']
+                if isinstance(url, str) and old_text in url:
+                    request['url'] = url.replace(old_text, new_text)
+                    changed = True
+                    self._reindex(item)
+                elif isinstance(url, dict) and 'raw' in url and old_text in url['raw']:
+                    url['raw'] = url['raw'].replace(old_text, new_text)
+                    changed = True
+                    self._reindex(item)
             
-            # Geriye doğru sil (index'ler değişmesin)
-            for i in reversed(items_to_remove):
-                items.pop(i)
+            # Header değerlerinde değiştir
+            if 'header' in request:
+                for header in request['header']:
+                    if isinstance(header, dict):
+                        if 'value' in header and old_text in str(header['value']):
+                            header['value'] = str(header['value']).replace(old_text, new_text)
+                            changed = True
+            
+            # Body'de değiştir
+            if 'body' in request and request['body']:
+                body = request['body']
+                if isinstance(body, dict):
+                    if 'raw' in body and old_text in str(body['raw']):
+                        body['raw'] = str(body['raw']).replace(old_text, new_text)
+                        changed = True
+            
+            if changed:
+                report(f"✅ Metin değiştirildi: {item.get('name', 'Unnamed')}")
+            return changed
         
-        remove_from_items(self.collection.get('item', []))
-        print(f"🎉 Toplam {removed_count} endpoint kaldırıldı!")
-        return removed_count
+        return replace_text, lambda count: f"🎉 Toplam {count} request'te '{old_text}' -> '{new_text}' değiştirildi!"
     
-    def remove_endpoints_by_method(self, method: str):
-        """Belirtilen HTTP method'una sahip tüm endpoint'leri kaldırır"""
-        removed_count = 0
+    def _multi_replacer(self, mapping):
+        """replace_many işleminin request başına uygulanan ziyaretçisi
+
+        mapping bir {eski: yeni} sözlüğü ya da hazır MultiReplacer olabilir;
+        her alan tek bir regex geçişiyle yeniden yazılır.
+        """
+        report = self.progress.item
+        replacer = mapping if isinstance(mapping, MultiReplacer) else MultiReplacer(mapping)
+        subn = replacer.subn
         
-        def remove_from_items(items):
-            nonlocal removed_count
-            items_to_remove = []
+        def replace_many(item):
+            request = item['request']
+            changed = False
+            
+            # URL'de değiştir
+            url = request.get('url')
+            if isinstance(url, str):
+                url, replaced = subn(url)
+                if replaced:
+                    request['url'] = url
+                    changed = True
+            elif isinstance(url, dict) and isinstance(url.get('raw'), str):
+                raw, replaced = subn(url['raw'])
+                if replaced:
+                    url['raw'] = raw
+                    changed = True
+            if changed:
+                self._reindex(item)
             
-            for i, item in enumerate(items):
-                if 'request' in item:
-                    request = item['request']
-                    if request.get('method', '').upper() == method.upper():
-                        items_to_remove.append(i)
-                        print(f"✅ {method} endpoint kaldırıldı: {item.get('name', 'Unnamed')}")
-                        removed_count += 1
-                elif 'item' in item:
-                    # Folder içindeki itemleri kontrol et
-                    remove_from_items(item['item'])
+            # Header değerlerinde değiştir
+            for header in request.get('header') or ():
+                if isinstance(header, dict) and 'value' in header:
+                    value = header['value']
+                    value, replaced = subn(value if isinstance(value, str) else str(value))
+                    if replaced:
+                        header['value'] = value
+                        changed = True
             
-            # Geriye doğru sil (index'ler değişmesin)
-            for i in reversed(items_to_remove):
-                items.pop(i)
+            # Body'de değiştir
+            body = request.get('body')
+            if isinstance(body, dict) and 'raw' in body:
+                raw = body['raw']
+                raw, replaced = subn(raw if isinstance(raw, str) else str(raw))
+                if replaced:
+                    body['raw'] = raw
+                    changed = True
+            
+            if changed:
+                report(f"✅ Metin değiştirildi: {item.get('name', 'Unnamed')}")
+            return changed
         
-        remove_from_items(self.collection.get('item', []))
-        print(f"🎉 Toplam {removed_count} adet {method} endpoint'i kaldırıldı!")
-        return removed_count
+        return replace_many, lambda count: (f"🎉 Toplam {count} request'te {len(replacer)} metin çifti "
+                                            f"değiştirildi!")
     
+    # apply_operations'ta kullanılabilecek işlemler ve ziyaretçi fabrikaları
+    OPERATIONS = {
+        'add_header': '_header_adder',
+        'remove_header': '_header_remover',
+        'remove_scripts': '_script_remover',
+        'update_url': '_base_url_updater',
+        'replace_text': '_text_replacer',
+        'replace_many': '_multi_replacer',
+    }
+    
+    @profiled('editor.apply_operations')
+    def apply_operations(self, operations: List[tuple]) -> List[int]:
+        """Request başına işlemleri tek bir ağaç gezintisinde uygular
+        
+        Her işlem (ad, *argümanlar) şeklinde verilir; ör.
+        [('add_header', 'Authorization', 'Bearer X'), ('remove_scripts',),
+        ('replace_text', 'old', 'new')]. Her request'e işlemler verilen
+        sırayla uygulanır; sonuç işlemleri ayrı ayrı, sırayla çalıştırmakla
+        aynıdır.
+        
+        Returns:
+            Her işlemin değiştirdiği request sayısı (işlem sırasıyla)
+        """
+        if not operations:
+            return []
+        visitors = []
+        for name, *args in operations:
+            factory = self.OPERATIONS.get(name)
+            if factory is None:
+                raise ValueError(f"Bilinmeyen işlem: {name} (seçenekler: {', '.join(self.OPERATIONS)})")
+            visitors.append(getattr(self, factory)(*args))
+        
+        counts = [0] * len(visitors)
+        visits = [visit for visit, _ in visitors]
+        
+        advance = self.progress.advance
+        self._start(operations[0][0] if len(operations) == 1 else 'operations')
+        for _, _, _, item in self.iter_requests():
+            for i, visit in enumerate(visits):
+                if visit(item):
+                    counts[i] += 1
+            advance()
+        self.progress.finish("\n".join(summary(count) for (_, summary), count in zip(visitors, counts)),
+                             sum(counts))
+        return counts
+    
+    @profiled('editor.add_header_to_all_requests')
+    def add_header_to_all_requests(self, header_name: str, header_value: str, overwrite: bool = True):
+        """Tüm requestlere header ekler"""
+        return self.apply_operations([('add_header', header_name, header_value, overwrite)])[0]
+    
+    @profiled('editor.remove_header_from_all_requests')
+    def remove_header_from_all_requests(self, header_name: str):
+        """Tüm requestlerden belirtilen header'ı kaldırır"""
+        return self.apply_operations([('remove_header', header_name)])[0]
+    
+    @profiled('editor.remove_all_scripts')
+    def remove_all_scripts(self):
+        """Tüm pre-request ve test scriptlerini kaldırır"""
+        return self.apply_operations([('remove_scripts',)])[0]
+    
+    @profiled('editor.update_base_url')
+    def update_base_url(self, old_url: str, new_url: str):
+        """old_url ile başlayan tüm request URL'lerinde baştaki kısmı new_url yapar"""
+        return self.apply_operations([('update_url', old_url, new_url)])[0]
+    
+    def _remove_entries(self, operation: str, entries, label: str = "Endpoint") -> int:
+        """İndeks kayıtlarını tek seferde siler, silinen her request'i raporlar"""
+        self.progress.start(operation, len(entries))
+        report = self.progress.item
+        for entry in entries:
+            report(f"✅ {label} kaldırıldı: {entry.item.get('name', 'Unnamed')}")
+        removed = self.index.remove(entries)
+        self.progress.advance(removed)
+        return removed
+
+    def find_requests(self, name: str = None, method: str = None, host: str = None,
+                      path: str = None) -> List[Dict]:
+        """Verilen alanların hepsine uyan request item'larını indeksten döndürür
 
+        name büyük/küçük harf duyarsız, host ve method normalize edilerek
+        karşılaştırılır; path tam eşleşmelidir (ör. '/users/1').
+        """
+        index = self.index
+        candidates = None
+        for finder, value in ((index.find_by_name, name), (index.find_by_method, method),
+                              (index.find_by_host, host), (index.find_by_path, path)):
+            if value is None:
+                continue
+            found = finder(value)
+            if candidates is None:
+                candidates = found
+            else:
+                ids = {entry.id for entry in found}
+                candidates = [entry for entry in candidates if entry.id in ids]
+        if candidates is None:
+            candidates = list(index)
+        return [entry.item for entry in candidates]
+
+    @profiled('editor.remove_endpoint_by_name')
+    def remove_endpoint_by_name(self, endpoint_name: str):
+        """Belirtilen isme sahip endpoint'i kaldırır"""
+        removed_count = self._remove_entries('remove_endpoint', self.index.find_by_name(endpoint_name))
+        self.progress.finish(f"🎉 Toplam {removed_count} endpoint kaldırıldı!", removed_count)
+        return removed_count
     
+    @profiled('editor.remove_endpoints_by_method')
+    def remove_endpoints_by_method(self, method: str):
+        """Belirtilen HTTP method'una sahip tüm endpoint'leri kaldırır"""
+        removed_count = self._remove_entries('remove_method', self.index.find_by_method(method),
+                                             f"{method} endpoint")
+        self.progress.finish(f"🎉 Toplam {removed_count} adet {method} endpoint'i kaldırıldı!", removed_count)
+        return removed_count
+    
+    @profiled('editor.remove_multiple_endpoints')
     def remove_multiple_endpoints(self, endpoint_names: list):
-        """Birden fazla endpoint'i isimlerine göre kaldırır"""
-        total_removed = 0
-        
+        """Birden fazla endpoint'i isimlerine göre tek seferde kaldırır"""
+        entries = {}
         for name in endpoint_names:
-            removed = self.remove_endpoint_by_name(name)
-            total_removed += removed
-        
-        print(f"🎉 Toplam {total_removed} endpoint kaldırıldı!")
+            for entry in self.index.find_by_name(name):
+                entries[entry.id] = entry
+        total_removed = self._remove_entries('remove_endpoints', list(entries.values()))
+        self.progress.finish(f"🎉 Toplam {total_removed} endpoint kaldırıldı!", total_removed)
         return total_removed
     
-    def list_all_endpoints(self):
-        """Tüm endpoint'leri listeler"""
-        endpoints = []
-        
-        def collect_endpoint(item):
-            if 'request' not in item:
-                return
-                
+    def iter_endpoints(self):
+        """Endpoint'leri name / method / url sözlükleri olarak liste kurmadan tek tek üretir"""
+        for _, _, _, item in self.iter_requests():
             request = item['request']
-            method = request.get('method', 'UNKNOWN')
-            
             url = request.get('url', '')
             if isinstance(url, dict):
                 url = url.get('raw', '')
-            
-            endpoints.append({
+            yield {
                 'name': item.get('name', 'Unnamed'),
-                'method': method,
+                'method': request.get('method', 'UNKNOWN'),
                 'url': url
-            })
-        
-        self._process_items_recursive(self.collection.get('item', []), collect_endpoint)
-        
-        print("\n📋 Collection'daki tüm endpoint'ler:")
-        print("-" * 80)
-        for i, endpoint in enumerate(endpoints, 1):
-            print(f"{i:3d}. [{endpoint['method']:6s}] {endpoint['name']}")
-            print(f"      URL: {endpoint['url']}")
-            print()
-        
-        return endpoints
+            }
     
+    @profiled('editor.list_all_endpoints')
+    def list_all_endpoints(self):
+        """Tüm endpoint'leri name / method / url sözlükleri olarak döndürür
+
+        Konsola yazdırmak için print_endpoints() kullanılır.
+        """
+        return list(self.iter_endpoints())
+    
+    @profiled('editor.get_collection_info')
     def get_collection_info(self):
-        """Collection hakkında genel bilgi verir"""
+        """Collection hakkında genel bilgiyi raporlar ve sözlük olarak döndürür"""
         if not self.collection:
-            print("❌ Collection yüklenmemiş!")
-            return
+            self.progress.error("❌ Collection yüklenmemiş!")
+            return None
         
         info = self.collection.get('info', {})
         name = info.get('name', 'Bilinmeyen')
         description = info.get('description', 'Açıklama yok')
         
-        # Request sayısını hesapla
-        request_count = 0
-        def count_requests(items):
-            nonlocal request_count
-            for item in items:
-                if 'request' in item:
-                    request_count += 1
-                elif 'item' in item:
-                    count_requests(item['item'])
+        request_count = len(self._index) if self._index is not None else self._count_requests()
+        size_mb = os.path.getsize(self.collection_path) / 1024 / 1024
         
-        count_requests(self.collection.get('item', []))
-        
-        print(f"\n📊 Collection Bilgileri:")
-        print(f"   Adı: {name}")
-        print(f"   Açıklama: {description}")
-        print(f"   Toplam Request Sayısı: {request_count}")
-        print(f"   Dosya Boyutu: {os.path.getsize(self.collection_path) / 1024 / 1024:.2f} MB")
+        self.progress.info(f"\n📊 Collection Bilgileri:\n"
+                           f"   Adı: {name}\n"
+                           f"   Açıklama: {description}\n"
+                           f"   Toplam Request Sayısı: {request_count}\n"
+                           f"   Dosya Boyutu: {size_mb:.2f} MB")
+        return {'name': name, 'description': description, 'request_count': request_count, 'size_mb': size_mb}
     
 
     
+    @profiled('editor.add_environment_variable')
     def add_environment_variable(self, var_name: str, var_value: str):
         """Collection seviyesinde environment variable ekler"""
         if 'variable' not in self.collection:
@@ -345,268 +547,56 @@ class PostmanCollectionEditor:
         
         if existing_var:
             existing_var['value'] = var_value
-            print(f"🔄 Variable güncellendi: {var_name} = {var_value}")
+            self.progress.info(f"🔄 Variable güncellendi: {var_name} = {var_value}")
         else:
             new_var = {
                 "key": var_name,
                 "value": var_value
             }
             self.collection['variable'].append(new_var)
-            print(f"✅ Variable eklendi: {var_name} = {var_value}")
+            self.progress.info(f"✅ Variable eklendi: {var_name} = {var_value}")
     
+    @profiled('editor.replace_text_in_requests')
     def replace_text_in_requests(self, old_text: str, new_text: str):
         """Tüm requestlerde belirtilen metni değiştirir (URL, body, header değerlerinde)"""
-        count = 0
-        
-        def replace_text(item):
-            nonlocal count
-            if 'request' not in item:
-                return
-                
-            request = item['request']
-            changed = False
-            
-            # URL'de değiştir
-            if 'url' in request:
-                url = request['url']
-                if isinstance(url, str) and old_text in url:
-                    request['url'] = url.replace(old_text, new_text)
-                    changed = True
-                elif isinstance(url, dict) and 'raw' in url and old_text in url['raw']:
-                    url['raw'] = url['raw'].replace(old_text, new_text)
-                    changed = True
-            
-            # Header değerlerinde değiştir
-            if 'header' in request:
-                for header in request['header']:
-                    if isinstance(header, dict):
-                        if 'value' in header and old_text in str(header['value']):
-                            header['value'] = str(header['value']).replace(old_text, new_text)
-                            changed = True
-            
-            # Body'de değiştir
-            if 'body' in request and request['body']:
-                body = request['body']
-                if isinstance(body, dict):
-                    if 'raw' in body and old_text in str(body['raw']):
-                        body['raw'] = str(body['raw']).replace(old_text, new_text)
-                        changed = True
-            
-            if changed:
-                print(f"✅ Metin değiştirildi: {item.get('name', 'Unnamed')}")
-                count += 1
-        
-        self._process_items_recursive(self.collection.get('item', []), replace_text)
-        print(f"🎉 Toplam {count} request'te '{old_text}' -> '{new_text}' değiştirildi!")
-        return count
+        return self.apply_operations([('replace_text', old_text, new_text)])[0]
+
+    @profiled('editor.replace_many_in_requests')
+    def replace_many_in_requests(self, mapping: Dict[str, str]):
+        """Eşlemedeki tüm eski -> yeni metin çiftlerini tek geçişte değiştirir (URL, body, header değerlerinde)
+
+        Değiştirmeler aynı anda yapılır; aynı konumda uzun anahtar önceliklidir.
+        """
+        return self.apply_operations([('replace_many', mapping)])[0]
 
     @staticmethod
-    def har_to_postman_collection(har_file_path: str, collection_name: str = None):
-        """HAR dosyasını Postman collection'ına çevirir"""
-        try:
-            # HAR dosyasını yükle
-            with open(har_file_path, 'r', encoding='utf-8') as f:
-                har_data = json.load(f)
-            
-            if 'log' not in har_data or 'entries' not in har_data['log']:
-                raise ValueError("Geçersiz HAR dosyası formatı")
-            
-            entries = har_data['log']['entries']
-            
-            # Collection adını belirle
-            if not collection_name:
-                collection_name = f"HAR Import - {os.path.basename(har_file_path)}"
-            
-            # Postman collection template
-            collection = {
-                "info": {
-                    "name": collection_name,
-                    "description": f"HAR dosyasından çevrildi: {har_file_path}",
-                    "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
-                    "_postman_id": str(uuid.uuid4())
-                },
-                "item": []
-            }
-            
-            # Domain'lere göre grupla
-            domain_items = {}
-            
-            print(f"🔄 {len(entries)} HTTP isteği işleniyor...")
-            
-            for i, entry in enumerate(entries):
-                if 'request' not in entry:
-                    continue
-                
-                har_request = entry['request']
-                
-                # URL'yi parse et
-                url = har_request.get('url', '')
-                if not url:
-                    continue
-                
-                parsed_url = urlparse(url)
-                domain = parsed_url.netloc or 'unknown'
-                
-                # Postman request formatına çevir
-                postman_request = PostmanCollectionEditor._convert_har_request_to_postman(har_request, i + 1)
-                
-                # Domain grubuna ekle
-                if domain not in domain_items:
-                    domain_items[domain] = {
-                        "name": domain,
-                        "item": []
-                    }
-                
-                domain_items[domain]["item"].append(postman_request)
-            
-            # Domain'leri collection'a ekle
-            for domain_item in domain_items.values():
-                collection["item"].append(domain_item)
-            
-            total_requests = sum(len(domain["item"]) for domain in domain_items.values())
-            print(f"✅ {total_requests} istek {len(domain_items)} domain'de gruplandı")
-            
-            return collection
-            
-        except Exception as e:
-            print(f"❌ HAR çevirilirken hata: {e}")
-            return None
+    def har_to_postman_collection(har_file_path: str, collection_name: str = None, **options):
+        """HAR dosyasını Postman collection'ına çevirir
+
+        Çevirme har_to_postman modülünde yapılır; stream=True gibi ek
+        seçenekler olduğu gibi iletilir.
+        """
+        return har_to_postman.har_to_postman_collection(har_file_path, collection_name, **options)
     
     @staticmethod
-    def _convert_har_request_to_postman(har_request: Dict, request_index: int):
-        """Tek bir HAR request'ini Postman formatına çevirir"""
-        url = har_request.get('url', '')
-        method = har_request.get('method', 'GET').upper()
-        
-        # URL'yi parse et
-        parsed_url = urlparse(url)
-        
-        # Query parameters
-        query_params = []
-        if parsed_url.query:
-            for key, values in parse_qs(parsed_url.query, keep_blank_values=True).items():
-                for value in values:
-                    query_params.append({
-                        "key": key,
-                        "value": value
-                    })
-        
-        # HAR'dan gelen query params da ekle (fazladan kontrol)
-        if 'queryString' in har_request:
-            for param in har_request['queryString']:
-                query_params.append({
-                    "key": param.get('name', ''),
-                    "value": param.get('value', '')
-                })
-        
-        # Headers
-        headers = []
-        if 'headers' in har_request:
-            for header in har_request['headers']:
-                header_name = header.get('name', '')
-                header_value = header.get('value', '')
-                
-                # Bazı headerları skip et (browser otomatik ekliyor)
-                skip_headers = ['host', 'content-length', 'connection', 'accept-encoding']
-                if header_name.lower() not in skip_headers:
-                    headers.append({
-                        "key": header_name,
-                        "value": header_value,
-                        "type": "text"
-                    })
-        
-        # Request body
-        body = {}
-        if 'postData' in har_request and har_request['postData']:
-            post_data = har_request['postData']
-            mime_type = post_data.get('mimeType', '')
-            
-            if 'text' in post_data:
-                if 'application/json' in mime_type:
-                    body = {
-                        "mode": "raw",
-                        "raw": post_data['text'],
-                        "options": {
-                            "raw": {
-                                "language": "json"
-                            }
-                        }
-                    }
-                elif 'application/x-www-form-urlencoded' in mime_type:
-                    # Form data'yı parse et
-                    form_data = []
-                    if 'params' in post_data:
-                        for param in post_data['params']:
-                            form_data.append({
-                                "key": param.get('name', ''),
-                                "value": param.get('value', ''),
-                                "type": "text"
-                            })
-                    body = {
-                        "mode": "urlencoded",
-                        "urlencoded": form_data
-                    }
-                else:
-                    body = {
-                        "mode": "raw",
-                        "raw": post_data['text']
-                    }
-        
-        # URL objesi oluştur
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
-        
-        url_obj = {
-            "raw": url,
-            "protocol": parsed_url.scheme,
-            "host": parsed_url.netloc.split('.') if parsed_url.netloc else [],
-            "path": [p for p in parsed_url.path.split('/') if p]
-        }
-        
-        if query_params:
-            url_obj["query"] = query_params
-        
-        # Request name
-        request_name = f"{method} {parsed_url.path.split('/')[-1] or parsed_url.netloc}"
-        if len(request_name) > 50:
-            request_name = request_name[:47] + "..."
-        
-        # Postman request object
-        postman_request = {
-            "name": f"{request_index:03d}. {request_name}",
-            "request": {
-                "method": method,
-                "header": headers,
-                "url": url_obj
-            }
-        }
-        
-        # Body varsa ekle
-        if body:
-            postman_request["request"]["body"] = body
-        
-        return postman_request
+    def _convert_har_request_to_postman(har_request: Dict, request_index: int, header_policy=None):
+        """Tek bir HAR request'ini Postman formatına çevirir (header_policy: header_policy.HeaderPolicy)"""
+        return har_to_postman.convert_har_request_to_postman(har_request, request_index, header_policy)
 
     @staticmethod
-    def create_collection_from_har(har_file_path: str, output_path: str = None, collection_name: str = None):
+    def create_collection_from_har(har_file_path: str, output_path: str = None, collection_name: str = None,
+                                   **options):
         """HAR dosyasından Postman collection oluşturur ve kaydeder"""
-        collection = PostmanCollectionEditor.har_to_postman_collection(har_file_path, collection_name)
-        
-        if not collection:
-            return False
-        
-        # Output dosya adını belirle
-        if not output_path:
-            base_name = os.path.splitext(os.path.basename(har_file_path))[0]
-            output_path = f"{base_name}_postman_collection.json"
-        
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(collection, f, indent=2, ensure_ascii=False)
-            print(f"✅ Postman collection oluşturuldu: {output_path}")
-            return True
-        except Exception as e:
-            print(f"❌ Collection kaydedilirken hata: {e}")
-            return False
+        return har_to_postman.create_collection_from_har(har_file_path, output_path, collection_name, **options)
+
+def print_endpoints(endpoints: List[Dict]):
+    """list_all_endpoints() sonucunu konsola yazdırır"""
+    print("\n📋 Collection'daki tüm endpoint'ler:")
+    print("-" * 80)
+    for i, endpoint in enumerate(endpoints, 1):
+        print(f"{i:3d}. [{endpoint['method']:6s}] {endpoint['name']}")
+        print(f"      URL: {endpoint['url']}")
+        print()
 
 def interactive_menu():
     """Interaktif menü"""
@@ -652,7 +642,7 @@ def interactive_menu():
         elif choice == "1":
             editor.get_collection_info()
         elif choice == "2":
-            editor.list_all_endpoints()
+            print_endpoints(editor.list_all_endpoints())
         elif choice == "3":
             header_name = input("Header adı: ").strip()
             header_value = input("Header değeri: ").strip()
@@ -728,7 +718,7 @@ def interactive_menu():
                     else:
                         print("❌ Endpoint isimleri boş olamaz!")
                 elif sub_choice == "4":
-                    editor.list_all_endpoints()
+                    print_endpoints(editor.list_all_endpoints())
                 else:
                     print("❌ Geçersiz seçim!")
         elif choice == "9":
@@ -5,12 +5,13 @@ Postman Collection Düzenleyici
 Bu script Postman collection JSON dosyalarında toplu düzenlemeler yapmanızı sağlar.
 """
 
-import json
 import os
 import argparse
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+import json_codec
+
 class PostmanCollectionEditor:
     def __init__(self, collection_path: str):
         """
@@ -26,20 +27,18 @@ class PostmanCollectionEditor:
     def load_collection(self):
         """Collection dosyasını yükler"""
         try:
-            with open(self.collection_path, 'r', encoding='utf-8') as f:
-                self.collection = json.load(f)
+            self.collection = json_codec.read_json_file(self.collection_path)
             print(f"✅ Collection başarıyla yüklendi: {self.collection_path}")
             return True
         except Exception as e:
             print(f"❌ Collection yüklenirken hata: {e}")
             return False
     
-    def save_collection(self, output_path: Optional[str] = None):
+    def save_collection(self, output_path: Optional[str] = None, compact: bool = False):
         """Collection'ı dosyaya kaydeder"""
         save_path = output_path or self.collection_path
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(self.collection, f, indent=2, ensure_ascii=False)
+            json_codec.write_json_file(self.collection, save_path, compact)
             print(f"✅ Collection kaydedildi: {save_path}")
             return True
         except Exception as e:
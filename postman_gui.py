@@ -9,6 +9,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 from postman_collection_editor import PostmanCollectionEditor
+from progress import ProgressReporter
 
 class PostmanGUI:
     def __init__(self, root):
@@ -173,7 +174,7 @@ class PostmanGUI:
             return
             
         try:
-            self.editor = PostmanCollectionEditor(file_path)
+            self.editor = PostmanCollectionEditor(file_path, progress=ProgressReporter(self.on_progress))
             if self.editor.load_collection():
                 self.collection_file = file_path
                 self.status_var.set(f"Collection yüklendi: {os.path.basename(file_path)}")
@@ -185,6 +186,17 @@ class PostmanGUI:
         except Exception as e:
             messagebox.showerror("Hata", f"Collection yüklenirken hata: {e}\n\nDosyanın UTF-8 encoding'inde olduğundan emin olun.")
             
+    def on_progress(self, event):
+        """Editör ilerleme olaylarını status bar'da gösterir"""
+        if event.kind == 'progress':
+            total = f"/{event.total}" if event.total else ""
+            self.status_var.set(f"⏳ {event.operation}: {event.current}{total}")
+        elif event.kind in ('finish', 'warning', 'error') and event.message:
+            self.status_var.set(event.message.strip())
+        else:
+            return
+        self.root.update_idletasks()
+            
     def update_info(self):
         """Collection bilgilerini güncelle"""
         if not self.editor:
@@ -196,16 +208,7 @@ class PostmanGUI:
             description = info.get('description', 'Açıklama yok')
             
             # Request sayısını hesapla
-            request_count = 0
-            def count_requests(items):
-                nonlocal request_count
-                for item in items:
-                    if 'request' in item:
-                        request_count += 1
-                    elif 'item' in item:
-                        count_requests(item['item'])
-            
-            count_requests(self.editor.collection.get('item', []))
+            request_count = sum(1 for _ in self.editor.iter_requests())
             
             file_size = os.path.getsize(self.collection_file) / 1024 / 1024
             
@@ -6,10 +6,17 @@ Streamlit ile web tabanlı arayüz
 """
 
 import streamlit as st
+import contextlib
 import os
-import json
 import tempfile
+
+import json_codec
 from postman_collection_editor import PostmanCollectionEditor
+from conversion_cache import ConversionCache
+from progress import ProgressReporter
+
+# Aynı HAR tekrar yüklendiğinde çevirme sonucu diskten gelir
+HAR_CONVERSION_CACHE = ConversionCache()
 
 # Session state'i initialize et
 if 'editor' not in st.session_state:
@@ -23,6 +30,31 @@ def init_session_state():
     """Session state'i başlat (artık gerekmiyor ama uyumluluk için bırakıldı)"""
     pass
 
+@contextlib.contextmanager
+def operation_progress(label: str):
+    """Blok boyunca editörün ilerleme olaylarını st.progress ile gösterir"""
+    editor = st.session_state.editor
+    bar = st.progress(0.0, text=label)
+
+    def render(event):
+        if event.kind in ('start', 'progress', 'finish'):
+            if event.fraction is not None:
+                bar.progress(event.fraction, text=f"{label} {event.current}/{event.total}")
+            else:
+                # Toplam bilinmiyorsa sadece işlenen request sayısı gösterilir
+                bar.progress(1.0 if event.kind == 'finish' else 0.0, text=f"{label} {event.current}")
+        elif event.kind == 'warning':
+            st.warning(event.message)
+        elif event.kind == 'error':
+            st.error(event.message)
+
+    editor.progress = ProgressReporter(render, interval=0.25)
+    try:
+        yield
+    finally:
+        editor.progress = ProgressReporter(quiet=True)
+        bar.empty()
+
 def main():
     st.set_page_config(
         page_title="Postman Collection Düzenleyici",
@@ -127,7 +159,7 @@ def load_collection(uploaded_file):
             tmp_file_path = tmp_file.name
         
         # Editor oluştur ve yükle
-        editor = PostmanCollectionEditor(tmp_file_path)
+        editor = PostmanCollectionEditor(tmp_file_path, progress=ProgressReporter(quiet=True))
         if editor.load_collection():
             st.session_state.editor = editor
             st.session_state.collection_loaded = True
@@ -188,7 +220,8 @@ def header_operations():
         if st.button("Header Ekle", type="primary"):
             if header_name and header_value:
                 try:
-                    count = st.session_state.editor.add_header_to_all_requests(header_name, header_value)
+                    with operation_progress("Header ekleniyor..."):
+                        count = st.session_state.editor.add_header_to_all_requests(header_name, header_value)
                     st.success(f"✅ {count} request'e '{header_name}' header'ı eklendi!")
                 except Exception as e:
                     st.error(f"❌ Hata: {e}")
@@ -205,7 +238,8 @@ def header_operations():
         if st.button("Header Kaldır", type="secondary"):
             if remove_header_name:
                 try:
-                    count = st.session_state.editor.remove_header_from_all_requests(remove_header_name)
+                    with operation_progress("Header kaldırılıyor..."):
+                        count = st.session_state.editor.remove_header_from_all_requests(remove_header_name)
                     st.success(f"✅ {count} request'ten '{remove_header_name}' header'ı kaldırıldı!")
                 except Exception as e:
                     st.error(f"❌ Hata: {e}")
@@ -234,7 +268,8 @@ def text_operations():
     if st.button("🔄 Metin Değiştir", type="primary"):
         if old_text and new_text:
             try:
-                count = st.session_state.editor.replace_text_in_requests(old_text, new_text)
+                with operation_progress("Metin değiştiriliyor..."):
+                    count = st.session_state.editor.replace_text_in_requests(old_text, new_text)
                 st.success(f"✅ {count} request'te '{old_text}' -> '{new_text}' değiştirildi!")
                 # Endpoint'leri yenile
                 st.session_state.endpoints = st.session_state.editor.list_all_endpoints()
@@ -254,7 +289,8 @@ def script_operations():
     
     if st.button("🗑️ Tüm Scriptleri Kaldır", type="primary", disabled=not confirm):
         try:
-            count = st.session_state.editor.remove_all_scripts()
+            with operation_progress("Scriptler kaldırılıyor..."):
+                count = st.session_state.editor.remove_all_scripts()
             st.success(f"✅ {count} request'ten scriptler kaldırıldı!")
         except Exception as e:
             st.error(f"❌ Hata: {e}")
@@ -381,18 +417,11 @@ def endpoint_detail_view(filtered_df):
 
 def find_endpoint_in_collection(endpoint_name):
     """Collection'da endpoint'i bul ve tam verisini döndür"""
-    def search_in_items(items, target_name):
-        for item in items:
-            if 'request' in item and item.get('name', '') == target_name:
-                return item
-            elif 'item' in item:
-                result = search_in_items(item['item'], target_name)
-                if result:
-                    return result
-        return None
-    
     if st.session_state.get('editor') and st.session_state.editor.collection:
-        return search_in_items(st.session_state.editor.collection.get('item', []), endpoint_name)
+        # İndeks isimleri büyük/küçük harf duyarsız tutar; tam eşleşeni seç
+        for item in st.session_state.editor.find_requests(name=endpoint_name):
+            if item.get('name', '') == endpoint_name:
+                return item
     return None
 
 def edit_endpoint_interface(endpoint_data, selected_endpoint):
@@ -454,8 +483,10 @@ def edit_general_info(endpoint_data):
         value=endpoint_data.get('name', ''),
         key="edit_name"
     )
+    changed = False
     if new_name != endpoint_data.get('name', ''):
         endpoint_data['name'] = new_name
+        changed = True
     
     # HTTP Method
     methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']
@@ -468,6 +499,7 @@ def edit_general_info(endpoint_data):
     )
     if new_method != current_method:
         request['method'] = new_method
+        changed = True
     
     # URL
     current_url = request.get('url', '')
@@ -485,6 +517,11 @@ def edit_general_info(endpoint_data):
             request['url']['raw'] = new_url
         else:
             request['url'] = new_url
+        changed = True
+    
+    if changed:
+        # Editörün request indeksi isim / method / URL anahtarlarını tutar
+        st.session_state.editor.index.update(endpoint_data)
     
     # Açıklama
     current_description = endpoint_data.get('request', {}).get('description', '')
@@ -629,9 +666,8 @@ def edit_body(endpoint_data):
                     content = current_raw.strip()
                     if content.startswith('{') or content.startswith('['):
                         # JSON formatla
-                        import json
-                        parsed_json = json.loads(content)
-                        formatted = json.dumps(parsed_json, indent=2, ensure_ascii=False)
+                        parsed_json = json_codec.loads(content)
+                        formatted = json_codec.dumps(parsed_json)
                         st.session_state['beautified_body'] = formatted
                         st.success("✅ Formatlandı")
                     elif content.startswith('<'):
@@ -655,9 +691,8 @@ def edit_body(endpoint_data):
                     content = current_raw.strip()
                     if content.startswith('{') or content.startswith('['):
                         # JSON minify
-                        import json
-                        parsed_json = json.loads(content)
-                        minified = json.dumps(parsed_json, separators=(',', ':'), ensure_ascii=False)
+                        parsed_json = json_codec.loads(content)
+                        minified = json_codec.dumps(parsed_json, compact=True)
                         st.session_state['beautified_body'] = minified
                         st.success("✅ Sıkıştırıldı")
                     else:
@@ -919,7 +954,8 @@ def har_converter_sidebar():
                     # HAR'ı çevir
                     collection = PostmanCollectionEditor.har_to_postman_collection(
                         tmp_har_path, 
-                        collection_name
+                        collection_name,
+                        cache=HAR_CONVERSION_CACHE
                     )
                     
                     if collection:
@@ -951,11 +987,7 @@ def har_converter_sidebar():
         
         # İndirme butonu
         if st.session_state.get('converted_collection'):
-            collection_json = json.dumps(
-                st.session_state.converted_collection, 
-                indent=2, 
-                ensure_ascii=False
-            )
+            collection_json = json_codec.dumps_bytes(st.session_state.converted_collection)
             
             st.download_button(
                 label="📥 Collection İndir",
@@ -984,7 +1016,7 @@ if st.session_state.get('collection_loaded', False):
         if st.button("📥 Güncellenmiş Collection'ı İndir", type="primary", use_container_width=True):
             try:
                 # Collection'ı JSON string'e çevir
-                collection_json = json.dumps(st.session_state.editor.collection, indent=2, ensure_ascii=False)
+                collection_json = json_codec.dumps_bytes(st.session_state.editor.collection)
                 
                 # İndirme
                 filename = st.session_state.uploaded_filename.replace('.json', '_updated.json')
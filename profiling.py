@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aşama Profilleme
+Çevirme ve düzenleme işlemlerinin hangi aşamada (JSON parse, URL parse,
+header filtreleme, gruplama, serialize...) ne kadar sürdüğünü ölçer.
+Profilleme kapalıyken stage() paylaşılan boş bir context döndürür; ölçüm
+kodu yerinde kalabilir. Süreler iç içe aşamalar düşülerek (self time)
+tutulur; böylece aşama süreleri toplamı toplam süreye eşit olur.
+
+    with profiling(stats_path='convert.pstats', trace_memory=True) as profiler:
+        har_to_postman_collection('capture.har')
+    print(profiler.format_report())
+
+workers > 1 ile çevirmede worker process'lerdeki aşamalar ölçülmez; bu
+süreler onları bekleyen aşamaya (convert) yazılır.
+"""
+
+import cProfile
+import contextlib
+import functools
+import time
+import tracemalloc
+
+_active = None
+
+
+class _NullStage:
+    """Profilleme kapalıyken kullanılan, hiçbir şey yapmayan context"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'started', 'child_time')
+
+    def __init__(self, profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.child_time = 0.0
+
+    def __enter__(self):
+        self.profiler._stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started
+        stack = self.profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1].child_time += elapsed
+        self.profiler._record(self.name, elapsed - self.child_time)
+        return False
+
+
+class Profiler:
+    """Aşama süreleri (self time), çağrı sayıları ve sayaçları toplar"""
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.started = time.perf_counter()
+        self.total_seconds = None
+        self.memory_peak = None
+        self.stats_path = None
+        self._stack = []
+
+    def stage(self, name: str):
+        return _Stage(self, name)
+
+    def _record(self, name: str, seconds: float):
+        stage = self.stages.get(name)
+        if stage is None:
+            self.stages[name] = [seconds, 1]
+        else:
+            stage[0] += seconds
+            stage[1] += 1
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def iterate(self, name: str, iterable):
+        """Iterable'dan her eleman çekilişini name aşamasına yazar"""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def report(self):
+        """JSON'a yazılabilir özet"""
+        total = self.total_seconds if self.total_seconds is not None else time.perf_counter() - self.started
+        return {
+            "total_seconds": total,
+            "stages": {name: {"seconds": seconds, "calls": calls}
+                       for name, (seconds, calls) in sorted(self.stages.items(), key=lambda item: -item[1][0])},
+            "counters": dict(self.counters),
+            "memory_peak_bytes": self.memory_peak,
+            "stats_path": self.stats_path
+        }
+
+    def format_report(self):
+        """Aşama dökümünü tablo olarak biçimlendirir"""
+        report = self.report()
+        total = report["total_seconds"] or 1e-9
+        measured = sum(stage["seconds"] for stage in report["stages"].values())
+        width = max([len(name) for name in report["stages"]] + [24])
+        rule = "-" * (width + 29)
+        lines = ["\n⏱️  Aşama dökümü", f"{'Aşama':<{width}} {'Süre (s)':>10} {'%':>6} {'Çağrı':>10}", rule]
+        for name, stage in report["stages"].items():
+            lines.append(f"{name:<{width}} {stage['seconds']:>10.3f} {stage['seconds'] / total * 100:>6.1f} "
+                         f"{stage['calls']:>10}")
+        other = max(total - measured, 0.0)
+        lines.append(f"{'(diğer)':<{width}} {other:>10.3f} {other / total * 100:>6.1f}")
+        lines.append(rule)
+        lines.append(f"{'Toplam':<{width}} {total:>10.3f}")
+        for name, value in report["counters"].items():
+            lines.append(f"🔢 {name}: {value}")
+        if report["memory_peak_bytes"] is not None:
+            lines.append(f"🧠 Tepe bellek (tracemalloc): {report['memory_peak_bytes'] / 1024 / 1024:.1f} MB")
+        if report["stats_path"]:
+            lines.append(f"📄 cProfile istatistikleri: {report['stats_path']} "
+                         f"(python -m pstats {report['stats_path']})")
+        return "\n".join(lines)
+
+
+def stage(name: str):
+    """Aktif profiler varsa name aşamasını ölçen context, yoksa boş context"""
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name)
+
+
+def count(name: str, amount: int = 1):
+    """Aktif profiler varsa sayacı artırır"""
+    if _active is not None:
+        _active.count(name, amount)
+
+
+def profile_iter(name: str, iterable):
+    """Aktif profiler varsa iterable'ı name aşaması olarak ölçer; yoksa aynen döndürür"""
+    if _active is None:
+        return iterable
+    return _active.iterate(name, iterable)
+
+
+def profiled(name: str):
+    """Fonksiyonu her çağrıda name aşaması olarak ölçen dekoratör"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextlib.contextmanager
+def profiling(stats_path: str = None, trace_memory: bool = False):
+    """Blok boyunca aşama profillemeyi açar
+
+    stats_path verilirse blok cProfile ile de profillenir ve istatistikler
+    pstats dosyası olarak kaydedilir. trace_memory=True verilirse
+    tracemalloc ile tepe bellek ölçülür (çalışmayı belirgin yavaşlatır).
+    """
+    global _active
+    previous = _active
+    profiler = Profiler()
+    _active = profiler
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+    c_profile = cProfile.Profile() if stats_path else None
+    if c_profile is not None:
+        c_profile.enable()
+    try:
+        yield profiler
+    finally:
+        if c_profile is not None:
+            c_profile.disable()
+            c_profile.dump_stats(stats_path)
+            profiler.stats_path = stats_path
+        if trace_memory:
+            profiler.memory_peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+        profiler.total_seconds = time.perf_counter() - profiler.started
+        _active = previous
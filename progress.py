@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İlerleme Olayları
+Editör işlemleri konsola yazmak yerine bir ProgressReporter'a olay (event)
+gönderir; CLI, Streamlit uygulaması ve Tk arayüzü bu olayları kendi
+yöntemleriyle gösterir. İşlenen request başına olay üretilmez: ilerleme
+en fazla `interval` saniyede bir, dokunulan request'lerin mesajları da
+`batch_size`'lık gruplar halinde bildirilir.
+
+    reporter = ProgressReporter(ConsoleRenderer(verbose=True))
+    editor = PostmanCollectionEditor('collection.json', progress=reporter)
+
+Olay türleri:
+    start     işlem başladı (total: işlenecek request sayısı, bilinmiyorsa None)
+    progress  current / total ilerlemesi (throttle edilir)
+    items     dokunulan request'lerin mesajları (toplu, item_events=True ise)
+    finish    işlem bitti (count: etkilenen request sayısı)
+    info / warning / error   tek seferlik mesajlar
+"""
+
+import sys
+import time
+
+DEFAULT_INTERVAL = 0.1
+DEFAULT_BATCH_SIZE = 500
+
+# Sessiz modda da iletilen olaylar
+_QUIET_KINDS = frozenset(('warning', 'error'))
+
+
+class ProgressEvent:
+    """Tek bir ilerleme olayı"""
+
+    __slots__ = ('kind', 'operation', 'message', 'current', 'total', 'count', 'items')
+
+    def __init__(self, kind: str, operation: str = None, message: str = '', current: int = 0,
+                 total: int = None, count: int = None, items=()):
+        self.kind = kind
+        self.operation = operation
+        self.message = message
+        self.current = current
+        self.total = total
+        self.count = count
+        self.items = items
+
+    @property
+    def fraction(self):
+        """0-1 arası ilerleme oranı (total bilinmiyorsa None)"""
+        if not self.total:
+            return None
+        return min(self.current / self.total, 1.0)
+
+    def __repr__(self):
+        return (f"ProgressEvent({self.kind!r}, {self.operation!r}, {self.message!r}, "
+                f"current={self.current}, total={self.total}, count={self.count})")
+
+
+class ProgressReporter:
+    """Olayları dinleyicilere ileten, ilerlemeyi throttle eden raporlayıcı
+
+    Args:
+        callback: Her olay için çağrılacak fonksiyon (ProgressEvent alır)
+        quiet: True ise sadece warning / error olayları iletilir
+        interval: İki progress olayı arasındaki en kısa süre (saniye)
+        batch_size: items olaylarında en fazla kaç mesaj biriktirileceği
+        item_events: True ise dokunulan request'lerin mesajları da iletilir
+    """
+
+    def __init__(self, callback=None, quiet: bool = False, interval: float = DEFAULT_INTERVAL,
+                 batch_size: int = DEFAULT_BATCH_SIZE, item_events: bool = False):
+        self.listeners = [callback] if callback is not None else []
+        self.quiet = quiet
+        self.interval = interval
+        self.batch_size = batch_size
+        self.item_events = item_events
+        self.operation = None
+        self.current = 0
+        self.total = None
+        self._pending = []
+        self._last_emit = 0.0
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    @property
+    def enabled(self):
+        return bool(self.listeners) and not self.quiet
+
+    def _emit(self, kind: str, message: str = '', count: int = None, items=()):
+        if not self.listeners or (self.quiet and kind not in _QUIET_KINDS):
+            return
+        event = ProgressEvent(kind, self.operation, message, self.current, self.total, count, items)
+        for listener in self.listeners:
+            listener(event)
+
+    def start(self, operation: str, total: int = None, message: str = ''):
+        """Yeni bir işlem başlatır; sayaçları sıfırlar"""
+        self.operation = operation
+        self.current = 0
+        self.total = total
+        self._pending = []
+        self._last_emit = time.perf_counter()
+        self._emit('start', message)
+
+    def advance(self, amount: int = 1):
+        """İşlenen request sayısını artırır; interval dolduysa progress olayı gönderir"""
+        self.current += amount
+        if not self.listeners or self.quiet:
+            return
+        now = time.perf_counter()
+        if now - self._last_emit >= self.interval:
+            self._last_emit = now
+            self._emit('progress')
+
+    def item(self, message: str):
+        """Dokunulan bir request'i bildirir; mesajlar toplu halde iletilir"""
+        if not self.item_events or not self.enabled:
+            return
+        self._pending.append(message)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            items, self._pending = self._pending, []
+            self._emit('items', items=items)
+
+    def finish(self, message: str = '', count: int = None):
+        """İşlemi bitirir: bekleyen mesajları ve son durumu gönderir"""
+        self._flush()
+        if self.total is not None:
+            self.current = max(self.current, self.total)
+        self._emit('finish', message, count)
+        self.operation = None
+
+    def info(self, message: str):
+        self._emit('info', message)
+
+    def warning(self, message: str):
+        self._emit('warning', message)
+
+    def error(self, message: str):
+        self._emit('error', message)
+
+
+class ConsoleRenderer:
+    """Olayları konsola yazan dinleyici
+
+    İlerleme sadece terminalde, tek satır üzerine yazılarak gösterilir.
+    verbose=True ise dokunulan request'lerin mesajları da yazılır (bunun
+    için raporlayıcının item_events=True olması gerekir).
+    """
+
+    def __init__(self, stream=None, verbose: bool = False):
+        self.stream = stream
+        self.verbose = verbose
+        self._line_open = False
+
+    def _out(self):
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _clear_line(self, out):
+        if self._line_open:
+            out.write("\r\033[K")
+            self._line_open = False
+
+    def __call__(self, event: ProgressEvent):
+        out = self._out()
+        if event.kind == 'progress':
+            if not out.isatty():
+                return
+            total = f"/{event.total}" if event.total else ""
+            out.write(f"\r⏳ {event.operation}: {event.current}{total}")
+            out.flush()
+            self._line_open = True
+            return
+
+        self._clear_line(out)
+        if event.kind == 'items':
+            if self.verbose:
+                out.write("".join(f"{message}\n" for message in event.items))
+        elif event.message:
+            out.write(f"{event.message}\n")
+
+
+def console_reporter(quiet: bool = False, verbose: bool = False, stream=None):
+    """Konsola yazan hazır raporlayıcı"""
+    return ProgressReporter(ConsoleRenderer(stream, verbose), quiet=quiet, item_events=verbose)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request Index
+Yüklü collection'daki request item'larının düz indeksi. Her request'e
+oturum boyunca değişmeyen bir id verilir; isim (casefold), method, host ve
+path'ten bu kayıtlara, kayıttan da item'a ve içinde bulunduğu parent
+listeye ulaşılır. Böylece isimle arama ve binlerce endpoint'in toplu
+silinmesi ağacı tekrar tekrar gezmeden yapılır.
+
+İndeks, item'ları değiştiren editör metotları tarafından güncel tutulur.
+Collection dışarıdan (ör. web arayüzünde doğrudan dict üzerinde)
+değiştirilirse update() ya da editördeki invalidate_index() çağrılmalıdır.
+"""
+
+from typing import Dict, List
+
+from collection_walk import iter_requests
+from url_cache import canonical_url
+
+
+def request_url_parts(request: Dict):
+    """Request URL'sinden (host, path) çıkarır; {{baseUrl}} gibi şemasız URL'leri de destekler"""
+    url = request.get('url', '')
+    if isinstance(url, dict):
+        url = url.get('raw', '')
+    if not isinstance(url, str) or not url:
+        return '', ''
+    parsed = canonical_url(url if '://' in url else '//' + url)
+    return parsed.netloc.lower(), parsed.path or '/'
+
+
+class IndexEntry:
+    """İndeksteki tek bir request: item, parent liste ve arama anahtarları"""
+
+    __slots__ = ('id', 'item', 'parent', 'name', 'method', 'host', 'path')
+
+    def __init__(self, entry_id: int, item: Dict, parent: List):
+        self.id = entry_id
+        self.item = item
+        self.parent = parent
+        self._refresh_keys()
+
+    def _refresh_keys(self):
+        request = self.item.get('request') or {}
+        self.name = self.item.get('name', '').casefold()
+        self.method = str(request.get('method', '')).upper()
+        self.host, self.path = request_url_parts(request)
+
+    def __repr__(self):
+        return f"IndexEntry({self.id}, {self.method} {self.host}{self.path}, name={self.name!r})"
+
+
+class RequestIndex:
+    """Collection ağacındaki request'lerin id / isim / method / host / path indeksi"""
+
+    _KEYS = ('name', 'method', 'host', 'path')
+
+    def __init__(self, items: List[Dict] = None):
+        self.entries = {}
+        self._by_item = {}
+        self._maps = {key: {} for key in self._KEYS}
+        self._next_id = 1
+        if items is not None:
+            self.build(items)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def build(self, items: List[Dict]):
+        """İndeksi sıfırdan kurar (id'ler 1'den başlar)"""
+        self.entries.clear()
+        self._by_item.clear()
+        for mapping in self._maps.values():
+            mapping.clear()
+        self._next_id = 1
+
+        for _, parent, _, item in iter_requests(items):
+            self.add(item, parent)
+
+    def _link(self, entry: IndexEntry):
+        for key in self._KEYS:
+            self._maps[key].setdefault(getattr(entry, key), {})[entry.id] = entry
+
+    def _unlink(self, entry: IndexEntry):
+        for key in self._KEYS:
+            mapping = self._maps[key]
+            bucket = mapping.get(getattr(entry, key))
+            if bucket is not None:
+                bucket.pop(entry.id, None)
+                if not bucket:
+                    del mapping[getattr(entry, key)]
+
+    def add(self, item: Dict, parent: List) -> IndexEntry:
+        """parent listesinde duran bir request item'ını indekse ekler"""
+        entry = IndexEntry(self._next_id, item, parent)
+        self._next_id += 1
+        self.entries[entry.id] = entry
+        self._by_item[id(item)] = entry
+        self._link(entry)
+        return entry
+
+    def entry_for(self, item: Dict):
+        """Item'ın indeks kaydı (indekste yoksa None)"""
+        return self._by_item.get(id(item))
+
+    def update(self, item: Dict):
+        """İsmi, method'u ya da URL'si değişen item'ın anahtarlarını yeniler"""
+        entry = self._by_item.get(id(item))
+        if entry is None:
+            return None
+        self._unlink(entry)
+        entry._refresh_keys()
+        self._link(entry)
+        return entry
+
+    def get(self, entry_id: int):
+        return self.entries.get(entry_id)
+
+    def _find(self, key: str, value: str) -> List[IndexEntry]:
+        return list(self._maps[key].get(value, {}).values())
+
+    def find_by_name(self, name: str) -> List[IndexEntry]:
+        return self._find('name', name.casefold())
+
+    def find_by_method(self, method: str) -> List[IndexEntry]:
+        return self._find('method', method.upper())
+
+    def find_by_host(self, host: str) -> List[IndexEntry]:
+        return self._find('host', host.lower())
+
+    def find_by_path(self, path: str) -> List[IndexEntry]:
+        return self._find('path', path)
+
+    def remove(self, entries) -> int:
+        """Kayıtları indeksten ve collection'dan siler
+
+        Her parent liste bir kez süzülür (liste nesnesi korunur); maliyet
+        silinen kayıt sayısı ve etkilenen parent'ların boyuyla orantılıdır.
+
+        Returns:
+            Silinen request sayısı
+        """
+        by_parent = {}
+        for entry in entries:
+            if self.entries.pop(entry.id, None) is None:
+                continue
+            del self._by_item[id(entry.item)]
+            self._unlink(entry)
+            by_parent.setdefault(id(entry.parent), (entry.parent, set()))[1].add(id(entry.item))
+
+        removed = 0
+        for parent, doomed in by_parent.values():
+            before = len(parent)
+            parent[:] = [item for item in parent if id(item) not in doomed]
+            removed += before - len(parent)
+        return removed
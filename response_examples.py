@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Response Örnekleri
+HAR entry'lerindeki response'ları Postman "saved example" (item.response)
+formatına çevirir.
+
+Body'ler tembel işlenir: boyutu encode edilmiş metinden tahmin edilir ve
+body sınırı ya da toplam bütçe aşılıyorsa hiç decode edilmez. Base64
+body'ler parça parça decode edilir; aynı base64 body (hash'e göre) yalnızca
+bir kez decode edilir. Bu sadece decode işini tekilleştirir: tekrar eden
+body her örneğe ayrı ayrı yazılır ve her seferinde bütçeden düşülür.
+"""
+
+import binascii
+import codecs
+import hashlib
+
+DEFAULT_MAX_BODY_SIZE = 256 * 1024
+DEFAULT_RESPONSE_BUDGET = 64 * 1024 * 1024
+
+# Base64 parça boyutu (4'ün katı olmalı)
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# Decode edilmiş body cache'inin üst sınırı (body sayısı)
+_BODY_CACHE_LIMIT = 1024
+
+# HAR'daki body zaten açılmış olduğundan bu header'lar örnekte yanıltıcı olur
+RESPONSE_SKIP_HEADERS = frozenset(('content-length', 'content-encoding', 'transfer-encoding', 'connection'))
+
+# Çevrilmiş request'e geçici olarak iliştirilen HAR response'unun anahtarı
+HAR_RESPONSE_KEY = '_har_response'
+
+# _body'nin metne çevrilemeyen (resim, font...) base64 body'ler için döndürdüğü değer
+_BINARY_BODY = object()
+
+
+def preview_language(mime_type: str):
+    """Postman'in body önizleme dilini mime tipinden belirler"""
+    mime_type = mime_type.lower()
+    if 'json' in mime_type:
+        return 'json'
+    if 'html' in mime_type:
+        return 'html'
+    if 'xml' in mime_type:
+        return 'xml'
+    return 'text'
+
+
+def estimated_body_size(content: dict):
+    """Body'nin decode edilmiş boyutunu decode etmeden tahmin eder"""
+    text = content.get('text') or ''
+    if content.get('encoding') == 'base64':
+        return len(text) * 3 // 4 - text[-2:].count('=')
+    return len(text)
+
+
+def decode_base64_text(text: str, limit: int):
+    """Base64 metni parça parça UTF-8 metne çevirir
+
+    limit byte aşılırsa ya da içerik metin değilse (resim, font...) None döner.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts = []
+    size = 0
+    try:
+        for start in range(0, len(text), BASE64_CHUNK_SIZE):
+            data = binascii.a2b_base64(text[start:start + BASE64_CHUNK_SIZE])
+            size += len(data)
+            if size > limit:
+                return None
+            parts.append(decoder.decode(data))
+        parts.append(decoder.decode(b'', final=True))
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    return ''.join(parts)
+
+
+class ResponseExampleBuilder:
+    """(domain, postman_request) akışındaki request'lere response örneği ekler
+
+    Çevirme aşaması HAR response'unu request'e HAR_RESPONSE_KEY altında
+    iliştirir; bu aşama onu alıp Postman örneğine çevirir. max_body_size
+    tek bir body'nin, budget tüm collection'daki body'lerin toplam üst
+    sınırıdır (byte). Sınırı aşan ve metne çevrilemeyen base64 body'li
+    örnekler body'siz (status ve header'larla) eklenir; ikisi
+    omitted_bodies ve binary_bodies olarak ayrı sayılır.
+    """
+
+    def __init__(self, max_body_size: int = DEFAULT_MAX_BODY_SIZE, budget: int = DEFAULT_RESPONSE_BUDGET):
+        self.max_body_size = max_body_size
+        self.budget = budget
+        self.used_bytes = 0
+        self.example_count = 0
+        self.omitted_bodies = 0
+        self.binary_bodies = 0
+        self._bodies = {}
+
+    def _body(self, content: dict):
+        """Body metnini döndürür; sınır aşılırsa None, body metin değilse _BINARY_BODY"""
+        text = content.get('text')
+        if not text:
+            return ''
+        size = estimated_body_size(content)
+        if size > self.max_body_size or self.used_bytes + size > self.budget:
+            return None
+
+        if content.get('encoding') != 'base64':
+            self.used_bytes += size
+            return text
+
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        try:
+            body = self._bodies[key]
+        except KeyError:
+            # Boyut tahmini sınırın altında olduğundan None ancak binary içerikte döner
+            body = decode_base64_text(text, self.max_body_size)
+            if body is None:
+                body = _BINARY_BODY
+            if len(self._bodies) >= _BODY_CACHE_LIMIT:
+                self._bodies.clear()
+            self._bodies[key] = body
+        if body is not _BINARY_BODY:
+            self.used_bytes += size
+        return body
+
+    def example(self, postman_request: dict, har_response: dict):
+        """HAR response'unu Postman örneğine çevirir"""
+        request = postman_request['request']
+        content = har_response.get('content') or {}
+        code = har_response.get('status', 0)
+        status = har_response.get('statusText', '')
+
+        body = self._body(content)
+        if body is None:
+            self.omitted_bodies += 1
+            body = ''
+        elif body is _BINARY_BODY:
+            self.binary_bodies += 1
+            body = ''
+
+        self.example_count += 1
+        return {
+            "name": f"{code} {status}".strip(),
+            "originalRequest": {key: request[key] for key in ('method', 'header', 'url', 'body') if key in request},
+            "status": status,
+            "code": code,
+            "_postman_previewlanguage": preview_language(content.get('mimeType', '')),
+            "header": [
+                {"key": header.get('name', ''), "value": header.get('value', '')}
+                for header in har_response.get('headers', [])
+                if header.get('name', '').lower() not in RESPONSE_SKIP_HEADERS
+            ],
+            "cookie": [],
+            "body": body
+        }
+
+    def attach(self, requests):
+        """İliştirilmiş HAR response'larını örneğe çevirip request'e ekler"""
+        for domain, postman_request in requests:
+            har_response = postman_request.pop(HAR_RESPONSE_KEY, None)
+            if har_response:
+                postman_request["response"] = [self.example(postman_request, har_response)]
+            yield domain, postman_request
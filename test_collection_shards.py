@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collection Parçalama Test
+Parçalı çıktının tek collection ile aynı request'leri içerdiğini,
+manifest'in parçaları doğru listelediğini ve parçaların ortak bellek
+bütçesiyle akış halinde, worker'larda serialize edilerek yazıldığını test eder
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from collection_shards import (SHARD_MANIFEST_NAME, ShardWriter, shard_filename, split_collection,
+                               write_shards)
+from har_test_data import HAR, write_sample_har
+from collection_writer import SerializedRequest, serialize_request
+from har_to_postman import (create_collection_from_har, har_to_postman_collection, iter_postman_requests,
+                            iter_postman_requests_parallel)
+
+
+def _read_shards(output_dir):
+    with open(os.path.join(output_dir, SHARD_MANIFEST_NAME), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    shards = []
+    for record in manifest["shards"]:
+        with open(os.path.join(output_dir, record["file"]), 'r', encoding='utf-8') as f:
+            shards.append(json.load(f))
+    return manifest, shards
+
+
+def test_split_modes():
+    """domain ve path modları tüm request'leri sırası bozulmadan parçalara dağıtmalı"""
+    path = write_sample_har(HAR)
+    try:
+        collection = har_to_postman_collection(path, "Yakalama")
+        with tempfile.TemporaryDirectory() as directory:
+            for by, stream, workers, keys in (
+                ('domain', False, 1, ['api.example.com', 'static.example.com', 'www.google-analytics.com']),
+                ('path', True, 2, ['api.example.com/users', 'api.example.com/orders', 'api.example.com/login',
+                                   'static.example.com/logo.png', 'www.google-analytics.com/collect']),
+            ):
+                output_dir = os.path.join(directory, by)
+                assert create_collection_from_har(path, output_dir, "Yakalama", split=by, stream=stream,
+                                                  workers=workers)
+                manifest, shards = _read_shards(output_dir)
+
+                assert [record["key"] for record in manifest["shards"]] == keys
+                assert manifest["request_count"] == 5
+                assert [shard["info"]["name"] for shard in shards] == [f"Yakalama - {key}" for key in keys]
+                assert len({shard["info"]["_postman_id"] for shard in shards}) == len(shards)
+                for record, shard in zip(manifest["shards"], shards):
+                    assert record["requests"] == len(shard["item"][0]["item"])
+                    assert record["bytes"] == os.path.getsize(os.path.join(output_dir, record["file"]))
+
+                merged = {}
+                for shard in shards:
+                    folder = shard["item"][0]
+                    merged.setdefault(folder["name"], []).extend(folder["item"])
+                assert merged == {folder["name"]: folder["item"] for folder in collection["item"]}
+    finally:
+        os.unlink(path)
+
+    # Klasörsüz request'ler ve çakışan dosya adları
+    assert split_collection({"item": [{"name": "a", "item": [{"request": {"url": {}}}]}]}, 'path')[0][0] == 'a'
+    used = set()
+    assert shard_filename("api.example.com/v1", used) == "api.example.com_v1.postman_collection.json"
+    assert shard_filename("api.example.com:v1", used) == "api.example.com_v1_2.postman_collection.json"
+
+
+def test_shared_buffer_budget():
+    """Parça yazıcıları ortak bütçeyi aşınca spill etmeli; çıktı bellekteki bölmeyle aynı olmalı"""
+    collection = {"info": {"name": "Büyük"}, "item": [
+        {"name": f"d{domain}.example.com", "item": [
+            {"name": f"R{i}", "request": {"method": "GET", "url": {"path": [f"s{i % 3}", str(i)]}}}
+            for i in range(40)]}
+        for domain in range(3)]}
+    with tempfile.TemporaryDirectory() as directory:
+        expected = write_shards(collection, os.path.join(directory, 'memory'), 'path')
+        output_dir = os.path.join(directory, 'stream')
+        spills = []
+        with ShardWriter(output_dir, collection["info"], 'path', buffer_limit=2048) as writer:
+            for folder in reversed(collection["item"]):
+                for postman_request in folder["item"]:
+                    writer.add(folder["name"], postman_request)
+                    spills.append(sum(shard["writer"].buffered_bytes for shard in writer._shards.values()))
+        assert max(spills) <= 2048 + 512 and spills.count(0) > 1
+        assert writer.manifest["request_count"] == 120
+        # Parçalar domain'lerin ilk görülme sırasıyla listelenir
+        assert [record["key"] for record in writer.manifest["shards"]][:3] == [
+            "d2.example.com/s0", "d2.example.com/s1", "d2.example.com/s2"]
+        _, memory_shards = _read_shards(os.path.join(directory, 'memory'))
+        _, stream_shards = _read_shards(output_dir)
+        by_key = {shard["info"]["name"]: shard["item"] for shard in memory_shards}
+        assert all(by_key[shard["info"]["name"]] == shard["item"] for shard in stream_shards)
+        assert len(expected["shards"]) == len(stream_shards) == 9
+
+
+def test_workers_serialize_shard_requests():
+    """Worker'lar request'leri yazıcı biçiminde serialize etmeli; parçalar tek process'le aynı olmalı"""
+    entries = [json.dumps(entry) for entry in HAR["log"]["entries"]]
+    for layout in ('pretty', 'compact'):
+        serialized = list(iter_postman_requests_parallel(entries, workers=2, chunk_size=2, serialize=layout))
+        assert all(isinstance(item, SerializedRequest) for _, item in serialized)
+        expected = [(domain, serialize_request(request, layout == 'compact'))
+                    for domain, request in iter_postman_requests(entries)]
+        assert [(domain, item.text, item.path) for domain, item in serialized] == [
+            (domain, item.text, item.path) for domain, item in expected]
+
+    path = write_sample_har(HAR)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for compact in (False, True):
+                outputs = []
+                for workers in (1, 3):
+                    output_dir = os.path.join(directory, f"{compact}_{workers}")
+                    assert create_collection_from_har(path, output_dir, "Yakalama", split='path', stream=True,
+                                                      workers=workers, compact=compact)
+                    outputs.append(output_dir)
+                for record in _read_shards(outputs[0])[0]["shards"]:
+                    contents = []
+                    for output_dir in outputs:
+                        with open(os.path.join(output_dir, record["file"]), 'r', encoding='utf-8') as f:
+                            shard = json.load(f)
+                        contents.append(shard["item"])
+                    assert contents[0] == contents[1]
+    finally:
+        os.unlink(path)
+
+
+def test_split_rejects_incremental_and_batch():
+    """--split, --incremental ya da --batch ile birlikte verilirse argparse hatası dönmeli"""
+    path = write_sample_har(HAR)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for extra, flag in ((['--incremental'], '--incremental'), (['--batch', directory], '--batch')):
+                result = subprocess.run(
+                    [sys.executable, 'har_to_postman.py', path, directory, '--split', 'domain'] + extra,
+                    capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+                assert result.returncode == 2
+                assert f"--split ve {flag} birlikte kullanılamaz" in result.stderr
+                assert os.listdir(directory) == []
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    test_split_modes()
+    test_shared_buffer_budget()
+    test_workers_serialize_shard_requests()
+    test_split_rejects_incremental_and_batch()
+    print("✅ Tüm testler başarılı!")
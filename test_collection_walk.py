@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collection Gezinme Test
+iter_items / iter_requests'in ağaç sırasını, path / parent / index
+bilgisini, erken durmayı ve recursion limitini aşan derinlikleri test eder
+"""
+
+import os
+import sys
+import tempfile
+
+import json_codec
+from collection_walk import iter_items, iter_requests
+from postman_collection_editor import PostmanCollectionEditor
+from progress import ProgressReporter
+
+
+def _request(name: str):
+    return {"name": name, "request": {"method": "GET", "url": f"https://api.example.com/{name}"}}
+
+
+def _items():
+    return [
+        {"name": "a", "item": [_request("r1"), {"name": "b", "item": [_request("r2")]}, _request("r3")]},
+        {"name": "empty", "item": []},
+        _request("r4"),
+    ]
+
+
+def test_order_and_positions():
+    """Pre-order sırası ve (path, parent, index, item) doğru olmalı"""
+    items = _items()
+    assert [(path, item["name"]) for path, _, _, item in iter_items(items)] == [
+        ((), "a"), (("a",), "r1"), (("a",), "b"), (("a", "b"), "r2"), (("a",), "r3"), ((), "empty"), ((), "r4")]
+    steps = list(iter_requests(items))
+    assert [item["name"] for _, _, _, item in steps] == ["r1", "r2", "r3", "r4"]
+    assert all(parent[index] is item for _, parent, index, item in steps)
+
+    # Erken durma: ilk eşleşmeden sonra gezinti devam etmez
+    walker = iter_requests(items)
+    assert next(item for _, _, _, item in walker if item["name"] == "r2")["name"] == "r2"
+    assert next(walker)[3]["name"] == "r3"
+
+
+def test_deep_nesting_in_editor():
+    """Recursion limitinden derin collection'larda editör işlemleri çalışmalı"""
+    depth = sys.getrecursionlimit() * 2
+    root = current = []
+    for level in range(depth):
+        folder = {"name": f"f{level}", "item": []}
+        current.append(folder)
+        current = folder["item"]
+    current.append(_request("deep"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'deep.json')
+        json_codec.write_json_file({"info": {"name": "Deep"}, "item": []}, path)
+        editor = PostmanCollectionEditor(path, progress=ProgressReporter(quiet=True))
+        # JSON parser'lar bu derinliği okuyamaz; ağaç bellekte kurulur
+        editor.collection = {"info": {"name": "Deep"}, "item": root}
+
+        path_, _, _, item = next(editor.iter_requests())
+        assert len(path_) == depth and item["name"] == "deep"
+        assert editor.add_header_to_all_requests("X-Test", "1") == 1
+        assert [endpoint["name"] for endpoint in editor.iter_endpoints()] == ["deep"]
+        assert editor.get_collection_info()["request_count"] == 1
+        assert editor.remove_endpoint_by_name("DEEP") == 1
+        assert current == []
+
+
+if __name__ == "__main__":
+    test_order_and_positions()
+    test_deep_nesting_in_editor()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sıkıştırılmış Dosya Test
+gzip / zstd ile sıkıştırılmış HAR ve collection dosyalarının diske
+açılmadan okunup yazıldığını test eder
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+
+from compressed_io import detect_compression, open_binary, open_text
+from har_index import HarIndex, build_index
+from har_test_data import SAMPLE_HAR
+from har_to_postman import create_collection_from_har, find_har_files, har_to_postman_collection
+from postman_collection_editor import PostmanCollectionEditor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SUFFIXES = ('.gz', '.zst') if zstandard is not None else ('.gz',)
+
+
+def test_compressed_har_input_and_output():
+    """Sıkıştırılmış HAR düz HAR ile aynı collection'ı vermeli, çıktı uzantıya göre sıkıştırılmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        plain = os.path.join(directory, 'capture.har')
+        with open(plain, 'w', encoding='utf-8') as f:
+            json.dump(SAMPLE_HAR, f, indent=2, ensure_ascii=False)
+        expected = har_to_postman_collection(plain, "Test")
+
+        for suffix in SUFFIXES:
+            path = plain + suffix
+            with open_text(path, 'w') as f:
+                json.dump(SAMPLE_HAR, f, indent=2, ensure_ascii=False)
+            assert detect_compression(path) == {'.gz': 'gzip', '.zst': 'zstd'}[suffix]
+
+            for stream in (False, True):
+                assert har_to_postman_collection(path, "Test", stream=stream)['item'] == expected['item']
+
+            output = os.path.join(directory, 'out.json' + suffix)
+            for stream in (False, True):
+                assert create_collection_from_har(path, output, "Test", stream=stream)
+                assert detect_compression(output) is not None
+                with open_text(output) as f:
+                    assert json.load(f)['item'] == expected['item']
+
+            # Sıkıştırılmış HAR'daki offset'ler açılmış içeriğe göredir
+            db_path = os.path.join(directory, 'capture.db')
+            build_index(path, db_path)
+            with HarIndex(db_path) as index:
+                assert index.read_entries(index.query()) == [SAMPLE_HAR['log']['entries'][i] for i in (0, 2)]
+
+        assert [os.path.basename(p) for p in find_har_files(directory)] == [
+            'capture.har' + suffix for suffix in ('',) + SUFFIXES]
+
+
+def test_editor_round_trip():
+    """Editör sıkıştırılmış collection'ı okuyup sıkıştırarak kaydedebilmeli"""
+    collection = {"info": {"name": "Çağrı"}, "item": [{"name": "a", "request": {"method": "GET"}}]}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'collection.json.gz')
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(collection, f)
+
+        editor = PostmanCollectionEditor(path)
+        assert editor.load_collection() and editor.collection == collection
+        assert editor.create_backup()
+        editor.collection["info"]["name"] = "Yeni"
+        assert editor.save_collection()
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            assert json.load(f)["info"]["name"] == "Yeni"
+
+        plain_copy = os.path.join(directory, 'collection.json')
+        assert editor.save_collection(plain_copy)
+        assert detect_compression(plain_copy) is None
+
+
+def test_missing_zstandard_error():
+    """zstandard yüklü değilse anlaşılır bir hata verilmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'capture.har.zst')
+        with open(path, 'wb') as f:
+            f.write(b'\x28\xb5\x2f\xfd' + b'\0' * 8)
+        original = sys.modules.get('zstandard')
+        sys.modules['zstandard'] = None
+        try:
+            open_binary(path)
+        except ImportError as e:
+            assert 'pip install zstandard' in str(e)
+        else:
+            raise AssertionError("ImportError bekleniyordu")
+        finally:
+            if original is None:
+                del sys.modules['zstandard']
+            else:
+                sys.modules['zstandard'] = original
+
+
+if __name__ == "__main__":
+    test_compressed_har_input_and_output()
+    test_editor_round_trip()
+    test_missing_zstandard_error()
+    print("✅ Tüm testler başarılı!")
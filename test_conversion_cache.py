@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çevirme Cache'i Test
+Cache isabetini, bozuk dosya tespitini, boyut sınırını ve batch modunda
+cache kullanımını test eder
+"""
+
+import os
+import shutil
+import tempfile
+
+import json_codec
+from conversion_cache import ConversionCache
+from har_test_data import write_sample_har
+from har_to_postman import convert_batch, har_to_postman_collection
+
+
+def test_cache_hit_and_integrity():
+    """Aynı HAR ve seçenekler cache'ten gelmeli, yarım kalmış dosya reddedilmeli"""
+    path = write_sample_har()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ConversionCache(cache_dir)
+            first = har_to_postman_collection(path, "Bir", cache=cache)
+            assert len(cache.entries()) == 1
+
+            second = har_to_postman_collection(path, "İki", cache=cache)
+            assert second['item'] == first['item']
+            assert second['info']['name'] == "İki"
+            assert second['info']['_postman_id'] != first['info']['_postman_id']
+
+            # Farklı seçenekler ayrı anahtar kullanmalı
+            har_to_postman_collection(path, "Bir", cache=cache, template_paths=True)
+            assert len(cache.entries()) == 2
+
+            key = cache.key(path, {"dedupe": False, "template_paths": False, "responses": False})
+            cache_path = os.path.join(cache_dir, key + '.collection')
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            with open(cache_path, 'wb') as f:
+                f.write(data[:-10])
+            assert cache.get(key) is None
+            assert not os.path.exists(cache_path)
+    finally:
+        os.unlink(path)
+
+
+def test_cache_evicts_least_recently_used():
+    """Boyut sınırı aşılınca en uzun süredir kullanılmayan kayıt silinmeli"""
+    collection = {"info": {}, "item": [{"name": "x" * 100}]}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ConversionCache(cache_dir, max_bytes=400)
+        cache.put("a", collection)
+        cache.put("b", collection)
+        os.utime(os.path.join(cache_dir, "b.collection"), ns=(1, 1))
+        assert cache.get("a") is not None
+        cache.put("c", collection)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_batch_uses_cache():
+    """Batch modu cache'i kullanmalı: aynı içerikli HAR cache'ten gelmeli"""
+    path = write_sample_har()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as source_dir, \
+                tempfile.TemporaryDirectory() as output_dir:
+            cache = ConversionCache(cache_dir)
+            shutil.copy(path, os.path.join(source_dir, 'a.har'))
+            assert [r["status"] for r in convert_batch(source_dir, output_dir, workers=2, cache=cache)] == [
+                "converted"]
+            (entry,) = cache.entries()
+            key = os.path.basename(entry[2])[:-len('.collection')]
+
+            # Cache'teki kaydı işaretle; aynı içerikli b.har onu almalı
+            marked = cache.get(key)
+            marked["item"][0]["name"] = "cache'ten"
+            cache.put(key, marked)
+            shutil.copy(path, os.path.join(source_dir, 'b.har'))
+            results = convert_batch(source_dir, output_dir, workers=2, cache=cache)
+            assert [r["status"] for r in results] == ["skipped", "converted"]
+            assert json_codec.read_json_file(results[1]["output"])["item"][0]["name"] == "cache'ten"
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    test_cache_hit_and_integrity()
+    test_cache_evicts_least_recently_used()
+    test_batch_uses_cache()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Analiz Test
+Gecikme raporunun şablonlanmış endpoint'lere göre doğru yüzdelikleri verdiğini
+ve sütunlu tablonun sidecar dosyalarından birebir geri okunduğunu test eder
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import har_analytics
+from har_analytics import (entries_frame, format_latency_table, latency_report, latency_report_from_har,
+                           latency_report_json, load_frame, load_har_frame, save_frame)
+from har_test_data import write_sample_har
+
+
+def _entry(method, url, wait, blocked=-1, transfer=None):
+    response = {"status": 200, "headersSize": 100, "bodySize": 400}
+    if transfer is not None:
+        response["_transferSize"] = transfer
+    return {
+        "request": {"method": method, "url": url},
+        "response": response,
+        "time": wait + 10 + max(blocked, 0),
+        "timings": {"blocked": blocked, "dns": -1, "connect": -1, "ssl": -1, "send": 2, "wait": wait, "receive": 8}
+    }
+
+
+def test_latency_report_groups_templated_endpoints():
+    """Farklı ID'ler aynı endpoint'te toplanmalı, yüzdelikler numpy ile aynı olmalı"""
+    waits = [float(value) for value in range(100, 4100, 100)]
+    entries = [_entry("GET", f"https://api.example.com/users/{index}", wait) for index, wait in enumerate(waits)]
+    entries.append(_entry("post", "https://api.example.com/users", 5, blocked=50, transfer=1234))
+    entries.append({"request": {"method": "GET"}})
+
+    report = latency_report(entries_frame(entries))
+    assert list(report.index) == [("GET", "api.example.com/users/:userId"), ("POST", "api.example.com/users")]
+
+    row = report.loc[("GET", "api.example.com/users/:userId")]
+    times = np.array(waits) + 10
+    assert row["count"] == 40 and row["transfer_bytes"] == 40 * 500
+    assert np.isclose(row["time_p90"], np.percentile(times, 90))
+    assert np.isclose(row["wait_p99"], np.percentile(waits, 99))
+    assert np.isnan(row["dns_p50"])
+
+    groups = latency_report_json(report)
+    assert groups[1]["transfer_bytes"] == 1234
+    assert groups[1]["blocked"] == {"p50": 50.0, "p90": 50.0, "p99": 50.0, "max": 50.0}
+    assert groups[0]["dns"]["p50"] is None
+
+    table = format_latency_table(report)
+    assert "GET api.example.com/users/:userId" in table
+    assert "blocked 50" in table
+
+
+def test_empty_latency_report():
+    """Boş ya da request'siz HAR boş ama aynı sütunlu bir rapor vermeli"""
+    expected = list(latency_report(entries_frame([_entry("GET", "https://api.example.com/a", 1)])).columns)
+    for entries in ([], [{"comment": "request yok"}], [{"request": {"method": "GET"}}]):
+        report = latency_report(entries_frame(entries))
+        assert report.empty and list(report.columns) == expected
+        assert latency_report_json(report) == []
+        assert "Endpoint" in format_latency_table(report)
+
+    path = write_sample_har({"log": {"entries": []}})
+    try:
+        assert latency_report_from_har(path).empty
+    finally:
+        os.unlink(path)
+
+
+def test_null_and_string_status():
+    """null ya da string status'lü entry'ler (iptal edilen istekler) tabloyu bozmamalı"""
+    entries = [_entry("GET", f"https://api.example.com/items/{index}", 10) for index in range(4)]
+    entries[0]["response"]["status"] = None
+    entries[1]["response"]["status"] = "404"
+    entries[2]["response"]["status"] = "(failed)"
+    del entries[3]["response"]
+    frame = entries_frame(entries)
+    assert list(frame['status']) == [0, 404, 0, 0] and frame['status'].dtype == 'int32'
+    assert latency_report(frame)["count"].sum() == 4
+
+
+def test_frame_sidecar_round_trip():
+    """npz ve pickle sidecar'ları aynı tabloyu vermeli, HAR değişince yeniden oluşturulmalı"""
+    entries = [_entry("GET", f"https://api.example.com/items/{index}", index) for index in range(5)]
+    entries[0]["startedDateTime"] = "2024-01-02T03:04:05.678Z"
+    entries[1]["request"]["headers"] = [{"name": "Content-Type", "value": "application/json; charset=utf-8"}]
+    entries.append({"comment": "request olmayan entry"})
+    path = write_sample_har({"log": {"entries": entries}})
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            frame = entries_frame(entries)
+            assert frame.attrs['entry_count'] == 6 and len(frame) == 5
+            assert frame['request_content_type'][1] == 'application/json'
+            for stamp, name in ((1, 'frame.npz'), (2, 'frame.pkl.gz')):
+                sidecar = os.path.join(directory, name)
+                save_frame(frame, sidecar, {"x": 1})
+                loaded, meta = load_frame(sidecar)
+                pd.testing.assert_frame_equal(loaded, frame)
+                assert meta["source"] == {"x": 1} and loaded.attrs == frame.attrs
+
+                built = load_har_frame(path, sidecar)
+                original = har_analytics.iter_har_entries
+                har_analytics.iter_har_entries = None  # sidecar güncelse HAR okunmamalı
+                try:
+                    pd.testing.assert_frame_equal(load_har_frame(path, sidecar), built)
+                finally:
+                    har_analytics.iter_har_entries = original
+
+                os.utime(path, ns=(stamp, stamp))
+                assert load_frame(sidecar)[1]["source"]["mtime_ns"] != stamp
+                load_har_frame(path, sidecar)
+                assert load_frame(sidecar)[1]["source"]["mtime_ns"] == stamp
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    test_latency_report_groups_templated_endpoints()
+    test_empty_latency_report()
+    test_null_and_string_status()
+    test_frame_sidecar_round_trip()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark Test
+Sentetik HAR üreticinin deterministik ve geçerli HAR ürettiğini, benchmark
+sonuçlarının beklenen alanları içerdiğini test eder
+"""
+
+import os
+import tempfile
+
+import json_codec
+from har_benchmark import format_report, run_benchmark
+from har_generator import generate_har, iter_synthetic_entries
+from har_to_postman import har_to_postman_collection
+
+
+def test_generator_is_deterministic():
+    """Aynı seed aynı dosyayı, farklı seed farklı dosyayı üretmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, name) for name in ('a.har', 'b.har', 'c.har')]
+        for path, seed in zip(paths, (1, 1, 2)):
+            generate_har(path, 200, domains=3, body_size=300, base64_ratio=0.25, headers=4, seed=seed)
+        contents = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                contents.append(f.read())
+        assert contents[0] == contents[1] != contents[2]
+
+        entries = json_codec.read_json_file(paths[0])['log']['entries']
+        assert entries == list(iter_synthetic_entries(200, 1, domains=3, body_size=300, base64_ratio=0.25,
+                                                      headers=4))
+        assert {entry['request']['url'].split('/')[2] for entry in entries} <= {
+            'api0.example.com', 'api1.example.com', 'api2.example.com'}
+        assert all(len(entry['request']['headers']) == 4 for entry in entries)
+        encoded = sum(1 for entry in entries if entry['response']['content'].get('encoding') == 'base64')
+        assert 20 < encoded < 80
+
+        collection = har_to_postman_collection(paths[0], "Sentetik")
+        assert sum(len(folder['item']) for folder in collection['item']) == 200
+
+
+def test_benchmark_report():
+    """Her senaryo için süre, throughput, peak RSS ve aşama süreleri raporlanmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        report = run_benchmark([50], ('stages', 'create_stream'), directory, body_size=64)
+        assert os.listdir(directory) == ['synthetic_50_0_5_64_8_0.1.har']
+
+    assert report["json_backend"] == json_codec.BACKEND
+    assert [(result["scenario"], result["entries"]) for result in report["results"]] == [
+        ("stages", 50), ("create_stream", 50)]
+    stages, stream = report["results"]
+    assert list(stages["stages"]) == ['load', 'convert', 'group', 'write']
+    # Diğer senaryolar converter'ın kendi aşamalarını raporlar
+    assert {'read', 'convert', 'grouping', 'write'} <= set(stream["stages"])
+    assert sum(stream["stages"].values()) <= stream["seconds"]
+    for result in report["results"]:
+        assert result["seconds"] > 0 and result["entries_per_second"] > 0 and result["output_bytes"] > 0
+        assert result["peak_rss_bytes"] is None or result["peak_rss_bytes"] > 1024 * 1024
+    assert "x önceki çalışmaya göre" in format_report(report, report)
+
+
+if __name__ == "__main__":
+    test_generator_is_deterministic()
+    test_benchmark_report()
+    print("✅ Tüm testler başarılı!")
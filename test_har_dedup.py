@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request Tekilleştirme Test
+Path şablonlamayı ve yapısal parmak izine göre tekilleştirmeyi test eder
+"""
+
+from har_dedup import RequestDeduplicator, json_shape
+from har_to_postman import iter_postman_requests
+from path_template import PathTemplateTrie, apply_path_templates, build_path_trie
+
+
+def _entry(method, url, body=None):
+    request = {"method": method, "url": url, "headers": []}
+    if body is not None:
+        request["postData"] = {"mimeType": "application/json", "text": body}
+    return {"request": request}
+
+
+def test_json_shape_ignores_values():
+    """JSON şekli değerlerden ve key sırasından bağımsız olmalı"""
+    assert json_shape({"a": 1, "b": [{"c": "x"}]}) == json_shape({"b": [{"c": "y"}, {}], "a": 2})
+    assert json_shape({"a": 1}) != json_shape({"a": "1"})
+
+
+def test_deduplicator_keeps_first_representative():
+    """Aynı parmak izli request'lerden ilki tutulmalı, sayı ve örnekler eklenmeli"""
+    entries = [
+        _entry("GET", "https://api.example.com/poll/1?t=1&v=2"),
+        _entry("GET", "https://api.example.com/poll/2?v=3&t=9"),
+        _entry("GET", "https://api.example.com/poll/3?t=1"),
+        _entry("POST", "https://api.example.com/items", '{"name": "a", "tags": ["x"]}'),
+        _entry("POST", "https://api.example.com/items", '{"tags": ["y", "z"], "name": "b"}'),
+        _entry("POST", "https://api.example.com/items", '{"name": 1}'),
+        _entry("GET", "https://cdn.example.com/poll/4?t=1&v=2"),
+    ]
+    deduplicator = RequestDeduplicator(max_examples=1)
+    kept = list(deduplicator.filter(iter_postman_requests(entries)))
+    deduplicator.annotate()
+
+    assert [item['name'] for _, item in kept] == [
+        '001. GET 1', '003. GET 3', '004. POST items', '006. POST items', '007. GET 4'
+    ]
+    assert deduplicator.duplicate_count == 2
+    description = kept[0][1]['request']['description']
+    assert '2 kez' in description
+    assert 'https://api.example.com/poll/2?v=3&t=9' in description
+    assert 'description' not in kept[1][1]['request']
+
+
+def test_trie_templates_variable_segments():
+    """Sayısal, UUID ve çok sayıda farklı değer alan token segmentler değişken olmalı"""
+    trie = PathTemplateTrie(cardinality_threshold=3, min_hits=4)
+    for user in range(5):
+        trie.insert('api', ['users', str(user), 'posts', str(user * 7)])
+    trie.insert('api', ['users', 'me'])
+    trie.insert('api', ['orders', '123e4567-e89b-12d3-a456-426614174000'])
+    for token in ('ab12cd34ef', 'x9y8z7w6v5', 'k3m5n7p9q1', 'r2s4t6u8v0'):
+        trie.insert('api', ['profiles', token])
+    trie.insert('api', ['v1', 'status'])
+
+    assert trie.template('api', ['users', '42', 'posts', '9']) == (
+        ['users', ':userId', 'posts', ':postId'], [('userId', '42'), ('postId', '9')])
+    assert trie.template('api', ['users', 'me']) == (['users', 'me'], [])
+    assert trie.template('api', ['orders', '123e4567-e89b-12d3-a456-426614174000'])[0] == ['orders', ':orderId']
+    assert trie.template('api', ['profiles', 'z1y2x3w4v5'])[0] == ['profiles', ':profileId']
+    assert trie.template('api', ['v1', 'status']) == (['v1', 'status'], [])
+
+
+def test_wide_named_endpoints_stay_literal():
+    """Çok sayıda tek seferlik ama isimli endpoint değişkene çevrilmemeli, tekilleştirmede kaybolmamalı"""
+    names = ['users', 'orders', 'login', 'logout', 'register', 'profile', 'settings', 'search', 'cart',
+             'checkout', 'payments', 'invoices', 'products', 'categories', 'reviews', 'wishlist', 'coupons',
+             'notifications', 'messages', 'reports', 'health', 'version', 'config', 'feedback']
+    entries = [_entry("GET", f"https://api.example.com/api/{name}") for name in names]
+    trie = build_path_trie(entries)
+    assert all(trie.template('api.example.com', ['api', name]) == (['api', name], []) for name in names)
+
+    deduplicator = RequestDeduplicator()
+    kept = list(deduplicator.filter(apply_path_templates(iter_postman_requests(entries), trie)))
+    assert len(kept) == len(names)
+
+    # Aynı genişlikte kimlik token'ları yeterince istekle birlikte değişkene çevrilmeli
+    tokens = [f"tok{i:02d}x{i * 37:04d}" for i in range(40)]
+    trie = build_path_trie([_entry("GET", f"https://api.example.com/share/{token}") for token in tokens])
+    assert trie.template('api.example.com', ['share', tokens[0]])[0] == ['share', ':shareId']
+
+
+def test_templated_paths_drive_dedup():
+    """Şablonlanan URL'ler Postman değişkenleri almalı ve tekilleştirmede birleşmeli"""
+    entries = [_entry("GET", f"https://api.example.com/users/{user}/?fields=a") for user in (10, 11, 12)]
+    trie = build_path_trie(entries)
+    deduplicator = RequestDeduplicator()
+    kept = list(deduplicator.filter(apply_path_templates(iter_postman_requests(entries), trie)))
+
+    assert len(kept) == 1
+    url = kept[0][1]['request']['url']
+    assert url['raw'] == 'https://api.example.com/users/:userId/?fields=a'
+    assert url['path'] == ['users', ':userId']
+    assert url['variable'] == [{"key": "userId", "value": "10"}]
+
+
+if __name__ == "__main__":
+    test_json_shape_ignores_values()
+    test_deduplicator_keeps_first_representative()
+    test_trie_templates_variable_segments()
+    test_wide_named_endpoints_stay_literal()
+    test_templated_paths_drive_dedup()
+    print("✅ Tüm testler başarılı!")
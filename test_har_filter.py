@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Filtre Test
+Include / exclude filtrelerinin ham metin ve dict üzerinde aynı sonucu
+verdiğini ve akış modunda reddedilen entry'lerin parse edilmediğini test eder
+"""
+
+import json
+import os
+
+import har_filter
+from har_filter import EntryFilter, entry_fields, raw_entry_fields
+from har_test_data import ENTRIES, HAR, write_sample_har
+from har_to_postman import har_to_postman_collection
+
+
+def test_raw_fields_match_parsed_fields():
+    """Ham metinden çıkarılan alanlar parse edilmiş entry ile aynı olmalı"""
+    for entry in ENTRIES:
+        for text in (json.dumps(entry), json.dumps(entry, indent=2, ensure_ascii=False)):
+            assert raw_entry_fields(text) == entry_fields(entry)
+
+
+def test_filters_skip_parsing_rejected_entries():
+    """Reddedilen ham entry'ler json.loads'a hiç gitmemeli"""
+    entry_filter = EntryFilter(include_domains=["example.com"], exclude_mime=["image/"],
+                               exclude_status=["3xx"], exclude_resource_types=["ping"])
+    expected = [entry for entry in ENTRIES if entry_filter.matches(entry)]
+    assert [entry["request"]["url"] for entry in expected] == [
+        "https://api.example.com/users", "https://api.example.com/orders"]
+
+    parsed = []
+    original_loads = har_filter.json_codec.loads
+
+    def counting_loads(text, *args, **kwargs):
+        parsed.append(text)
+        return original_loads(text, *args, **kwargs)
+
+    har_filter.json_codec.loads = counting_loads
+    try:
+        result = list(entry_filter.apply([json.dumps(entry) for entry in ENTRIES]))
+    finally:
+        har_filter.json_codec.loads = original_loads
+    assert result == expected
+    assert len(parsed) == 2
+    assert entry_filter.rejected_count == 3
+
+    # include_methods ve status sınıfları
+    only_posts = EntryFilter(include_methods=["post"], include_status=["2xx", 404])
+    assert [e["request"]["url"] for e in only_posts.apply(ENTRIES)] == [
+        "https://www.google-analytics.com/collect?v=1", "https://api.example.com/orders"]
+
+
+def test_filtered_stream_matches_default():
+    """Filtreli akış modu normal modla aynı collection'ı üretmeli"""
+    path = write_sample_har(HAR)
+    entry_filter = EntryFilter(exclude_url=[r"\.png$", "google-analytics"])
+    try:
+        normal = har_to_postman_collection(path, "Test", entry_filter=entry_filter)
+        streamed = har_to_postman_collection(path, "Test", stream=True, entry_filter=entry_filter)
+        parallel = har_to_postman_collection(path, "Test", stream=True, workers=2, entry_filter=entry_filter)
+    finally:
+        os.unlink(path)
+    assert normal['item'] == streamed['item'] == parallel['item']
+    assert [item['name'] for item in normal['item'][0]['item']] == [
+        '001. GET users', '002. POST orders', '003. GET login']
+
+
+if __name__ == "__main__":
+    test_raw_fields_match_parsed_fields()
+    test_filters_skip_parsing_rejected_entries()
+    test_filtered_stream_matches_default()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR İndeks Test
+SQLite indeksinin sorgulanmasını ve sonuçların byte aralığından okunup
+collection'a çevrilmesini test eder
+"""
+
+import os
+
+from har_index import HarIndex, build_index
+from har_test_data import HAR, write_sample_har
+
+
+def test_index_query_and_export():
+    """Sorgular doğru entry'leri bulmalı, entry'ler HAR'daki haliyle okunmalı"""
+    entries = [dict(entry, startedDateTime=f"2024-05-01T10:00:0{index}.000Z", time=100.0 * index)
+               for index, entry in enumerate(HAR['log']['entries'])]
+    path = write_sample_har({"log": {"version": "1.2", "entries": entries + [{"comment": "request yok"}]}})
+    db_path = path + '.db'
+    try:
+        assert build_index(path, db_path, batch_size=2) == 6
+        with HarIndex(db_path) as index:
+            assert len(index.query(limit=0)) == 5
+            assert [row['path'] for row in index.query(host='api.example.com')] == ['/users', '/orders', '/login']
+            assert [row['status'] for row in index.query(status='3xx')] == [302]
+            assert [row['entry_index'] for row in index.query(method='post', path='/%')] == [2, 3]
+            assert [row['entry_index'] for row in index.query(since='2024-05-01T10:00:03')] == [3, 4]
+            assert [row['entry_index'] for row in index.query('time > ?', (250,), order_by='time')] == [3, 4]
+
+            rows = index.query(host='api.example.com', status='4xx')
+            assert index.read_entries(rows) == [entries[3]]
+            collection = index.to_collection(index.query(host='api.example.com'), "Olay")
+            assert collection['info']['name'] == "Olay"
+            assert [item['name'] for item in collection['item'][0]['item']] == [
+                '001. GET users', '002. POST orders', '003. GET login']
+            # Seçenekler ortak pipeline'dan geçer
+            with_responses = index.to_collection(index.query(host='api.example.com'), "Olay", responses=True,
+                                                 template_paths=True, dedupe=True)
+            assert len(with_responses['item'][0]['item']) == 3
+            assert all(item['response'][0]['code'] == entry['response']['status'] for item, entry in
+                       zip(with_responses['item'][0]['item'], [entries[0], entries[3], entries[4]]))
+
+            # HAR değişirse eski byte aralıkları kullanılmamalı
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('\n')
+            try:
+                index.read_entries(rows)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Değişmiş HAR için hata bekleniyordu")
+    finally:
+        for leftover in (path, db_path):
+            if os.path.exists(leftover):
+                os.unlink(leftover)
+
+
+if __name__ == "__main__":
+    test_index_query_and_export()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HAR Streaming Test
+Akış modundaki HAR okuyucunun json.load ile aynı sonucu verdiğini test eder
+"""
+
+import gzip
+import io
+import json
+import os
+import tempfile
+
+import json_codec
+from collection_writer import StreamingCollectionWriter, append_to_collection, has_collection_layout
+from har_checkpoint import load_checkpoint
+from har_stream import HarEntryReader, iter_har_entries_with_offsets
+from har_test_data import SAMPLE_HAR, write_sample_har
+from har_to_postman import (har_to_postman_collection, create_collection_from_har, convert_batch,
+                            iter_postman_requests, iter_postman_requests_parallel, _batch_output_paths)
+
+
+def test_reader_matches_json_load():
+    """Küçük chunk boyutlarında da entry'ler birebir aynı okunmalı"""
+    text = json.dumps(SAMPLE_HAR, ensure_ascii=False)
+    for chunk_size in (1, 3, 7, 64, 4096):
+        entries = list(HarEntryReader(io.StringIO(text), chunk_size))
+        assert entries == SAMPLE_HAR['log']['entries'], chunk_size
+
+
+def test_reader_rejects_invalid_har():
+    """log.entries olmayan dosyalar hata vermeli"""
+    for text in ('{"log": {"pages": []}}', '[]', '{"log": {"entries": [{"a": 1}'):
+        try:
+            list(HarEntryReader(io.StringIO(text), 4))
+        except ValueError:
+            continue
+        raise AssertionError(f"Hata bekleniyordu: {text}")
+
+
+def test_reader_byte_offsets_and_resume():
+    """Byte aralıkları entry'leri birebir vermeli, okuma offset'ten devam edebilmeli"""
+    text = json.dumps(SAMPLE_HAR, indent=2, ensure_ascii=False).replace('\n', '\r\n')
+    fd, path = tempfile.mkstemp(suffix='.har')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(text.encode('utf-8'))
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        ranges = list(iter_har_entries_with_offsets(path, chunk_size=5))
+        assert [entry for _, _, entry in ranges] == SAMPLE_HAR['log']['entries']
+        for start, end, entry in ranges:
+            assert json.loads(data[start:end].decode('utf-8')) == entry
+
+        resumed = list(iter_har_entries_with_offsets(path, ranges[0][1], chunk_size=3))
+        assert resumed == ranges[1:]
+    finally:
+        os.unlink(path)
+
+
+def test_stream_collection_matches_default():
+    """Akış modu ile normal mod aynı collection'ı üretmeli"""
+    path = write_sample_har()
+    try:
+        normal = har_to_postman_collection(path, "Test")
+        streamed = har_to_postman_collection(path, "Test", stream=True)
+    finally:
+        os.unlink(path)
+
+    assert normal is not None and streamed is not None
+    assert normal['item'] == streamed['item']
+    assert [folder['name'] for folder in streamed['item']] == ['api.example.com', 'cdn.example.org']
+    assert streamed['item'][1]['item'][0]['name'] == '003. POST upload'
+
+
+def test_streaming_writer_is_byte_compatible():
+    """Spill dosyaları kullanılsa da çıktı json.dump ile byte byte aynı olmalı"""
+    path = write_sample_har()
+    collection = har_to_postman_collection(path, "Test")
+    os.unlink(path)
+    fd, output_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        for buffer_limit in (0, 1, 10 ** 9):
+            with StreamingCollectionWriter(output_path, collection['info'], buffer_limit) as writer:
+                for folder in collection['item']:
+                    for item in folder['item']:
+                        writer.add(folder['name'], item)
+                # Aynı domain'e sonradan gelen request'ler de doğru klasöre yazılmalı
+                writer.add(collection['item'][0]['name'], collection['item'][0]['item'][0])
+            collection['item'][0]['item'].append(collection['item'][0]['item'][0])
+            with open(output_path, 'r', encoding='utf-8') as f:
+                written = f.read()
+            assert written == json.dumps(collection, indent=2, ensure_ascii=False), buffer_limit
+            collection['item'][0]['item'].pop()
+
+        with StreamingCollectionWriter(output_path, collection['info']):
+            pass
+        with open(output_path, 'r', encoding='utf-8') as f:
+            assert f.read() == json.dumps({"info": collection['info'], "item": []}, indent=2, ensure_ascii=False)
+    finally:
+        os.unlink(output_path)
+
+
+def test_append_to_collection_matches_full_write():
+    """Klasör offset'leriyle yapılan ekleme, collection'ı baştan yazmakla byte byte aynı olmalı"""
+    def request(name):
+        return {"name": name, "request": {"method": "GET", "url": {"raw": f"https://x/{name}"}}}
+
+    first = [("a.example.com", request("ş1")), ("b.example.com", request("ğ2")), ("a.example.com", request("3"))]
+    second = [("b.example.com", request("4")), ("çok.example.com", request("5")), ("a.example.com", request("6"))]
+    with tempfile.TemporaryDirectory() as directory:
+        output_path = os.path.join(directory, 'collection.json')
+        for compact in (False, True):
+            for initial in (first, []):
+                with StreamingCollectionWriter(output_path, {"name": "Test"}, compact=compact) as writer:
+                    for domain, item in initial:
+                        writer.add(domain, item)
+                tails = writer.folder_tails
+                assert has_collection_layout(output_path, tails, compact, os.path.getsize(output_path))
+                assert not has_collection_layout(output_path, tails, not compact)
+
+                added, tails = append_to_collection(output_path, tails, iter(second), compact)
+                assert added == 3
+                expected = {"info": {"name": "Test"}, "item": []}
+                folders = {}
+                for domain, item in initial + second:
+                    if domain not in folders:
+                        folders[domain] = {"name": domain, "item": []}
+                        expected["item"].append(folders[domain])
+                    folders[domain]["item"].append(item)
+                with open(output_path, 'r', encoding='utf-8') as f:
+                    assert f.read() == json_codec.dumps(expected, compact), (compact, bool(initial))
+
+                # Güncellenen offset'lerle tekrar eklenebilmeli
+                assert has_collection_layout(output_path, tails, compact)
+                assert append_to_collection(output_path, tails, iter([("a.example.com", request("7"))]),
+                                            compact)[0] == 1
+                folders["a.example.com"]["item"].append(request("7"))
+                with open(output_path, 'r', encoding='utf-8') as f:
+                    assert f.read() == json_codec.dumps(expected, compact)
+
+
+def test_create_collection_stream_output():
+    """create_collection_from_har(stream=True) geçerli bir collection yazmalı"""
+    path = write_sample_har()
+    fd, output_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        assert create_collection_from_har(path, output_path, "Test", stream=True)
+        with open(output_path, 'r', encoding='utf-8') as f:
+            written = json.load(f)
+        expected = har_to_postman_collection(path, "Test")
+        assert written['item'] == expected['item']
+    finally:
+        os.unlink(path)
+        os.unlink(output_path)
+
+
+def test_parallel_conversion_preserves_order():
+    """Process havuzu ile çevirme sıralı çevirme ile aynı sonucu vermeli"""
+    entries = SAMPLE_HAR['log']['entries'] * 5
+    expected = list(iter_postman_requests(entries))
+    assert list(iter_postman_requests_parallel(entries, workers=2, chunk_size=2)) == expected
+    raw_entries = [json.dumps(entry) for entry in entries]
+    assert list(iter_postman_requests_parallel(raw_entries, workers=2, chunk_size=3)) == expected
+
+    path = write_sample_har()
+    try:
+        streamed = har_to_postman_collection(path, "Test", stream=True, workers=2)
+        normal = har_to_postman_collection(path, "Test")
+    finally:
+        os.unlink(path)
+    assert streamed['item'] == normal['item']
+
+
+def test_incremental_conversion_appends_new_entries():
+    """Artımlı çevirme sadece yeni entry'leri eklemeli ve tam çevirmeyle aynı sonucu vermeli"""
+    entries = SAMPLE_HAR['log']['entries']
+    grown = {"log": dict(SAMPLE_HAR['log'], entries=entries + [entries[2], entries[0]])}
+    path = write_sample_har()
+    output_path = path + '.json'
+    try:
+        assert create_collection_from_har(path, output_path, "Test", incremental=True)
+        assert load_checkpoint(output_path)["entry_count"] == 3
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(grown, f, indent=2, ensure_ascii=False)
+        # Mevcut çıktı okunmadan yeni request'ler klasörlerine eklenmeli
+        original_read = json_codec.read_json_file
+        json_codec.read_json_file = lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError(args))
+        try:
+            assert create_collection_from_har(path, output_path, "Test", incremental=True)
+        finally:
+            json_codec.read_json_file = original_read
+        assert load_checkpoint(output_path)["entry_count"] == 5
+
+        with open(output_path, 'r', encoding='utf-8') as f:
+            written = json.load(f)
+        expected = har_to_postman_collection(path, "Test")
+        assert written['item'] == expected['item']
+        assert written['item'][0]['item'][-1]['name'] == '005. GET 42'
+
+        # Elle düzenlenen çıktı okunup baştan yazılmalı
+        with open(output_path, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        grown['log']['entries'].append(entries[1])
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(grown, f, indent=2, ensure_ascii=False)
+        assert create_collection_from_har(path, output_path, "Test", incremental=True)
+        with open(output_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)['item'] == har_to_postman_collection(path, "Test")['item']
+        assert "layout" in load_checkpoint(output_path)
+
+        # Daha önce çevrilmiş kısım değişirse her şey yeniden çevrilmeli
+        grown['log']['entries'][0]['request']['method'] = 'DELETE'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(grown, f, indent=2, ensure_ascii=False)
+        assert create_collection_from_har(path, output_path, "Test", incremental=True)
+        with open(output_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)['item'] == har_to_postman_collection(path, "Test")['item']
+    finally:
+        for leftover in (path, output_path, output_path + '.checkpoint.json'):
+            if os.path.exists(leftover):
+                os.unlink(leftover)
+
+
+def test_batch_skips_up_to_date_outputs():
+    """Batch modunda değişmeyen dosyalar ikinci çalıştırmada atlanmalı"""
+    with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as output_dir:
+        for name in ('a.har', 'b.har'):
+            with open(os.path.join(source_dir, name), 'w', encoding='utf-8') as f:
+                json.dump(SAMPLE_HAR, f)
+
+        first = convert_batch(source_dir, output_dir, workers=2)
+        assert [r["status"] for r in first] == ["converted", "converted"]
+
+        # b.har'ı değiştir: sadece o yeniden çevrilmeli
+        with open(os.path.join(source_dir, 'b.har'), 'a', encoding='utf-8') as f:
+            f.write('\n')
+        second = convert_batch(source_dir, output_dir, workers=2)
+        assert [r["status"] for r in second] == ["skipped", "converted"]
+
+        with open(first[0]["output"], 'r', encoding='utf-8') as f:
+            assert json.load(f)['item'][0]['name'] == 'api.example.com'
+
+
+def test_batch_output_name_collisions():
+    """Aynı çıktı adına düşen HAR'lar birbirinin üzerine yazmamalı"""
+    with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as output_dir:
+        os.makedirs(os.path.join(source_dir, 'sub'))
+        for name in ('capture.har', 'capture.har.gz', os.path.join('sub', 'capture.har')):
+            path = os.path.join(source_dir, name)
+            opener = gzip.open if name.endswith('.gz') else open
+            with opener(path, 'wt', encoding='utf-8') as f:
+                json.dump(SAMPLE_HAR, f)
+
+        results = convert_batch(source_dir, output_dir, workers=2)
+        assert [(os.path.basename(r["file"]), r["status"], os.path.basename(r["output"])) for r in results] == [
+            ('capture.har', 'converted', 'capture_postman_collection.json'),
+            ('capture.har.gz', 'converted', 'capture_gz_postman_collection.json')]
+
+        # Farklı dizinlerden aynı ada düşen dosya çevrilmeden raporlanmalı
+        files = [os.path.join(source_dir, 'capture.har'), os.path.join(source_dir, 'sub', 'capture.har')]
+        outputs, conflicts = _batch_output_paths(files, output_dir)
+        assert outputs[files[1]] is None and conflicts == {files[1]: files[0]}
+
+if __name__ == "__main__":
+    test_reader_matches_json_load()
+    test_reader_rejects_invalid_har()
+    test_reader_byte_offsets_and_resume()
+    test_stream_collection_matches_default()
+    test_streaming_writer_is_byte_compatible()
+    test_append_to_collection_matches_full_write()
+    test_create_collection_stream_output()
+    test_parallel_conversion_preserves_order()
+    test_incremental_conversion_appends_new_entries()
+    test_batch_skips_up_to_date_outputs()
+    test_batch_output_name_collisions()
+    print("✅ Tüm testler başarılı!")
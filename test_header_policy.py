@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Header Politikası Test
+Drop / keep / rename / redact kurallarının çeviriye uygulanmasını test eder
+"""
+
+import pickle
+
+from har_to_postman import convert_har_request_to_postman
+from header_policy import HeaderPolicy
+
+HAR_REQUEST = {
+    "method": "GET",
+    "url": "https://api.example.com/me",
+    "headers": [
+        {"name": "Host", "value": "api.example.com"},
+        {"name": "Accept-Encoding", "value": "gzip"},
+        {"name": "Authorization", "value": "Bearer secret"},
+        {"name": "sec-ch-ua", "value": "\"Chromium\""},
+        {"name": "Sec-Fetch-Mode", "value": "cors"},
+        {"name": "x-api-key", "value": "k"},
+        {"name": "Accept", "value": "application/json"},
+    ]
+}
+
+
+def test_default_policy_matches_legacy_skip_list():
+    """Varsayılan politika eski skip_headers listesiyle aynı davranmalı"""
+    headers = convert_har_request_to_postman(HAR_REQUEST, 1)['request']['header']
+    assert [h['key'] for h in headers] == ['Authorization', 'sec-ch-ua', 'Sec-Fetch-Mode', 'x-api-key', 'Accept']
+
+
+def test_custom_policy_rules():
+    """Regex drop, keep önceliği, rename ve redact birlikte çalışmalı"""
+    policy = HeaderPolicy.from_dict({
+        "drop_regex": ["^sec-"],
+        "keep": ["Sec-Fetch-Mode"],
+        "rename": {"X-API-KEY": "X-Api-Key"},
+        "redact": ["authorization"],
+        "redact_regex": ["api-key"],
+        "redact_value": "{{token}}"
+    })
+    # Worker process'lere gönderilebilmeli
+    policy = pickle.loads(pickle.dumps(policy))
+
+    for _ in range(2):  # ikinci tur cache'den gelmeli
+        headers = convert_har_request_to_postman(HAR_REQUEST, 1, policy)['request']['header']
+        assert [(h['key'], h['value']) for h in headers] == [
+            ('Authorization', '{{token}}'),
+            ('Sec-Fetch-Mode', 'cors'),
+            ('X-Api-Key', '{{token}}'),
+            ('Accept', 'application/json'),
+        ]
+
+
+if __name__ == "__main__":
+    test_default_policy_matches_legacy_skip_list()
+    test_custom_policy_rules()
+    print("✅ Tüm testler başarılı!")
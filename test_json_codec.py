@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Codec Test
+Her yüklü backend'in standart json ile aynı çıktıyı verdiğini ve compact
+modun akış yazıcısıyla tutarlı olduğunu test eder
+"""
+
+import json
+import os
+import tempfile
+
+import json_codec
+from collection_writer import StreamingCollectionWriter
+from har_test_data import write_sample_har
+from har_to_postman import create_collection_from_har, har_to_postman_collection
+
+COLLECTION = {
+    "info": {"name": "Çağrı \"test\" / ünicode", "schema": "https://schema.getpostman.com/json/collection/v2.1.0/"},
+    "item": [
+        {"name": "api.example.com", "item": [
+            {"name": "001. GET users", "request": {"method": "GET", "header": [], "url": {"raw": "https://x/ ",
+                                                                                            "path": []}}},
+            {"name": "002. POST", "request": {"method": "POST", "body": {"mode": "raw", "raw": "a\n\tb\u0001"},
+                                              "time": 12.5, "ok": True, "none": None}}
+        ]}
+    ]
+}
+
+
+def _available_backends():
+    original = json_codec.BACKEND
+    backends = []
+    try:
+        for name in json_codec.BACKEND_ORDER:
+            try:
+                json_codec.set_backend(name)
+            except ImportError:
+                continue
+            backends.append(name)
+    finally:
+        json_codec.set_backend(original)
+    return backends
+
+
+def test_backends_match_stdlib():
+    """Her backend standart json ile aynı pretty / compact çıktıyı üretmeli"""
+    original = json_codec.BACKEND
+    pretty = json.dumps(COLLECTION, indent=2, ensure_ascii=False)
+    compact = json.dumps(COLLECTION, separators=(',', ':'), ensure_ascii=False)
+    try:
+        for name in _available_backends():
+            json_codec.set_backend(name)
+            assert json_codec.dumps(COLLECTION) == pretty, name
+            assert json_codec.dumps(COLLECTION, compact=True) == compact, name
+            assert json_codec.loads(pretty) == json_codec.loads(compact.encode('utf-8')) == COLLECTION
+
+            # Hızlı backend'lerin desteklemediği değerler standart json'a düşer
+            assert json_codec.loads(json_codec.dumps({"big": 2 ** 70})) == {"big": 2 ** 70}
+            # Eşsiz surrogate kaçışları (captured body'lerde görülür) okunup geri yazılabilmeli
+            lone = json_codec.loads(b'{"body": "\\ud800x"}')
+            assert lone == json.loads('{"body": "\\ud800x"}') == {"body": "\ud800x"}, name
+            assert json_codec.loads(json_codec.dumps_bytes(lone, compact=True)) == lone, name
+            try:
+                json_codec.loads('{"a": ')
+            except json.JSONDecodeError:
+                pass
+            else:
+                raise AssertionError(f"{name}: JSONDecodeError bekleniyordu")
+    finally:
+        json_codec.set_backend(original)
+
+    try:
+        json_codec.set_backend("yok")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("ValueError bekleniyordu")
+
+
+def test_compact_output():
+    """compact=True akış ve normal modda aynı tek satırlık collection'ı yazmalı"""
+    path = write_sample_har()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            expected = har_to_postman_collection(path, "Test")
+            outputs = []
+            for stream in (False, True):
+                output = os.path.join(directory, f'out_{stream}.json')
+                assert create_collection_from_har(path, output, "Test", stream=stream, compact=True)
+                with open(output, 'r', encoding='utf-8') as f:
+                    outputs.append(f.read())
+            assert '\n' not in outputs[0] and '\n' not in outputs[1]
+            assert [json.loads(text)['item'] for text in outputs] == [expected['item']] * 2
+
+            # Spill dosyaları kullanılsa da compact çıktı dumps ile aynı olmalı
+            output = os.path.join(directory, 'writer.json')
+            with StreamingCollectionWriter(output, COLLECTION['info'], buffer_limit=1, compact=True) as writer:
+                for folder in COLLECTION['item']:
+                    for item in folder['item']:
+                        writer.add(folder['name'], item)
+            with open(output, 'r', encoding='utf-8') as f:
+                assert f.read() == json_codec.dumps(COLLECTION, compact=True)
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    test_backends_match_stdlib()
+    test_compact_output()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu İşlem Test
+apply_operations'ın işlemleri tek geçişte, ayrı ayrı çalıştırmayla aynı
+sonuç ve sayılarla uyguladığını test eder
+"""
+
+import copy
+import os
+import subprocess
+import sys
+import tempfile
+
+import json_codec
+from postman_collection_editor import PostmanCollectionEditor
+from progress import ProgressReporter
+
+
+def _collection():
+    items = []
+    for i in range(30):
+        request = {"method": "GET", "header": [{"key": "X-Old", "value": f"old-{i}"}] if i % 3 else [],
+                   "url": f"https://old.example.com/items/{i}" if i % 2 else
+                   {"raw": f"https://old.example.com/items/{i}", "host": ["old", "example", "com"]},
+                   "body": {"mode": "raw", "raw": "token=old"}}
+        item = {"name": f"R{i}", "request": request}
+        if i % 4 == 0:
+            item["event"] = [{"listen": "test", "script": {"exec": ["pm.test()"]}}]
+        items.append(item)
+    return {"info": {"name": "Test"}, "item": [{"name": "a", "item": items[:10]},
+                                               {"name": "b", "item": [{"name": "c", "item": items[10:]}]}]}
+
+
+OPERATIONS = [
+    ('add_header', 'Authorization', 'Bearer X'),
+    ('remove_header', 'x-old'),
+    ('remove_scripts',),
+    ('update_url', 'https://old.example.com', 'https://new.example.com'),
+    ('replace_text', 'old', 'fresh'),
+]
+
+
+def _editor(directory: str, name: str):
+    path = os.path.join(directory, name)
+    json_codec.write_json_file(_collection(), path)
+    editor = PostmanCollectionEditor(path, progress=ProgressReporter(quiet=True))
+    assert editor.load_collection()
+    return editor
+
+
+def test_fused_matches_sequential():
+    """Tek geçiş, işlemleri sırayla ayrı ayrı çalıştırmakla aynı sonucu vermeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        sequential = _editor(directory, 'a.json')
+        expected_counts = [
+            sequential.add_header_to_all_requests('Authorization', 'Bearer X'),
+            sequential.remove_header_from_all_requests('x-old'),
+            sequential.remove_all_scripts(),
+            sequential.update_base_url('https://old.example.com', 'https://new.example.com'),
+            sequential.replace_text_in_requests('old', 'fresh'),
+        ]
+        assert expected_counts == [30, 20, 8, 30, 30]
+
+        fused = _editor(directory, 'b.json')
+        passes = []
+        original = fused.iter_requests
+        fused.iter_requests = lambda: passes.append(1) or original()
+        assert fused.apply_operations(copy.deepcopy(OPERATIONS)) == expected_counts
+        assert len(passes) == 1
+        assert fused.collection == sequential.collection
+
+        first = fused.collection["item"][0]["item"][0]["request"]
+        assert first["url"] == {"raw": "https://new.example.com/items/0", "host": ["new", "example", "com"]}
+        assert fused.find_requests(host="new.example.com", path="/items/0") == [fused.collection["item"][0]["item"][0]]
+
+        assert fused.apply_operations([]) == []
+        try:
+            fused.apply_operations([('rename_everything',)])
+        except ValueError as e:
+            assert "rename_everything" in str(e)
+        else:
+            raise AssertionError("Bilinmeyen işlem ValueError vermeli")
+
+
+def test_cli_runs_operations_in_one_pass():
+    """CLI birden fazla işlemi uygulayıp her biri için sayı yazmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'collection.json')
+        output = os.path.join(directory, 'out.json')
+        json_codec.write_json_file(_collection(), path)
+        result = subprocess.run(
+            [sys.executable, 'postman_cli.py', path, '--add-header', 'Authorization', 'Bearer X',
+             '--remove-scripts', '--update-url', 'https://old.example.com', 'https://new.example.com',
+             '--output', output],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert result.returncode == 0, result.stderr
+        assert "✅ 30 request'e header eklendi" in result.stdout
+        assert "✅ 8 request'ten scriptler kaldırıldı" in result.stdout
+        assert "✅ 30 request'te URL güncellendi" in result.stdout
+        assert "Header eklendi: R0" not in result.stdout
+        assert json_codec.read_json_file(output)["item"][0]["item"][1]["request"]["url"] == \
+            "https://new.example.com/items/1"
+
+
+if __name__ == "__main__":
+    test_fused_matches_sequential()
+    test_cli_runs_operations_in_one_pass()
+    print("✅ Tüm testler başarılı!")
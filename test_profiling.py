@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profilleme Test
+Aşama sürelerinin iç içe aşamalar düşülerek tutulduğunu, çevirme ve editör
+işlemlerinin beklenen aşamaları raporladığını test eder
+"""
+
+import os
+import pstats
+import tempfile
+import time
+
+import profiling
+from har_test_data import write_sample_har
+from har_to_postman import create_collection_from_har
+from postman_collection_editor import PostmanCollectionEditor
+
+
+def test_self_time_and_disabled_mode():
+    """İç içe aşamalar üst aşamanın süresinden düşülmeli; kapalıyken hiçbir şey ölçülmemeli"""
+    data = [1, 2, 3]
+    assert profiling.profile_iter('x', data) is data
+    with profiling.stage('x'):
+        profiling.count('x')
+
+    def slow_source():
+        for value in data:
+            time.sleep(0.01)
+            yield value
+
+    with profiling.profiling() as profiler:
+        with profiling.stage('outer'):
+            assert list(profiling.profile_iter('source', slow_source())) == data
+        profiling.count('items', 3)
+    report = profiler.report()
+
+    assert report["stages"]["source"]["calls"] == 4
+    assert report["stages"]["source"]["seconds"] >= 0.03
+    assert report["stages"]["outer"]["seconds"] < 0.01
+    assert sum(stage["seconds"] for stage in report["stages"].values()) <= report["total_seconds"]
+    assert report["counters"] == {"items": 3}
+    assert profiling._active is None
+
+
+def test_conversion_and_editor_stages():
+    """Çevirme ve editör işlemleri aşama, cProfile ve bellek bilgisini raporlamalı"""
+    path = write_sample_har()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'out.json')
+            stats_path = os.path.join(directory, 'convert.pstats')
+            for stream in (False, True):
+                with profiling.profiling(stats_path, trace_memory=True) as profiler:
+                    assert create_collection_from_har(path, output, stream=stream)
+                report = profiler.report()
+                assert {'url_parse', 'header_filter', 'convert', 'grouping', 'json_parse', 'serialize',
+                        'write'} <= set(report["stages"]), report["stages"]
+                assert report["stages"]["header_filter"]["calls"] == 2
+                assert report["counters"]["requests"] == 2
+                assert report["memory_peak_bytes"] > 0
+                assert pstats.Stats(stats_path).total_calls > 0
+                assert "⏱️  Aşama dökümü" in profiler.format_report()
+
+            with profiling.profiling() as profiler:
+                editor = PostmanCollectionEditor(output)
+                assert editor.load_collection()
+                editor.add_header_to_all_requests("X-Test", "1")
+                assert editor.save_collection()
+            assert {'editor.load_collection', 'editor.add_header_to_all_requests',
+                    'editor.save_collection'} <= set(profiler.report()["stages"])
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    test_self_time_and_disabled_mode()
+    test_conversion_and_editor_stages()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İlerleme Olayları Test
+Editör işlemlerinin konsola yazmadan olay gönderdiğini, ilerlemenin throttle
+edildiğini, mesajların toplu iletildiğini ve sessiz modu test eder
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+
+import json_codec
+from postman_collection_editor import PostmanCollectionEditor
+from progress import ConsoleRenderer, ProgressReporter
+
+
+def _write_collection(directory: str, count: int):
+    items = [{"name": f"R{i}", "request": {"method": "GET", "url": f"https://old.example.com/{i}",
+                                           "header": []},
+              "event": [{"listen": "test", "script": {"exec": ["pm.test()"]}}] if i % 2 else []}
+             for i in range(count)]
+    path = os.path.join(directory, 'collection.json')
+    json_codec.write_json_file({"info": {"name": "Test"}, "item": [{"name": "folder", "item": items}]}, path)
+    return path
+
+
+def test_editor_emits_events_without_printing():
+    """İşlemler print etmemeli; start / progress / items / finish olayları gelmeli"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_collection(directory, 50)
+        events = []
+        reporter = ProgressReporter(events.append, interval=0, batch_size=20, item_events=True)
+        editor = PostmanCollectionEditor(path, progress=reporter)
+
+        walks = []
+        original = editor.iter_requests
+        editor.iter_requests = lambda: walks.append(1) or original()
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            assert editor.load_collection()
+            assert editor.replace_text_in_requests("old.example.com", "new.example.com") == 50
+            # İlerleme toplamı için ağaç ikinci kez gezilmemeli
+            assert len(walks) == 1
+            assert editor.find_requests(host="new.example.com")
+            assert editor.remove_all_scripts() == 25
+            assert len(editor.list_all_endpoints()) == 50
+            assert editor.get_collection_info()["request_count"] == 50
+        assert stdout.getvalue() == ""
+
+        kinds = [event.kind for event in events if event.operation == 'replace_text']
+        assert kinds[0] == 'start' and kinds[-1] == 'finish'
+        assert kinds.count('progress') == 50
+        batches = [event.items for event in events if event.kind == 'items' and event.operation == 'replace_text']
+        assert [len(items) for items in batches] == [20, 20, 10]
+        finish, scripts_finish = [event for event in events if event.kind == 'finish'][:2]
+        assert finish.count == 50 and finish.total is None and finish.current == 50 and "🎉" in finish.message
+        # İndeks kurulduktan sonra toplam ondan alınır
+        assert scripts_finish.total == 50 and scripts_finish.fraction == 1.0
+
+
+def test_throttle_and_quiet():
+    """Throttle'da ilerleme olayı seyrek gelmeli; sessiz modda sadece hatalar iletilmeli"""
+    events = []
+    reporter = ProgressReporter(events.append, interval=3600)
+    reporter.start('op', 1000)
+    for _ in range(1000):
+        reporter.item("yok sayılır")
+        reporter.advance()
+    reporter.finish("bitti", 3)
+    assert [event.kind for event in events] == ['start', 'finish']
+    assert events[-1].current == 1000
+
+    events.clear()
+    quiet = ProgressReporter(events.append, quiet=True, interval=0)
+    quiet.start('op', 10)
+    quiet.advance(10)
+    quiet.info("bilgi")
+    quiet.error("hata")
+    quiet.finish("bitti")
+    assert [(event.kind, event.message) for event in events] == [('error', "hata")]
+
+
+def test_console_renderer():
+    """Konsol renderer'ı mesajları yazmalı, terminal değilse ilerleme satırı yazmamalı"""
+    out = io.StringIO()
+    reporter = ProgressReporter(ConsoleRenderer(out, verbose=True), interval=0, item_events=True)
+    reporter.start('op', 2)
+    reporter.item("✅ R1")
+    reporter.advance(2)
+    reporter.finish("🎉 Toplam 1")
+    reporter.warning("⚠️  uyarı")
+    assert out.getvalue() == "✅ R1\n🎉 Toplam 1\n⚠️  uyarı\n"
+
+
+if __name__ == "__main__":
+    test_editor_emits_events_without_printing()
+    test_throttle_and_quiet()
+    test_console_renderer()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request Index Test
+İndeksin isim / method / host / path aramalarını, toplu silmeyi ve editör
+işlemlerinden sonra güncel kaldığını test eder
+"""
+
+import os
+import tempfile
+
+import json_codec
+from postman_collection_editor import PostmanCollectionEditor
+from progress import ProgressReporter
+from request_index import RequestIndex
+
+
+def _request(name: str, method: str, url):
+    return {"name": name, "request": {"method": method, "url": url, "header": []}}
+
+
+def _collection():
+    return {"info": {"name": "Test"}, "item": [
+        {"name": "users", "item": [
+            _request("List Users", "GET", "https://API.example.com/users"),
+            _request("Create User", "POST", {"raw": "https://api.example.com/users"}),
+            {"name": "nested", "item": [_request("Delete User", "DELETE", "{{baseUrl}}/users/1")]},
+        ]},
+        _request("Health", "GET", "https://status.example.com/health"),
+        _request("list users", "GET", "https://api.example.com/v2/users"),
+    ]}
+
+
+def _editor(directory: str):
+    path = os.path.join(directory, 'collection.json')
+    json_codec.write_json_file(_collection(), path)
+    editor = PostmanCollectionEditor(path, progress=ProgressReporter(quiet=True))
+    assert editor.load_collection()
+    return editor
+
+
+def test_lookups():
+    """Aramalar ağaç sırasıyla ve normalize edilmiş anahtarlarla yapılmalı"""
+    index = RequestIndex(_collection()["item"])
+    assert len(index) == 5
+    assert [entry.id for entry in index] == [1, 2, 3, 4, 5]
+    assert [entry.item["name"] for entry in index.find_by_name("LIST USERS")] == ["List Users", "list users"]
+    assert [entry.item["name"] for entry in index.find_by_method("get")] == ["List Users", "Health", "list users"]
+    assert len(index.find_by_host("api.example.com")) == 3
+    assert [entry.path for entry in index.find_by_host("{{baseurl}}")] == ["/users/1"]
+    assert [entry.item["name"] for entry in index.find_by_path("/users")] == ["List Users", "Create User"]
+
+    # Derin iç içe folder'lar recursion limitine takılmamalı
+    deep = root = []
+    for level in range(5000):
+        folder = {"name": f"f{level}", "item": []}
+        deep.append(folder)
+        deep = folder["item"]
+    deep.append(_request("Deep", "GET", "https://deep.example.com/x"))
+    assert RequestIndex(root).find_by_name("deep")[0].parent is deep
+
+
+def test_editor_keeps_index_current():
+    """Silme ve metin değiştirme sonrası indeks collection ile aynı kalmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        editor = _editor(directory)
+        users_folder = editor.collection["item"][0]["item"]
+        assert editor.find_requests(name="list users", host="api.example.com", path="/users") == [users_folder[0]]
+
+        assert editor.remove_multiple_endpoints(["list users", "Delete User", "missing", "LIST USERS"]) == 3
+        assert [item["name"] for item in users_folder] == ["Create User", "nested"]
+        assert users_folder[1]["item"] == []
+        assert [item["name"] for item in editor.collection["item"]] == ["users", "Health"]
+        assert editor.index.get(2).item is users_folder[0]
+
+        assert editor.replace_text_in_requests("api.example.com", "api.example.org") == 1
+        assert editor.find_requests(host="api.example.com") == []
+        assert editor.find_requests(host="api.example.org") == [users_folder[0]]
+
+        assert editor.remove_endpoints_by_method("post") == 1
+        assert editor.remove_endpoint_by_name("health") == 1
+        assert len(editor.index) == 0
+        assert len(editor.list_all_endpoints()) == 0
+
+        editor.collection["item"].append(_request("Added", "GET", "https://x.example.com/"))
+        editor.invalidate_index()
+        assert [item["name"] for item in editor.find_requests(method="GET")] == ["Added"]
+
+
+if __name__ == "__main__":
+    test_lookups()
+    test_editor_keeps_index_current()
+    print("✅ Tüm testler başarılı!")
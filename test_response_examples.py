@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Response Örnekleri Test
+HAR response'larının body bütçesiyle Postman örneklerine çevrilmesini test eder
+"""
+
+import base64
+import contextlib
+import io
+import json
+
+from har_to_postman import postman_request_pipeline, print_response_summary
+from response_examples import HAR_RESPONSE_KEY, ResponseExampleBuilder, decode_base64_text
+
+
+def _entry(path, text, encoding=None, mime_type='application/json'):
+    content = {"size": len(text), "mimeType": mime_type, "text": text}
+    if encoding:
+        content["encoding"] = encoding
+    return {
+        "request": {"method": "GET", "url": f"https://api.example.com/{path}", "headers": []},
+        "response": {
+            "status": 200,
+            "statusText": "OK",
+            "headers": [{"name": "Content-Type", "value": mime_type},
+                        {"name": "Content-Encoding", "value": "gzip"}],
+            "content": content
+        }
+    }
+
+
+def test_base64_decoding_in_chunks():
+    """Parçalı decode çok byte'lı karakterleri bölmemeli, sınırı ve binary içeriği reddetmeli"""
+    text = "ğüşıöç " * 50000
+    encoded = base64.b64encode(text.encode('utf-8')).decode('ascii')
+    assert decode_base64_text(encoded, len(text.encode('utf-8'))) == text
+    assert decode_base64_text(encoded, 1024) is None
+    assert decode_base64_text(base64.b64encode(b'\x89PNG\r\n\xff\xfe').decode('ascii'), 1024) is None
+
+
+def test_response_examples_with_budget():
+    """Örnekler eklenmeli, bütçeyi aşan body'ler decode edilmeden atlanmalı"""
+    body = json.dumps({"ad": "Çağrı", "liste": list(range(10))}, ensure_ascii=False)
+    encoded = base64.b64encode(body.encode('utf-8')).decode('ascii')
+    entries = [
+        _entry("a", body),
+        _entry("b", encoded, encoding="base64"),
+        _entry("c", encoded, encoding="base64"),
+        _entry("big", "x" * 5000, mime_type="text/plain"),
+    ]
+    builder = ResponseExampleBuilder(max_body_size=4096, budget=4096)
+    requests = [item for _, item in postman_request_pipeline(entries, response_builder=builder)]
+
+    examples = [item["response"][0] for item in requests]
+    assert [example["body"] for example in examples] == [body, body, body, ""]
+    assert examples[0]["code"] == 200 and examples[0]["name"] == "200 OK"
+    assert examples[0]["_postman_previewlanguage"] == "json"
+    assert examples[0]["header"] == [{"key": "Content-Type", "value": "application/json"}]
+    assert examples[0]["originalRequest"]["url"]["path"] == ["a"]
+    assert all(HAR_RESPONSE_KEY not in item for item in requests)
+    assert builder.example_count == 4 and builder.omitted_bodies == 1
+    # Aynı base64 body bir kez decode edilip cache'ten paylaşılır; düz metin cache'lenmez
+    assert examples[1]["body"] is examples[2]["body"]
+    assert len(builder._bodies) == 1
+    assert examples[0]["body"] is entries[0]["response"]["content"]["text"]
+
+
+def test_binary_bodies_counted_separately():
+    """Metne çevrilemeyen base64 body boyut sınırından ayrı sayılmalı ve bütçeden düşmemeli"""
+    png = base64.b64encode(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\xff\xfe').decode('ascii')
+    entries = [
+        _entry("logo.png", png, encoding="base64", mime_type="image/png"),
+        _entry("icon.png", png, encoding="base64", mime_type="image/png"),
+        _entry("big", "x" * 5000, mime_type="text/plain"),
+        _entry("a", "{}"),
+    ]
+    builder = ResponseExampleBuilder(max_body_size=4096, budget=4096)
+    requests = [item for _, item in postman_request_pipeline(entries, response_builder=builder)]
+
+    assert [item["response"][0]["body"] for item in requests] == ["", "", "", "{}"]
+    assert builder.binary_bodies == 2 and builder.omitted_bodies == 1
+    assert builder.used_bytes == 2
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        print_response_summary(builder)
+    assert "1 örneğin body'si boyut sınırı nedeniyle eklenmedi" in output.getvalue()
+    assert "2 örneğin body'si metin olmadığı (binary) için eklenmedi" in output.getvalue()
+
+
+if __name__ == "__main__":
+    test_base64_decoding_in_chunks()
+    test_response_examples_with_budget()
+    test_binary_bodies_counted_separately()
+    print("✅ Tüm testler başarılı!")
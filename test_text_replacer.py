@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çoklu Metin Değiştirme Test
+Birleşik regex ile değiştirmenin en uzun eşleşmeyi seçtiğini, zincirleme
+değiştirme yapmadığını, eşleme dosyalarını okuduğunu ve editör işlemini
+test eder
+"""
+
+import gzip
+import os
+import tempfile
+
+import json_codec
+from postman_collection_editor import PostmanCollectionEditor
+from progress import ProgressReporter
+from text_replacer import MultiReplacer, load_mapping
+
+
+def test_multi_replacer():
+    """Aynı konumda en uzun anahtar seçilmeli, değiştirmeler aynı anda yapılmalı"""
+    replacer = MultiReplacer({"api.example.com": "api.example.org", "api": "API", "a.b": "x", "b": "c"})
+    assert replacer.subn("https://api.example.com/api") == ("https://api.example.org/API", 2)
+    assert replacer.replace("a.b b aXb") == "x c aXc"
+    assert MultiReplacer({}).subn("metin") == ("metin", 0)
+    try:
+        MultiReplacer({"": "x"})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Boş anahtar ValueError vermeli")
+
+
+def test_load_mapping():
+    """JSON (sıkıştırılmış da olabilir) ve TAB ayrılmış metin dosyaları okunmalı"""
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'map.json.gz')
+        json_codec.write_json_file({"old": "new"}, json_path)
+        assert load_mapping(json_path) == {"old": "new"}
+
+        text_path = os.path.join(directory, 'map.tsv')
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write("# host rotasyonu\nold.example.com\tnew.example.com\n\nTOKEN_A\tTOKEN B\t2\n")
+        assert load_mapping(text_path) == {"old.example.com": "new.example.com", "TOKEN_A": "TOKEN B\t2"}
+
+        bad_path = os.path.join(directory, 'bad.txt.gz')
+        with gzip.open(bad_path, 'wt', encoding='utf-8') as f:
+            f.write("ayraç yok\n")
+        try:
+            load_mapping(bad_path)
+        except ValueError as e:
+            assert "bad.txt.gz:1" in str(e)
+        else:
+            raise AssertionError("Hatalı satır ValueError vermeli")
+
+
+def test_editor_replace_many():
+    """Tüm alanlar tek geçişte değişmeli; indeks yeni host'u bilmeli"""
+    collection = {"info": {"name": "Test"}, "item": [
+        {"name": "A", "request": {"method": "GET", "url": {"raw": "https://h1.example.com/a"},
+                                  "header": [{"key": "Authorization", "value": "Bearer T1"},
+                                             {"key": "X-Retry", "value": 3}],
+                                  "body": {"mode": "raw", "raw": "{\"host\": \"h2.example.com\"}"}}},
+        {"name": "B", "request": {"method": "GET", "url": "https://other.example.com/", "header": []}},
+    ]}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'collection.json')
+        json_codec.write_json_file(collection, path)
+        editor = PostmanCollectionEditor(path, progress=ProgressReporter(quiet=True))
+        assert editor.load_collection()
+        assert len(editor.find_requests(host="h1.example.com")) == 1
+
+        mapping = {"h1.example.com": "h9.example.com", "h2.example.com": "h8.example.com", "T1": "T2"}
+        assert editor.replace_many_in_requests(mapping) == 1
+        request = editor.collection["item"][0]["request"]
+        assert request["url"]["raw"] == "https://h9.example.com/a"
+        assert [header["value"] for header in request["header"]] == ["Bearer T2", 3]
+        assert request["body"]["raw"] == "{\"host\": \"h8.example.com\"}"
+        assert editor.find_requests(host="h1.example.com") == []
+        assert len(editor.find_requests(host="h9.example.com")) == 1
+
+
+if __name__ == "__main__":
+    test_multi_replacer()
+    test_load_mapping()
+    test_editor_replace_many()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL Cache Test
+URL'lerin bir kez parse edildiğini ve query parametrelerinin tekrar etmediğini test eder
+"""
+
+from har_to_postman import convert_har_request_to_postman
+from url_cache import canonical_url
+
+
+def test_query_params_are_not_duplicated():
+    """URL ve HAR queryString'deki aynı parametreler bir kez yazılmalı"""
+    har_request = {
+        "method": "GET",
+        "url": "https://api.example.com/search?q=a%20b&tag=x&tag=y&empty=",
+        "headers": [],
+        "queryString": [
+            {"name": "q", "value": "a%20b"},
+            {"name": "tag", "value": "x"},
+            {"name": "tag", "value": "y"},
+            {"name": "empty", "value": ""},
+            {"name": "extra", "value": "1"},
+        ]
+    }
+    url = convert_har_request_to_postman(har_request, 1)['request']['url']
+    assert url['query'] == [
+        {"key": "q", "value": "a b"},
+        {"key": "tag", "value": "x"},
+        {"key": "tag", "value": "y"},
+        {"key": "empty", "value": ""},
+        {"key": "extra", "value": "1"},
+    ]
+    assert url['host'] == ['api', 'example', 'com']
+    assert url['path'] == ['search']
+
+
+def test_repeated_urls_hit_cache():
+    """Aynı URL ikinci kez parse edilmemeli"""
+    url = "https://poll.example.com/v1/status?since=1"
+    canonical_url(url)
+    hits = canonical_url.cache_info().hits
+    for index in range(3):
+        convert_har_request_to_postman({"method": "GET", "url": url}, index)
+    assert canonical_url.cache_info().hits == hits + 3
+
+
+if __name__ == "__main__":
+    test_query_params_are_not_duplicated()
+    test_repeated_urls_hit_cache()
+    print("✅ Tüm testler başarılı!")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çoklu Metin Değiştirme
+Birden fazla eski -> yeni metin çiftini tek bir birleşik regex ile, her
+metin üzerinde tek geçişte uygular. Eşleşmeler soldan sağa, aynı konumda en
+uzun anahtar önce olacak şekilde bulunur ve değiştirmeler aynı anda yapılır:
+{'a': 'b', 'b': 'c'} ile 'ab' -> 'bc' olur (zincirleme değiştirme yok).
+
+Eşleme dosyası JSON nesnesi ({"eski": "yeni", ...}) ya da her satırda
+TAB ile ayrılmış 'eski<TAB>yeni' çiftleri olabilir; boş satırlar ve # ile
+başlayan satırlar atlanır. Dosya gzip / zstd ile sıkıştırılmış olabilir.
+"""
+
+import re
+from typing import Dict
+
+import json_codec
+from compressed_io import open_text, strip_compression_suffix
+
+
+def load_mapping(path: str) -> Dict[str, str]:
+    """Eşleme dosyasını okur
+
+    Raises:
+        ValueError: Dosya biçimi hatalıysa ya da boş anahtar varsa
+    """
+    if strip_compression_suffix(path).lower().endswith('.json'):
+        mapping = json_codec.read_json_file(path)
+        if not isinstance(mapping, dict) or not all(isinstance(value, str) for value in mapping.values()):
+            raise ValueError(f"Eşleme dosyası string -> string bir JSON nesnesi olmalı: {path}")
+    else:
+        mapping = {}
+        with open_text(path, encoding='utf-8-sig') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.rstrip('\r\n')
+                if not line.strip() or line.lstrip().startswith('#'):
+                    continue
+                old, separator, new = line.partition('\t')
+                if not separator:
+                    raise ValueError(f"{path}:{line_number}: 'eski<TAB>yeni' biçiminde olmalı")
+                mapping[old] = new
+    if '' in mapping:
+        raise ValueError(f"Eşleme dosyasında boş anahtar olamaz: {path}")
+    return mapping
+
+
+class MultiReplacer:
+    """Eşlemedeki tüm anahtarları tek regex'te birleştirip tek geçişte değiştirir"""
+
+    def __init__(self, mapping: Dict[str, str]):
+        if '' in mapping:
+            raise ValueError("Boş metin değiştirilemez")
+        self.mapping = dict(mapping)
+        # Aynı konumda uzun anahtar kısa olana tercih edilsin
+        keys = sorted(self.mapping, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(map(re.escape, keys))) if keys else None
+        self._lookup = self.mapping.__getitem__
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def _replacement(self, match):
+        return self._lookup(match.group())
+
+    def subn(self, text: str):
+        """(yeni_metin, değiştirme_sayısı) döndürür"""
+        if self.pattern is None:
+            return text, 0
+        return self.pattern.subn(self._replacement, text)
+
+    def replace(self, text: str) -> str:
+        return self.subn(text)[0]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL Canonicalization Cache
+HAR URL'lerini bir kez parse edip bileşenlerini sınırlı bir LRU cache'te
+tutar. Domain gruplama, çevirme ve path şablonlama aynı sonucu paylaşır;
+polling ağırlıklı HAR'larda tekrar eden URL'ler tek bir dict erişimine
+mal olur.
+"""
+
+from collections import Counter, namedtuple
+from functools import lru_cache
+from urllib.parse import parse_qs, unquote_plus, urlparse
+
+URL_CACHE_SIZE = 65536
+
+CanonicalUrl = namedtuple('CanonicalUrl', [
+    'scheme', 'netloc', 'path', 'query', 'host_parts', 'path_segments', 'query_params'
+])
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def canonical_url(url: str) -> CanonicalUrl:
+    """URL'yi parse eder; sonuç değiştirilemez olduğu için cache'ten paylaşılabilir"""
+    parsed_url = urlparse(url)
+    query_params = ()
+    if parsed_url.query:
+        query_params = tuple(
+            (key, value)
+            for key, values in parse_qs(parsed_url.query, keep_blank_values=True).items()
+            for value in values
+        )
+    return CanonicalUrl(
+        scheme=parsed_url.scheme,
+        netloc=parsed_url.netloc,
+        path=parsed_url.path,
+        query=parsed_url.query,
+        host_parts=tuple(parsed_url.netloc.split('.')) if parsed_url.netloc else (),
+        path_segments=tuple(p for p in parsed_url.path.split('/') if p),
+        query_params=query_params
+    )
+
+
+def merge_query_params(url_params, har_query_string=None):
+    """URL'deki ve HAR queryString'deki parametreleri tekrar etmeden birleştirir
+
+    Önce URL'deki parametreler sırasıyla alınır; HAR queryString'den sadece
+    URL'de karşılığı olmayanlar eklenir. HAR'daki değerler encode edilmiş
+    olabileceğinden decode edilmiş halleriyle de karşılaştırılır.
+    """
+    params = [{"key": key, "value": value} for key, value in url_params]
+    if not har_query_string:
+        return params
+
+    remaining = Counter(url_params)
+    for param in har_query_string:
+        name = param.get('name', '')
+        value = param.get('value', '')
+        for pair in ((name, value), (unquote_plus(name), unquote_plus(value))):
+            if remaining[pair] > 0:
+                remaining[pair] -= 1
+                break
+        else:
+            params.append({"key": name, "value": value})
+    return params
@@ -4,7 +4,7 @@
 Postman Collection Düzenleyici - Kullanım Örnekleri
 """
 
-from postman_collection_editor import PostmanCollectionEditor
+from postman_collection_editor import PostmanCollectionEditor, print_endpoints
 
 def örnek_kullanım():
     """Temel kullanım örnekleri"""
@@ -29,6 +29,7 @@ def örnek_kullanım():
     # 3. Tüm endpoint'leri listele
     print("\n3️⃣ Endpoint'ler listeleniyor...")
     endpoints = editor.list_all_endpoints()
+    print_endpoints(endpoints)
     
     # 4. Authorization header ekle
     print("\n4️⃣ Authorization header ekleniyor...")